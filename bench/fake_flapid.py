@@ -0,0 +1,1069 @@
+import os
+import sys
+import json
+import time
+import base64
+import random
+import hashlib
+import asyncio
+import argparse
+import threading
+
+# Stand-in for flapid, the FilmLight API server, for benchmarking the robot
+# without a Baselight host.
+#
+# Speaks the flapi JSON-RPC protocol over a plain Python websocket server and
+# implements the subset of the API the robot uses (Scene, Shot, Mark,
+# JobManager, QueueManager, Export, ThumbnailManager, Utilities) on top of an
+# in-memory job database of synthetic scenes:
+#
+#   <host>:job01:seq01:seq01_v001 ... job<jobs>:seq<sequences>:seq<nn>_v<versions>
+#
+# Every scene has --shots shots with generated metadata, marks and
+# categories. Scenes are shared by all connections, so changes made and saved
+# by one connection are seen by the next.
+#
+# Latency is simulated in two parts:
+#
+#   --latency       delay before each reply is sent, in ms. Replies to
+#                   requests sent back to back overlap, like network latency.
+#   --service-time  time to process each request, in ms. Requests on one
+#                   connection are processed one after another.
+#
+# Usage:
+#
+#   python bench/fake_flapid.py --port 1984 --shots 10000 --latency 2
+#
+# or from a benchmark script:
+#
+#   server = FakeFlapid(shots=10000, latency=0.002)
+#   port = server.start()       # serves from a background thread
+#   ...
+#   server.stop()
+#
+# Point config/flapi_hosts.json "flapi_hostname" at the server host; any
+# user and token are accepted unless --token is given.
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xa
+
+MARK_CATEGORIES = ['Cut', 'Comment', 'Review', 'VFX', 'Grade']
+STRIP_CATEGORIES = ['Approved', 'Pending', 'Rework', 'Locked']
+
+BUILTIN_METADATA = [
+    # key, name, type, number of elements
+    ('clip', 'Clip Name', 'String', 1),
+    ('tape', 'Tape Name', 'String', 1),
+    ('scene', 'Scene', 'String', 1),
+    ('take', 'Take', 'String', 1),
+    ('camera', 'Camera', 'String', 1),
+    ('comment', 'Comment', 'String', 1),
+    ('srctc', 'Source Timecode', 'Timecode', 2),
+    ('rectc', 'Record Timecode', 'Timecode', 2),
+]
+
+
+class FlapidError(Exception):
+    pass
+
+
+def timecode(frame, fps=24):
+    return {
+        '_type': 'timecode',
+        'h': frame // (fps * 3600) % 24,
+        'm': frame // (fps * 60) % 60,
+        's': frame // fps % 60,
+        'f': frame % fps,
+        'phase': 0,
+        'fps': fps,
+        'wrap': 24
+    }
+
+
+def format_date(t):
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(t))
+
+
+def set_keys(value):
+    # flapi encodes sets as {"_type": "set", key: 1, ...}
+    if isinstance(value, dict):
+        return [k for k in value.keys() if k != '_type']
+    if value is None:
+        return []
+    return list(value)
+
+
+def encode_set(values):
+    result = {'_type': 'set'}
+    for value in values:
+        result[value] = 1
+    return result
+
+
+class SceneModel(object):
+    def __init__(self, server, job, folder, name, seed):
+        self.server = server
+        self.job = job
+        self.folder = folder
+        self.name = name
+        self.seed = seed
+        self.shots = None
+        self.shot_order = None
+        self.mddefns = [
+            {
+                '_type': 'MetadataItem',
+                'Key': key,
+                'Name': name,
+                'Type': md_type,
+                'NumElements': num,
+                'IsReadOnly': 0,
+                'IsUserDefined': 0,
+                'Properties': {}
+            } for key, name, md_type, num in BUILTIN_METADATA
+        ]
+        self.next_user_key = 1
+        self.next_mark_id = 1
+        created = server.started - 86400 * (seed % 30 + 1)
+        self.created = created
+        self.modified = created + seed % 3600
+        self.stats = {'opened': 0, 'saved': 0, 'deltas': 0, 'cancelled': 0}
+
+    def path(self):
+        return self.folder + ':' + self.name
+
+    # shots are generated on first open, from a per-scene seed, so that the
+    # same scene always has the same content
+    def load(self):
+        if self.shots is not None:
+            return
+        rnd = random.Random(self.seed)
+        self.shots = {}
+        self.shot_order = []
+        frame = 0
+        record_start = 86400 * 24
+        for ix in range(self.server.nshots):
+            shot_id = 1000 + ix * 3 + rnd.randint(0, 2)
+            length = rnd.randint(24, 240)
+            src_start = rnd.randint(0, 200000)
+            reel = rnd.randint(1, 40)
+            shot = {
+                'id': shot_id,
+                'start': float(frame),
+                'end': float(frame + length),
+                'poster': float(frame + length // 2),
+                'src_start': src_start,
+                'md': {
+                    'clip': 'A%03dC%03d_%06d' % (reel, rnd.randint(1, 300), src_start),
+                    'tape': 'A%03d' % reel,
+                    'scene': str(rnd.randint(1, 120)),
+                    'take': str(rnd.randint(1, 12)),
+                    'camera': rnd.choice(['A', 'B', 'C']),
+                    'comment': '',
+                    'srctc': [timecode(src_start), timecode(src_start + length)],
+                    'rectc': [timecode(record_start + frame), timecode(record_start + frame + length)]
+                },
+                'marks': {},
+                'categories': set(rnd.sample(STRIP_CATEGORIES, rnd.randint(0, 2)))
+            }
+            for m in range(rnd.randint(0, 3)):
+                self.add_mark(
+                    shot,
+                    frame + rnd.randint(0, length - 1),
+                    rnd.choice(MARK_CATEGORIES),
+                    'note %d' % m
+                )
+            self.shots[shot_id] = shot
+            self.shot_order.append(shot_id)
+            frame += length
+
+    def add_mark(self, shot, record_frame, category, note):
+        mark_id = self.next_mark_id
+        self.next_mark_id += 1
+        shot['marks'][mark_id] = {
+            'id': mark_id,
+            'frame': int(record_frame),
+            'category': category,
+            'note': note or ''
+        }
+        return mark_id
+
+    def get_shot(self, shot_id):
+        shot = self.shots.get(shot_id)
+        if shot is None:
+            raise FlapidError('Invalid shot ID %s' % shot_id)
+        return shot
+
+    def info(self):
+        return {
+            '_type': 'SceneInfo',
+            'CreatedDate': format_date(self.created),
+            'CreatedBy': 'filmlight@%s' % self.server.hostname,
+            'CreatedVersion': self.server.version,
+            'OpenedDate': format_date(self.created),
+            'OpenedBy': 'filmlight@%s' % self.server.hostname,
+            'OpenedVersion': self.server.version,
+            'ModifiedDate': format_date(self.modified),
+            'ModifiedBy': 'filmlight@%s' % self.server.hostname,
+            'ModifiedVersion': self.server.version,
+            'WorkingFormat': 'HD 1920x1080',
+            'Notes': '',
+            'LastEDL': ''
+        }
+
+
+# Open scene, one per Scene.open_scene() call
+
+class OpenScene(object):
+    def __init__(self, model, read_only):
+        self.model = model
+        self.read_only = read_only
+        self.closed = False
+        # undo log of the delta in progress, or None
+        self.undo = None
+
+    def modify(self, undo):
+        if self.closed:
+            raise FlapidError('Scene is closed')
+        if self.read_only:
+            raise FlapidError('Scene is open read-only')
+        if self.undo is None:
+            raise FlapidError('Scene modification outside of a delta')
+        self.undo.append(undo)
+
+
+class Handle(object):
+    def __init__(self, kind, value):
+        self.kind = kind
+        self.value = value
+
+
+class Session(object):
+    def __init__(self, server, writer):
+        self.server = server
+        self.writer = writer
+        self.authenticated = False
+        self.objects = {}
+        self.signals = set()
+        self.outgoing = asyncio.Queue()
+        self.last_due = 0.0
+
+    def handle(self, kind, value):
+        obj_id = self.server.new_object_id()
+        self.objects[obj_id] = Handle(kind, value)
+        return {'_handle': kind, '_id': obj_id}
+
+    def lookup(self, target, kind):
+        obj = self.objects.get(target)
+        if obj is None:
+            raise FlapidError('Invalid object id %s' % target)
+        if obj.kind != kind:
+            raise FlapidError('Object %s is a %s, not a %s' % (target, obj.kind, kind))
+        return obj.value
+
+    def resolve_handle(self, value, kind):
+        if not isinstance(value, dict) or value.get('_id') is None:
+            raise FlapidError('Expected %s object' % kind)
+        return self.lookup(value.get('_id'), kind)
+
+    # Messages
+
+    def process(self, text):
+        try:
+            msg = json.loads(text)
+        except ValueError:
+            return None
+        msgid = msg.get('id')
+        method = msg.get('method')
+        self.server.stats['requests'] += 1
+        try:
+            result = self.dispatch(method, msg)
+            reply = {'jsonrpc': '2.0', 'result': result, 'id': msgid}
+        except FlapidError as e:
+            self.server.stats['errors'] += 1
+            reply = {'jsonrpc': '2.0', 'error': {'code': 1, 'message': str(e)}, 'id': msgid}
+        except Exception as e:
+            self.server.stats['errors'] += 1
+            reply = {'jsonrpc': '2.0', 'error': {'code': 2, 'message': 'Internal error: %s' % e}, 'id': msgid}
+        if msgid is None:
+            return None
+        return reply
+
+    def dispatch(self, method, msg):
+        target = msg.get('target')
+        params = msg.get('params') or {}
+
+        if method == 'connect':
+            token = self.server.token
+            if token is not None and msg.get('token') != token:
+                raise FlapidError('Authentication failed')
+            self.authenticated = True
+            return 1
+        if not self.authenticated:
+            raise FlapidError('Not authenticated')
+
+        if method == 'forget':
+            self.objects.pop(target, None)
+            return None
+        if method == 'connect_signal':
+            self.signals.add((target, params.get('signal')))
+            return None
+        if method == 'disconnect_signal':
+            self.signals.discard((target, params.get('signal')))
+            return None
+        if method == 'signal_result':
+            return None
+
+        if not method or '.' not in method:
+            raise FlapidError('Unknown method %s' % method)
+        cls, name = method.split('.', 1)
+        fn = getattr(self, 'm_%s_%s' % (cls, name), None)
+        if fn is None:
+            raise FlapidError('Unknown method %s' % method)
+        if target is None:
+            return fn(None, params)
+        return fn(self.lookup(target, cls), params)
+
+    def send_reply(self, reply):
+        data = json.dumps(reply)
+        due = max(time.time() + self.server.latency, self.last_due)
+        self.last_due = due
+        self.outgoing.put_nowait((due, data))
+
+    def emit_signal(self, target, signal, args):
+        if (target, signal) not in self.signals:
+            return
+        self.send_reply({
+            'jsonrpc': '2.0',
+            'method': 'signal',
+            'target': target,
+            'params': {'signal': signal, 'args': args}
+        })
+
+    async def writer_loop(self):
+        while True:
+            due, data = await self.outgoing.get()
+            wait = due - time.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            write_frame(self.writer, OP_TEXT, data.encode('utf-8'))
+            await self.writer.drain()
+
+    async def run(self, reader):
+        writer_task = asyncio.ensure_future(self.writer_loop())
+        try:
+            while True:
+                opcode, payload = await read_message(reader, self.writer)
+                if opcode is None or opcode == OP_CLOSE:
+                    break
+                if self.server.service_time:
+                    await asyncio.sleep(self.server.service_time)
+                reply = self.process(payload.decode('utf-8'))
+                if reply is not None:
+                    self.send_reply(reply)
+        finally:
+            # let queued replies go out before closing
+            while not self.outgoing.empty() and not writer_task.done():
+                await asyncio.sleep(0.001)
+            writer_task.cancel()
+
+    # Scene
+
+    def scene_model(self, path):
+        if isinstance(path, dict):
+            host, job, scene = path.get('Host'), path.get('Job'), path.get('Scene')
+        else:
+            host, job, scene = self.server.split_path(path)
+        model = self.server.find_scene(job, scene)
+        if model is None:
+            raise FlapidError('Scene %s:%s:%s does not exist' % (host, job, scene))
+        return model
+
+    def m_Scene_parse_path(self, obj, params):
+        host, job, scene = self.server.split_path(params.get('str'))
+        return {
+            '_type': 'ScenePath',
+            'Type': 'psql',
+            'Host': host,
+            'Job': job,
+            'Scene': scene,
+            'Tag': None,
+            'Filename': None
+        }
+
+    def m_Scene_open_scene(self, obj, params):
+        model = self.scene_model(params.get('scenepath'))
+        flags = set_keys(params.get('flags'))
+        model.load()
+        model.stats['opened'] += 1
+        return self.handle('Scene', OpenScene(model, 'readonly' in flags))
+
+    def m_Scene_get_scene_pathname(self, scene, params):
+        return '%s:%s:%s' % (self.server.hostname, scene.model.job, scene.model.path())
+
+    def m_Scene_close_scene(self, scene, params):
+        scene.closed = True
+        return 1
+
+    def m_Scene_get_num_shots(self, scene, params):
+        return len(scene.model.shot_order)
+
+    def m_Scene_get_shot_ids(self, scene, params):
+        order = scene.model.shot_order
+        first = params.get('firstIndex') or 0
+        last = params.get('lastIndex')
+        if last is None or last < 0 or last >= len(order):
+            last = len(order) - 1
+        result = []
+        for shot_id in order[first:last + 1]:
+            shot = scene.model.shots[shot_id]
+            result.append({
+                '_type': 'ShotInfo',
+                'ShotId': shot_id,
+                'StartFrame': shot['start'],
+                'EndFrame': shot['end'],
+                'PosterFrame': shot['poster']
+            })
+        return result
+
+    def m_Scene_get_shot(self, scene, params):
+        shot = scene.model.get_shot(params.get('shot_id'))
+        return self.handle('Shot', (scene, shot))
+
+    def m_Scene_get_metadata_definitions(self, scene, params):
+        return list(scene.model.mddefns)
+
+    def m_Scene_add_metadata_defn(self, scene, params):
+        model = scene.model
+        defn = {
+            '_type': 'MetadataItem',
+            'Key': 'u%04d' % model.next_user_key,
+            'Name': params.get('name'),
+            'Type': params.get('type'),
+            'NumElements': 1,
+            'IsReadOnly': 0,
+            'IsUserDefined': 1,
+            'Properties': {}
+        }
+        scene.modify(lambda: model.mddefns.remove(defn))
+        model.next_user_key += 1
+        model.mddefns.append(defn)
+        return defn
+
+    def m_Scene_get_mark_categories(self, scene, params):
+        return list(MARK_CATEGORIES)
+
+    def m_Scene_get_strip_categories(self, scene, params):
+        return list(STRIP_CATEGORIES)
+
+    def m_Scene_start_delta(self, scene, params):
+        if scene.undo is not None:
+            raise FlapidError('Delta already in progress')
+        if scene.read_only:
+            raise FlapidError('Scene is open read-only')
+        scene.undo = []
+        return None
+
+    def m_Scene_end_delta(self, scene, params):
+        if scene.undo is None:
+            raise FlapidError('No delta in progress')
+        if scene.undo:
+            scene.model.stats['deltas'] += 1
+        scene.undo = None
+        return None
+
+    def m_Scene_cancel_delta(self, scene, params):
+        if scene.undo is None:
+            raise FlapidError('No delta in progress')
+        for undo in reversed(scene.undo):
+            undo()
+        scene.model.stats['cancelled'] += 1
+        scene.undo = None
+        return None
+
+    def m_Scene_save_scene(self, scene, params):
+        if scene.read_only:
+            raise FlapidError('Scene is open read-only')
+        scene.model.modified = time.time()
+        scene.model.stats['saved'] += 1
+        return None
+
+    # Shot
+
+    def m_Shot_get_id(self, shot, params):
+        return shot[1]['id']
+
+    def m_Shot_get_start_frame(self, shot, params):
+        return shot[1]['start']
+
+    def m_Shot_get_end_frame(self, shot, params):
+        return shot[1]['end']
+
+    def m_Shot_get_src_start_frame(self, shot, params):
+        return shot[1]['src_start']
+
+    def m_Shot_get_metadata(self, shot, params):
+        md = shot[1]['md']
+        return {key: md.get(key) for key in set_keys(params.get('md_keys'))}
+
+    def m_Shot_get_metadata_strings(self, shot, params):
+        result = {}
+        for key, value in self.m_Shot_get_metadata(shot, params).items():
+            if isinstance(value, list):
+                value = ' '.join(self.value_string(x) for x in value)
+            result[key] = self.value_string(value)
+        return result
+
+    def value_string(self, value):
+        if isinstance(value, dict) and value.get('_type') == 'timecode':
+            return '%02d:%02d:%02d:%02d' % (value['h'], value['m'], value['s'], value['f'])
+        if value is None:
+            return ''
+        return str(value)
+
+    def m_Shot_set_metadata(self, shot, params):
+        scene, data = shot
+        md = data['md']
+        metadata = params.get('metadata') or {}
+        known = set(x['Key'] for x in scene.model.mddefns)
+        for key in metadata.keys():
+            if key not in known:
+                raise FlapidError('Unknown metadata key %s' % key)
+        previous = {key: md.get(key) for key in metadata.keys()}
+        scene.modify(lambda: md.update(previous))
+        md.update(metadata)
+        return None
+
+    def m_Shot_get_categories(self, shot, params):
+        return encode_set(shot[1]['categories'])
+
+    def m_Shot_get_mark_ids(self, shot, params):
+        marks = shot[1]['marks']
+        mark_ids = sorted(marks.keys())
+        offset = params.get('offset') or 0
+        count = params.get('count')
+        if count is None or count < 0:
+            return mark_ids[offset:]
+        return mark_ids[offset:offset + count]
+
+    def m_Shot_get_mark(self, shot, params):
+        mark = shot[1]['marks'].get(params.get('id'))
+        if mark is None:
+            raise FlapidError('Invalid mark ID %s' % params.get('id'))
+        return self.handle('Mark', (shot, mark))
+
+    def m_Shot_add_mark(self, shot, params):
+        scene, data = shot
+        if params.get('category') not in MARK_CATEGORIES:
+            raise FlapidError('Invalid mark category %s' % params.get('category'))
+        if params.get('frame') is None:
+            raise FlapidError('No frame given for mark')
+        mark_id = scene.model.next_mark_id
+        scene.modify(lambda: data['marks'].pop(mark_id, None))
+        # Shot.add_mark takes a source frame
+        record_frame = int(data['start']) + int(params.get('frame')) - data['src_start']
+        return scene.model.add_mark(data, record_frame, params.get('category'), params.get('note'))
+
+    def m_Shot_delete_mark(self, shot, params):
+        scene, data = shot
+        mark_id = params.get('id')
+        mark = data['marks'].get(mark_id)
+        if mark is None:
+            raise FlapidError('Invalid mark ID %s' % mark_id)
+        scene.modify(lambda: data['marks'].__setitem__(mark_id, mark))
+        del data['marks'][mark_id]
+        return None
+
+    def m_Shot_get_sequence_descriptor(self, shot, params):
+        return self.handle('SequenceDescriptor', shot)
+
+    def m_SequenceDescriptor_get_name(self, shot, params):
+        return '%s.[%07d-%07d].dpx' % (shot[1]['md']['clip'], shot[1]['src_start'], shot[1]['src_start'] + int(shot[1]['end'] - shot[1]['start']) - 1)
+
+    # Mark
+
+    def m_Mark_get_id(self, mark, params):
+        return mark[1]['id']
+
+    def m_Mark_get_type(self, mark, params):
+        return 'Shot'
+
+    def m_Mark_get_category(self, mark, params):
+        return mark[1]['category']
+
+    def m_Mark_get_note_text(self, mark, params):
+        return mark[1]['note']
+
+    def m_Mark_get_record_frame(self, mark, params):
+        return mark[1]['frame']
+
+    def m_Mark_get_position(self, mark, params):
+        return float(mark[1]['frame'])
+
+    def m_Mark_get_source_frame(self, mark, params):
+        shot = mark[0][1]
+        return shot['src_start'] + mark[1]['frame'] - int(shot['start'])
+
+    # JobManager
+
+    def m_JobManager_get_jobs(self, obj, params):
+        return sorted(self.server.jobs.keys())
+
+    def m_JobManager_get_folders(self, obj, params):
+        job = self.server.jobs.get(params.get('job'))
+        if job is None:
+            raise FlapidError('Job %s does not exist' % params.get('job'))
+        if params.get('folder'):
+            return []
+        return sorted(job.keys())
+
+    def m_JobManager_get_scenes(self, obj, params):
+        job = self.server.jobs.get(params.get('job'))
+        if job is None:
+            raise FlapidError('Job %s does not exist' % params.get('job'))
+        folder = job.get(params.get('folder') or '')
+        if folder is None:
+            return []
+        return sorted(folder.keys())
+
+    def m_JobManager_scene_exists(self, obj, params):
+        return 1 if self.server.find_scene(params.get('jobname'), params.get('scenename')) else 0
+
+    def m_JobManager_get_scene_info(self, obj, params):
+        model = self.server.find_scene(params.get('jobname'), params.get('scenename'))
+        if model is None:
+            raise FlapidError('Scene %s does not exist' % params.get('scenename'))
+        return model.info()
+
+    # QueueManager
+
+    def m_QueueManager_create_local(self, obj, params):
+        return self.handle('QueueManager', {'updates': False})
+
+    def m_QueueManager_create(self, obj, params):
+        return self.handle('QueueManager', {'updates': False})
+
+    def m_QueueManager_enable_updates(self, qm, params):
+        qm['updates'] = True
+        return None
+
+    def m_QueueManager_disable_updates(self, qm, params):
+        qm['updates'] = False
+        return None
+
+    def m_QueueManager_get_operation_ids(self, qm, params):
+        return sorted(self.server.queue_ops.keys())
+
+    def queue_op(self, op_id):
+        op = self.server.queue_ops.get(op_id)
+        if op is None:
+            raise FlapidError('Invalid operation ID %s' % op_id)
+        return op
+
+    def m_QueueManager_get_operation_status(self, qm, params):
+        return self.server.op_status(self.queue_op(params.get('id')))
+
+    def m_QueueManager_get_operation_log(self, qm, params):
+        return list(self.queue_op(params.get('id'))['log'])
+
+    def m_QueueManager_archive_operation(self, qm, params):
+        self.queue_op(params.get('id'))
+        del self.server.queue_ops[params.get('id')]
+        return None
+
+    def m_QueueManager_delete_operation(self, qm, params):
+        return self.m_QueueManager_archive_operation(qm, params)
+
+    # Export
+
+    def m_Export_create(self, obj, params):
+        return self.handle('Export', {'shots': []})
+
+    def m_Export_select_shot(self, export, params):
+        export['shots'].append(self.resolve_handle(params.get('shot'), 'Shot'))
+        return None
+
+    def m_Export_select_shots(self, export, params):
+        for shot in params.get('shots') or []:
+            export['shots'].append(self.resolve_handle(shot, 'Shot'))
+        return None
+
+    def m_Export_clear_selection(self, export, params):
+        export['shots'] = []
+        return None
+
+    def m_Export_do_export_still(self, export, params):
+        qm_value = params.get('queue')
+        qm_target = qm_value.get('_id') if isinstance(qm_value, dict) else None
+        self.resolve_handle(qm_value, 'QueueManager')
+        self.resolve_handle(params.get('scene'), 'Scene')
+        settings = params.get('settings') or {}
+        shots = list(export['shots'])
+        if not shots:
+            raise FlapidError('No shots selected for export')
+        op_id = self.server.start_export(self, qm_target, shots, settings)
+        return {'_type': 'ExportOpInfo', 'ID': op_id, 'Log': []}
+
+    # ThumbnailManager
+
+    def m_ThumbnailManager_get_poster_uri(self, obj, params):
+        scene, shot = self.resolve_handle(params.get('shot_if'), 'Shot')
+        return 'http://%s:%d/thumbnails/%s/%s/%d.jpg' % (
+            self.server.hostname,
+            self.server.port,
+            scene.model.job,
+            scene.model.path().replace(':', '/'),
+            shot['id']
+        )
+
+    # Utilities
+
+    def m_Utilities_timecode_from_string(self, obj, params):
+        try:
+            h, m, s, f = [int(x) for x in params.get('str').split(':')]
+        except Exception:
+            raise FlapidError('Invalid timecode %s' % params.get('str'))
+        fps = params.get('fps') or 24
+        return timecode(((h * 60 + m) * 60 + s) * fps + f, fps)
+
+
+# Websocket framing (RFC 6455), server side
+
+async def read_http_request(reader):
+    request_line = (await reader.readline()).decode('latin-1').strip()
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode('latin-1')
+        if not line or line in ('\r\n', '\n'):
+            break
+        if ':' in line:
+            key, value = line.split(':', 1)
+            headers[key.strip().lower()] = value.strip()
+    return request_line, headers
+
+
+def unmask(payload, mask):
+    n = len(payload)
+    if n == 0:
+        return payload
+    key = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, 'big') ^ int.from_bytes(key, 'big')).to_bytes(n, 'big')
+
+
+async def read_frame(reader):
+    header = await reader.readexactly(2)
+    fin = header[0] & 0x80
+    opcode = header[0] & 0x0f
+    masked = header[1] & 0x80
+    length = header[1] & 0x7f
+    if length == 126:
+        length = int.from_bytes(await reader.readexactly(2), 'big')
+    elif length == 127:
+        length = int.from_bytes(await reader.readexactly(8), 'big')
+    mask = await reader.readexactly(4) if masked else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = unmask(payload, mask)
+    return fin, opcode, payload
+
+
+def write_frame(writer, opcode, payload):
+    length = len(payload)
+    if length < 126:
+        header = bytes([0x80 | opcode, length])
+    elif length < 65536:
+        header = bytes([0x80 | opcode, 126]) + length.to_bytes(2, 'big')
+    else:
+        header = bytes([0x80 | opcode, 127]) + length.to_bytes(8, 'big')
+    writer.write(header + payload)
+
+
+# Read a complete text or binary message, answering pings on the way.
+# Returns (None, None) when the client goes away.
+
+async def read_message(reader, writer):
+    fragments = []
+    message_opcode = None
+    while True:
+        try:
+            fin, opcode, payload = await read_frame(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return None, None
+        if opcode == OP_PING:
+            write_frame(writer, OP_PONG, payload)
+            continue
+        if opcode == OP_PONG:
+            continue
+        if opcode == OP_CLOSE:
+            write_frame(writer, OP_CLOSE, payload[:2])
+            return OP_CLOSE, payload
+        if opcode != OP_CONTINUATION:
+            message_opcode = opcode
+        fragments.append(payload)
+        if fin:
+            return message_opcode, b''.join(fragments)
+
+
+class FakeFlapid(object):
+    def __init__(self, hostname='localhost', port=1984, jobs=1, sequences=4, versions=3,
+                 shots=1000, latency=0.0, service_time=0.0, export_time=1.0, token=None, seed=1):
+        self.hostname = hostname
+        self.port = port
+        self.nshots = shots
+        self.latency = latency
+        self.service_time = service_time
+        self.export_time = export_time
+        self.token = token
+        self.version = '6.0.20000'
+        self.started = time.time()
+        self.next_object_id = 1
+        self.next_op_id = 1
+        self.queue_ops = {}
+        self.stats = {'connections': 0, 'requests': 0, 'errors': 0, 'thumbnails': 0}
+
+        # job -> folder -> scene name -> SceneModel
+        self.jobs = {}
+        for j in range(1, jobs + 1):
+            job = 'job%02d' % j
+            folders = self.jobs.setdefault(job, {})
+            for s in range(1, sequences + 1):
+                folder = 'seq%02d' % s
+                scenes = folders.setdefault(folder, {})
+                for v in range(1, versions + 1):
+                    name = '%s_v%03d' % (folder, v)
+                    scenes[name] = SceneModel(self, job, folder, name, seed * 1000003 + j * 10007 + s * 101 + v)
+
+        self.loop = None
+        self.thread = None
+        self.server = None
+
+    def new_object_id(self):
+        obj_id = self.next_object_id
+        self.next_object_id += 1
+        return obj_id
+
+    def split_path(self, path):
+        components = (path or '').split(':')
+        if len(components) < 3:
+            raise FlapidError('Invalid scene path %s' % path)
+        return components[0], components[1], ':'.join(components[2:])
+
+    def find_scene(self, job, scene_path):
+        folders = self.jobs.get(job)
+        if folders is None or not scene_path:
+            return None
+        components = scene_path.split(':')
+        folder = ':'.join(components[:-1])
+        return folders.get(folder, {}).get(components[-1])
+
+    def scenes(self):
+        for job, folders in sorted(self.jobs.items()):
+            for folder, scenes in sorted(folders.items()):
+                for name, model in sorted(scenes.items()):
+                    yield model
+
+    # Queue operations complete export_time seconds after submission.
+    # QueueOpStatusChanged is sent to the submitting connection as the
+    # operation progresses.
+
+    def start_export(self, session, qm_target, shots, settings):
+        op_id = self.next_op_id
+        self.next_op_id += 1
+        op = {
+            'id': op_id,
+            'started': time.time(),
+            'frames': len(shots),
+            'log': [],
+            'settings': settings
+        }
+        self.queue_ops[op_id] = op
+
+        loop = asyncio.get_event_loop()
+        steps = 4
+        for step in range(1, steps + 1):
+            loop.call_later(
+                self.export_time * step / steps,
+                self.export_progress, session, qm_target, op_id, step == steps
+            )
+        return op_id
+
+    def export_progress(self, session, qm_target, op_id, done):
+        op = self.queue_ops.get(op_id)
+        if op is None:
+            return
+        if done:
+            directory = op['settings'].get('Directory') or ''
+            op['log'].append({
+                '_type': 'QueueLogItem',
+                'Time': format_date(time.time()),
+                'Type': 'Info',
+                'Task': 'Export',
+                'Frame': op['frames'],
+                'Message': 'Export complete',
+                'Detail': 'Wrote %d stills to %s' % (op['frames'], directory)
+            })
+        qm = session.objects.get(qm_target)
+        if qm is not None and qm.value.get('updates'):
+            session.emit_signal(qm_target, 'QueueOpStatusChanged', op_id)
+
+    def op_status(self, op):
+        progress = min((time.time() - op['started']) / self.export_time, 1.0) if self.export_time else 1.0
+        if progress >= 1.0:
+            status = 'Done'
+        elif progress > 0:
+            status = 'Active'
+        else:
+            status = 'Queued'
+        return {
+            '_type': 'QueueOpStatus',
+            'ID': op['id'],
+            'Status': status,
+            'Progress': progress,
+            'ProgressText': '%d of %d frames' % (int(progress * op['frames']), op['frames']),
+            'TimeElapsed': '%.1f' % (time.time() - op['started']),
+            'TimeRemaining': '%.1f' % max(self.export_time - (time.time() - op['started']), 0.0),
+            'Warnings': 0,
+            'Errors': 0
+        }
+
+    # Connections
+
+    async def handle_client(self, reader, writer):
+        try:
+            request_line, headers = await read_http_request(reader)
+            if headers.get('upgrade', '').lower() == 'websocket':
+                key = headers.get('sec-websocket-key', '')
+                accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode('ascii')).digest()).decode('ascii')
+                writer.write((
+                    'HTTP/1.1 101 Switching Protocols\r\n'
+                    'Upgrade: websocket\r\n'
+                    'Connection: Upgrade\r\n'
+                    'Sec-WebSocket-Accept: %s\r\n\r\n' % accept
+                ).encode('ascii'))
+                await writer.drain()
+                self.stats['connections'] += 1
+                await Session(self, writer).run(reader)
+            else:
+                await self.serve_http(request_line, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    # Thumbnail URIs from ThumbnailManager.get_poster_uri(). The image is a
+    # placeholder of a realistic size, not a decodable JPEG.
+
+    async def serve_http(self, request_line, writer):
+        parts = request_line.split()
+        path = parts[1] if len(parts) > 1 else '/'
+        if path.startswith('/thumbnails/') and path.endswith('.jpg'):
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            self.stats['thumbnails'] += 1
+            seed = int(hashlib.md5(path.encode('utf-8')).hexdigest()[:8], 16)
+            body = b'\xff\xd8\xff\xe0' + random.Random(seed).randbytes(24 * 1024) + b'\xff\xd9'
+            status = '200 OK'
+        else:
+            body = b'not found'
+            status = '404 Not Found'
+        writer.write((
+            'HTTP/1.1 %s\r\n'
+            'Content-Type: image/jpeg\r\n'
+            'Content-Length: %d\r\n'
+            'Connection: close\r\n\r\n' % (status, len(body))
+        ).encode('ascii') + body)
+        await writer.drain()
+
+    async def serve(self):
+        self.server = await asyncio.start_server(self.handle_client, '0.0.0.0', self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    # start()
+    #
+    # Serve from a background thread. Pass port=0 to the constructor to
+    # pick a free port. Returns the port.
+
+    def start(self):
+        ready = threading.Event()
+
+        def run():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            self.loop.run_until_complete(self.serve())
+            ready.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run, name='fake_flapid')
+        self.thread.daemon = True
+        self.thread.start()
+        ready.wait()
+        return self.port
+
+    def stop(self):
+        if self.loop is None:
+            return
+        self.loop.call_soon_threadsafe(self.server.close)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5.0)
+        self.loop = None
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['scenes'] = {
+            '%s:%s' % (model.job, model.path()): dict(model.stats)
+            for model in self.scenes() if model.stats['opened']
+        }
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='flapid stand-in for benchmarking kitsu-robot')
+    parser.add_argument('--hostname', default='localhost', help='host name used in scene paths')
+    parser.add_argument('--port', type=int, default=1984)
+    parser.add_argument('--jobs', type=int, default=1)
+    parser.add_argument('--sequences', type=int, default=4, help='scene folders per job')
+    parser.add_argument('--versions', type=int, default=3, help='scenes per folder')
+    parser.add_argument('--shots', type=int, default=1000, help='shots per scene')
+    parser.add_argument('--latency', type=float, default=0.0, help='reply delay, ms')
+    parser.add_argument('--service-time', type=float, default=0.0, help='processing time per request, ms')
+    parser.add_argument('--export-time', type=float, default=1.0, help='duration of still exports, s')
+    parser.add_argument('--token', default=None, help='only accept this token')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    server = FakeFlapid(
+        hostname=args.hostname,
+        port=args.port,
+        jobs=args.jobs,
+        sequences=args.sequences,
+        versions=args.versions,
+        shots=args.shots,
+        latency=args.latency / 1000.0,
+        service_time=args.service_time / 1000.0,
+        export_time=args.export_time,
+        token=args.token,
+        seed=args.seed
+    )
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(server.serve())
+    print('fake flapid listening on port %d, e.g. %s:job01:seq01:seq01_v%03d' % (
+        server.port, args.hostname, args.versions))
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    print(json.dumps(server.get_stats(), indent=4, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
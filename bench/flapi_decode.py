@@ -0,0 +1,96 @@
+import os
+import sys
+import json
+import time
+
+# Micro-benchmark for decoding of flapi replies
+#
+# Compares the JSON backends of flapi.Connection (see JSON_BACKENDS) on
+# reply payloads shaped like Shot.get_metadata and Scene.get_shot_ids.
+#
+# Usage: python bench/flapi_decode.py [number of shots]
+
+app_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+flapi_module_path = os.path.join(app_path, 'flapi', 'python')
+if sys.path[0] != flapi_module_path:
+    sys.path.insert(0, flapi_module_path)
+import flapi
+
+def timecode(frame):
+    return {
+        '_type': 'timecode',
+        'h': 1, 'm': frame // 1440 % 60, 's': frame // 24 % 60, 'f': frame % 24,
+        'phase': 0, 'fps': 24, 'wrap': 24
+    }
+
+def get_metadata_reply(msgid, nkeys):
+    result = {}
+    for ix in range(nkeys):
+        result['md%d' % ix] = 'value %d of a metadata column' % ix
+    result['srctc'] = [timecode(msgid), timecode(msgid + 100)]
+    result['rectc'] = [timecode(msgid * 10), timecode(msgid * 10 + 100)]
+    return json.dumps({'jsonrpc': '2.0', 'id': msgid, 'result': result})
+
+def get_metadata_strings_reply(msgid, nkeys):
+    result = {}
+    for ix in range(nkeys):
+        result['md%d' % ix] = 'value %d of a metadata column' % ix
+    return json.dumps({'jsonrpc': '2.0', 'id': msgid, 'result': result})
+
+def get_shot_ids_reply(nshots):
+    result = []
+    for ix in range(nshots):
+        result.append({
+            '_type': 'ShotInfo',
+            'ShotId': 1000 + ix,
+            'StartFrame': ix * 100.0,
+            'EndFrame': ix * 100.0 + 100.0,
+            'PosterFrame': ix * 100.0 + 10.0
+        })
+    return json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': result})
+
+def bench(conn, bufs, repeat=15):
+    best = None
+    for r in range(repeat):
+        start = time.perf_counter()
+        for buf in bufs:
+            conn.parse_reply(buf)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def main():
+    nshots = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+
+    payloads = [
+        ('Shot.get_metadata x%d (40 keys, timecodes)' % nshots,
+            [get_metadata_reply(ix, 40) for ix in range(nshots)]),
+        ('Shot.get_metadata x%d (200 keys, no markers)' % nshots,
+            [get_metadata_strings_reply(ix, 200) for ix in range(nshots)]),
+        ('Scene.get_shot_ids (%d shots)' % (nshots * 10),
+            [get_shot_ids_reply(nshots * 10)]),
+    ]
+
+    # 'hook' is the original decoding, the baseline for the speedup
+    backends = []
+    for name in ['hook'] + [x for x in flapi.JSON_BACKENDS if x != 'hook']:
+        try:
+            flapi.get_json_loads(name)
+            backends.append(name)
+        except ImportError:
+            print('%s: not installed' % name)
+
+    conn = flapi.Connection('localhost')
+    for title, bufs in payloads:
+        print('\n%s, %.1f MB' % (title, sum(len(x) for x in bufs) / 1e6))
+        baseline = None
+        for name in backends:
+            conn.set_json_backend(name)
+            elapsed = bench(conn, bufs)
+            if baseline is None:
+                baseline = elapsed
+            print('  %-8s %8.1f ms  x%.2f' % (name, elapsed * 1000, baseline / elapsed))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+
+# Record or replay the flapi traffic of get_baselight_scene_shots()
+#
+# Record once against a Baselight host:
+#
+#   python bench/flapi_replay.py record <session dir> <blpath>
+#
+# then replay it anywhere, without a Baselight host, at recorded speed
+# (1), faster (e.g. 4) or without any delay (0, the default):
+#
+#   python bench/flapi_replay.py replay <session dir> <blpath> [speed]
+#
+# Each flapi connection opened is recorded to its own file in the session
+# dir (see flapi.replay), and the same connections are replayed in order.
+# The connection pool is not used, so both runs open the same connections.
+
+app_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, app_path)
+
+from python.config import get_config_data
+from python.util import RobotLog
+from python.sequence import get_baselight_scene_shots
+
+def main():
+    if len(sys.argv) < 4 or sys.argv[1] not in ('record', 'replay'):
+        print('usage: python bench/flapi_replay.py record|replay <session dir> <blpath> [speed]')
+        sys.exit(1)
+    mode, session_path, blpath = sys.argv[1:4]
+
+    if mode == 'record':
+        if not os.path.isdir(session_path):
+            os.makedirs(session_path)
+        os.environ['FLAPI_RECORD'] = session_path
+    else:
+        os.environ['FLAPI_REPLAY'] = session_path
+        os.environ['FLAPI_REPLAY_SPEED'] = sys.argv[4] if len(sys.argv) > 4 else '0'
+
+    config = get_config_data(os.path.join(app_path, 'config'))
+    config['app_name'] = 'flapi_replay'
+    config['log'] = RobotLog(config)
+
+    start = time.perf_counter()
+    shots = get_baselight_scene_shots(config, blpath)
+    elapsed = time.perf_counter() - start
+    print('%s: %d shots in %.3f s' % (mode, len(shots), elapsed))
+
+if __name__ == '__main__':
+    main()
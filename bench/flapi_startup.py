@@ -0,0 +1,83 @@
+import os
+import sys
+import json
+import subprocess
+
+# Startup benchmark for the flapi package, eager versus lazy mode (FLAPI_LAZY)
+#
+# Each sample runs in a fresh interpreter and measures:
+#
+#   import      time and RSS growth of "import flapi"
+#   first use   time to create a Connection and touch what the robot uses
+#               (conn.Scene, conn.JobManager, conn.QueueManager, conn.Export,
+#               flapi.StillExportSettings, decoding ShotInfo/MetadataItem)
+#
+# Usage: python bench/flapi_startup.py [samples]
+
+app_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+flapi_module_path = os.path.join(app_path, 'flapi', 'python')
+
+SAMPLE = r'''
+import json
+import resource
+import sys
+import time
+
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import flapi
+imported = time.perf_counter()
+rss_import = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+conn = flapi.Connection('localhost')
+for name in ('Scene', 'JobManager', 'QueueManager', 'Export'):
+    getattr(conn, name)
+flapi.StillExportSettings()
+flapi.OPENFLAG_READ_ONLY
+conn.parse_reply('{"id": 1, "result": [{"_type": "ShotInfo", "ShotId": 1}, {"_type": "MetadataItem", "Key": "clip"}]}')
+used = time.perf_counter()
+
+print(json.dumps({
+    'import_ms': (imported - start) * 1000.0,
+    'first_use_ms': (used - imported) * 1000.0,
+    'import_rss_kb': rss_import - rss_before,
+    'total_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'modules': len([m for m in sys.modules if m == 'flapi' or m.startswith('flapi.')]),
+    'websocket': 'websocket' in sys.modules
+}))
+'''
+
+def run_sample(lazy):
+    env = dict(os.environ)
+    env['FLAPI_LAZY'] = '1' if lazy else '0'
+    env['PYTHONPATH'] = os.pathsep.join([flapi_module_path] + [p for p in [env.get('PYTHONPATH')] if p])
+    output = subprocess.check_output([sys.executable, '-c', SAMPLE], env=env)
+    return json.loads(output)
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 9
+
+    # warm up .pyc files
+    run_sample(False)
+    run_sample(True)
+
+    results = {}
+    for lazy in (False, True):
+        runs = [run_sample(lazy) for x in range(samples)]
+        results[lazy] = {key: median([r[key] for r in runs]) for key in runs[0].keys()}
+
+    print('%-8s %10s %12s %14s %14s %8s %10s' % (
+        'mode', 'import ms', 'first use ms', 'import RSS KB', 'total RSS KB', 'modules', 'websocket'))
+    for lazy in (False, True):
+        r = results[lazy]
+        print('%-8s %10.1f %12.1f %14d %14d %8d %10s' % (
+            'lazy' if lazy else 'eager',
+            r['import_ms'], r['first_use_ms'], r['import_rss_kb'], r['total_rss_kb'],
+            r['modules'], r['websocket']))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import os
+import sys
+import gc
+import json
+import time
+import tracemalloc
+
+# Memory and decoding benchmark for flapi value types
+#
+# Decodes a reply holding N ShotInfo records (default 100000) through
+# Connection.parse_reply(), as get_shots() replies are, and compares the
+# __slots__ based flapi.ShotInfo with the previous __dict__ based class,
+# kept here as DictShotInfo.
+#
+# Usage: python bench/flapi_values.py [count]
+
+app_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(app_path, 'flapi', 'python'))
+
+import flapi
+
+class DictShotInfo:
+
+    def __init__(self, obj=None, **kwargs):
+        if obj is None:
+            obj=kwargs
+        if obj != None:
+            self.ShotId = obj.get("ShotId")
+            self.StartFrame = obj.get("StartFrame")
+            self.EndFrame = obj.get("EndFrame")
+            self.PosterFrame = obj.get("PosterFrame")
+        else:
+            self.ShotId = None
+            self.StartFrame = None
+            self.EndFrame = None
+            self.PosterFrame = None
+
+    @staticmethod
+    def from_dict(o):
+        return DictShotInfo(o)
+
+def make_reply(count):
+    shots = []
+    for ix in range(count):
+        shots.append({
+            "_type": "ShotInfo",
+            "ShotId": 1000000 + ix,
+            "StartFrame": ix * 100,
+            "EndFrame": ix * 100 + 99,
+            "PosterFrame": ix * 100 + 50,
+        })
+    return json.dumps({"jsonrpc": "2.0", "id": 1, "result": shots})
+
+# Decode time is measured without tracemalloc, which slows allocation down
+#
+def measure(conn, reply):
+    gc.collect()
+    start = time.perf_counter()
+    shots = conn.parse_reply(reply)['result']
+    elapsed = time.perf_counter() - start
+    del shots
+
+    gc.collect()
+    tracemalloc.start()
+    shots = conn.parse_reply(reply)['result']
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return shots, elapsed, current, peak
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    reply = make_reply(count)
+    conn = flapi.Connection('localhost')
+
+    results = []
+    for name, decoder in (('dict', DictShotInfo.from_dict), ('slots', flapi.ShotInfo.from_dict)):
+        flapi.Library.register_decoder("ShotInfo", decoder)
+        best = None
+        for x in range(3):
+            shots, elapsed, current, peak = measure(conn, reply)
+            assert len(shots) == count and shots[-1].EndFrame == count * 100 - 1
+            del shots
+            if best is None or elapsed < best[0]:
+                best = (elapsed, current, peak)
+        results.append((name, best))
+    flapi.Library.register_decoder("ShotInfo", flapi.ShotInfo.from_dict)
+
+    print('%d ShotInfo records, reply %.1f MB' % (count, len(reply) / 1e6))
+    print('%-6s %10s %12s %12s %14s' % ('class', 'decode s', 'retained MB', 'peak MB', 'bytes/record'))
+    for name, (elapsed, current, peak) in results:
+        print('%-6s %10.3f %12.1f %12.1f %14d' % (
+            name, elapsed, current / 1e6, peak / 1e6, current // count))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+import asyncio
+import sys
+import flapi
+from flapi.aio import AsyncConnection
+
+# Open several scenes concurrently over one asyncio connection and
+# count their shots.
+#
+# Usage: async_scenes.py host:job:scene [host:job:scene ...]
+
+async def count_shots(conn, path):
+    scene_path = await conn.Scene.parse_path(path)
+    scene = await conn.Scene.open_scene(scene_path, { flapi.OPENFLAG_READ_ONLY })
+    nshots = await scene.get_num_shots()
+    await scene.close_scene()
+    await scene.release()
+    return nshots
+
+async def main(paths):
+    async with AsyncConnection("localhost") as conn:
+        counts = await conn.gather(*[count_shots(conn, p) for p in paths], return_exceptions=True)
+        for path, count in zip(paths, counts):
+            print( "%s: %s" % (path, count) )
+
+if len(sys.argv) < 2:
+    print( "usage: %s host:job:scene [host:job:scene ...]" % sys.argv[0] )
+    sys.exit(1)
+
+asyncio.run(main(sys.argv[1:]))
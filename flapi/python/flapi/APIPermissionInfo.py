@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # APIPermissionInfo
@@ -6,7 +6,13 @@ import json
 # Definition of an API permission
 #
 
-class APIPermissionInfo:
+class APIPermissionInfo(Value):
+
+    __slots__ = (
+        "Key",
+        "Label",
+        "Desc",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -32,10 +38,5 @@ class APIPermissionInfo:
             "Label": self.Label,
             "Desc": self.Desc,
         }
-
-    def __repr__(self):
-        return "flapi.APIPermissionInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "APIPermissionInfo", APIPermissionInfo.from_dict );
 
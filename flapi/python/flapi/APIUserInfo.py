@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # APIUserInfo
@@ -6,7 +6,14 @@ import json
 # Settings for an API user
 #
 
-class APIUserInfo:
+class APIUserInfo(Value):
+
+    __slots__ = (
+        "Login",
+        "Name",
+        "Permissions",
+        "Enabled",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class APIUserInfo:
             "Permissions": self.Permissions,
             "Enabled": self.Enabled,
         }
-
-    def __repr__(self):
-        return "flapi.APIUserInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "APIUserInfo", APIUserInfo.from_dict );
 
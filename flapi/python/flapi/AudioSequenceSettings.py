@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # AudioSequenceSettings
@@ -6,7 +6,15 @@ import json
 # Settings defining the behaviour of an Audio Sequence
 #
 
-class AudioSequenceSettings:
+class AudioSequenceSettings(Value):
+
+    __slots__ = (
+        "Type",
+        "Filename",
+        "Stems",
+        "Offset",
+        "Ratio",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -38,10 +46,5 @@ class AudioSequenceSettings:
             "Offset": self.Offset,
             "Ratio": self.Ratio,
         }
-
-    def __repr__(self):
-        return "flapi.AudioSequenceSettings(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "AudioSequenceSettings", AudioSequenceSettings.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # AudioSyncProgress
@@ -6,7 +6,14 @@ import json
 # Progress information from audio sync operation
 #
 
-class AudioSyncProgress:
+class AudioSyncProgress(Value):
+
+    __slots__ = (
+        "Status",
+        "Summary",
+        "ShotID",
+        "Frame",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class AudioSyncProgress:
             "ShotID": self.ShotID,
             "Frame": self.Frame,
         }
-
-    def __repr__(self):
-        return "flapi.AudioSyncProgress(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "AudioSyncProgress", AudioSyncProgress.from_dict );
 
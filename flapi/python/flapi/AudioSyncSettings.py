@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # AudioSyncSettings
@@ -6,7 +6,27 @@ import json
 # Settings to use for AudioSync operation
 #
 
-class AudioSyncSettings:
+class AudioSyncSettings(Value):
+
+    __slots__ = (
+        "Criteria",
+        "Timecode",
+        "Scene",
+        "Take",
+        "Directory",
+        "SubSearch",
+        "Subdirs",
+        "FPS",
+        "Offset",
+        "Metadata",
+        "ClapDetect",
+        "ClapDetectThreshold",
+        "Ratio",
+        "ReadLTC",
+        "LTCIndex",
+        "LTCColumn",
+        "AutoSync",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -74,10 +94,5 @@ class AudioSyncSettings:
             "LTCColumn": self.LTCColumn,
             "AutoSync": self.AutoSync,
         }
-
-    def __repr__(self):
-        return "flapi.AudioSyncSettings(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "AudioSyncSettings", AudioSyncSettings.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # BLGExportSettings
@@ -6,7 +6,29 @@ import json
 # Settings to use for BLG exports
 #
 
-class BLGExportSettings:
+class BLGExportSettings(Value):
+
+    __slots__ = (
+        "Source",
+        "Filter",
+        "Category",
+        "CategoryMatch",
+        "Frames",
+        "MarkCategory",
+        "Stereo",
+        "Directory",
+        "Overwrite",
+        "Path",
+        "Template",
+        "Scale",
+        "AllowMultiInput",
+        "GenerateNukeScripts",
+        "GenerateWriteNode",
+        "Keyframes",
+        "LockGrade",
+        "ViewingColourSpace",
+        "ViewingFormat",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -80,10 +102,5 @@ class BLGExportSettings:
             "ViewingColourSpace": self.ViewingColourSpace,
             "ViewingFormat": self.ViewingFormat,
         }
-
-    def __repr__(self):
-        return "flapi.BLGExportSettings(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "BLGExportSettings", BLGExportSettings.from_dict );
 
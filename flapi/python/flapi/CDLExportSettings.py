@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # CDLExportSettings
@@ -6,7 +6,26 @@ import json
 # Settings to use for CDL exports
 #
 
-class CDLExportSettings:
+class CDLExportSettings(Value):
+
+    __slots__ = (
+        "Source",
+        "Filter",
+        "Category",
+        "CategoryMatch",
+        "Frames",
+        "MarkCategory",
+        "Stereo",
+        "Directory",
+        "Overwrite",
+        "Format",
+        "PathExample",
+        "Template",
+        "LookNameExample",
+        "LookName",
+        "CDLLayer",
+        "CDLLayerCustom",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -71,10 +90,5 @@ class CDLExportSettings:
             "CDLLayer": self.CDLLayer,
             "CDLLayerCustom": self.CDLLayerCustom,
         }
-
-    def __repr__(self):
-        return "flapi.CDLExportSettings(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "CDLExportSettings", CDLExportSettings.from_dict );
 
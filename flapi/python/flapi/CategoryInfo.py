@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # CategoryInfo
@@ -6,7 +6,14 @@ import json
 # Definition of a Category used to annotate marks, shots or strips
 #
 
-class CategoryInfo:
+class CategoryInfo(Value):
+
+    __slots__ = (
+        "Key",
+        "Name",
+        "ReadOnly",
+        "Colour",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class CategoryInfo:
             "ReadOnly": self.ReadOnly,
             "Colour": self.Colour,
         }
-
-    def __repr__(self):
-        return "flapi.CategoryInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "CategoryInfo", CategoryInfo.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # ClientViewClientSettings
@@ -6,7 +6,15 @@ import json
 # Settings for a connected Client View
 #
 
-class ClientViewClientSettings:
+class ClientViewClientSettings(Value):
+
+    __slots__ = (
+        "StreamIndex",
+        "StreamConfigsAge",
+        "NotesEnabled",
+        "LaserEnabled",
+        "Debug",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -38,10 +46,5 @@ class ClientViewClientSettings:
             "LaserEnabled": self.LaserEnabled,
             "Debug": self.Debug,
         }
-
-    def __repr__(self):
-        return "flapi.ClientViewClientSettings(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "ClientViewClientSettings", ClientViewClientSettings.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # ClientViewHostUserSettings
@@ -6,7 +6,12 @@ import json
 # Settings for user hosting the Client View
 #
 
-class ClientViewHostUserSettings:
+class ClientViewHostUserSettings(Value):
+
+    __slots__ = (
+        "UserName",
+        "LaserColour",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class ClientViewHostUserSettings:
             "UserName": self.UserName,
             "LaserColour": self.LaserColour,
         }
-
-    def __repr__(self):
-        return "flapi.ClientViewHostUserSettings(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "ClientViewHostUserSettings", ClientViewHostUserSettings.from_dict );
 
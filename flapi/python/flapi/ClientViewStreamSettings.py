@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # ClientViewStreamSettings
@@ -6,7 +6,13 @@ import json
 # Settings for a Client View stream
 #
 
-class ClientViewStreamSettings:
+class ClientViewStreamSettings(Value):
+
+    __slots__ = (
+        "Resolution",
+        "Bitrate",
+        "ColourSpace",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -32,10 +38,5 @@ class ClientViewStreamSettings:
             "Bitrate": self.Bitrate,
             "ColourSpace": self.ColourSpace,
         }
-
-    def __repr__(self):
-        return "flapi.ClientViewStreamSettings(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "ClientViewStreamSettings", ClientViewStreamSettings.from_dict );
 
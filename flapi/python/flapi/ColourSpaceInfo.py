@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # ColourSpaceInfo
@@ -6,7 +6,13 @@ import json
 # Description of a Truelight Colour Space
 #
 
-class ColourSpaceInfo:
+class ColourSpaceInfo(Value):
+
+    __slots__ = (
+        "Name",
+        "DisplayName",
+        "Type",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -32,10 +38,5 @@ class ColourSpaceInfo:
             "DisplayName": self.DisplayName,
             "Type": self.Type,
         }
-
-    def __repr__(self):
-        return "flapi.ColourSpaceInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "ColourSpaceInfo", ColourSpaceInfo.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # ConnectionInfo
@@ -6,7 +6,13 @@ import json
 # Dictionary describing a single connection.
 #
 
-class ConnectionInfo:
+class ConnectionInfo(Value):
+
+    __slots__ = (
+        "ConnectionID",
+        "UserName",
+        "UsageType",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -32,10 +38,5 @@ class ConnectionInfo:
             "UserName": self.UserName,
             "UsageType": self.UsageType,
         }
-
-    def __repr__(self):
-        return "flapi.ConnectionInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "ConnectionInfo", ConnectionInfo.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # CubeExportSettings
@@ -6,7 +6,41 @@ import json
 # Settings to use for Cube exports
 #
 
-class CubeExportSettings:
+class CubeExportSettings(Value):
+
+    __slots__ = (
+        "Source",
+        "Filter",
+        "Category",
+        "CategoryMatch",
+        "Frames",
+        "MarkCategory",
+        "Stereo",
+        "Directory",
+        "Overwrite",
+        "NumLUTs",
+        "LUT1Options",
+        "LUT1Path",
+        "LUT1Name",
+        "LUT2Options",
+        "LUT2Path",
+        "LUT2Name",
+        "LUT3Options",
+        "LUT3Path",
+        "LUT3Name",
+        "InputColourSpace",
+        "InputDRT",
+        "LUTFormat",
+        "ExtendedRanges",
+        "InputMin",
+        "InputMaxLog",
+        "InputMaxLin",
+        "InputLogOffset",
+        "OutputColourSpace",
+        "CubeResolution",
+        "LUTResolution",
+        "GradeReplace",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -116,10 +150,5 @@ class CubeExportSettings:
             "LUTResolution": self.LUTResolution,
             "GradeReplace": self.GradeReplace,
         }
-
-    def __repr__(self):
-        return "flapi.CubeExportSettings(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "CubeExportSettings", CubeExportSettings.from_dict );
 
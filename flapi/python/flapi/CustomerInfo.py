@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # CustomerInfo
@@ -6,7 +6,13 @@ import json
 # Dictionary containing customer related settings/preferences.
 #
 
-class CustomerInfo:
+class CustomerInfo(Value):
+
+    __slots__ = (
+        "Name",
+        "LogoURI",
+        "WebsiteURL",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -32,10 +38,5 @@ class CustomerInfo:
             "LogoURI": self.LogoURI,
             "WebsiteURL": self.WebsiteURL,
         }
-
-    def __repr__(self):
-        return "flapi.CustomerInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "CustomerInfo", CustomerInfo.from_dict );
 
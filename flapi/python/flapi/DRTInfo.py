@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # DRTInfo
@@ -6,7 +6,14 @@ import json
 # Description of a Truelight Display Rendering Transform
 #
 
-class DRTInfo:
+class DRTInfo(Value):
+
+    __slots__ = (
+        "Name",
+        "InputSpace",
+        "OutputSpace",
+        "ViewingConditions",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class DRTInfo:
             "OutputSpace": self.OutputSpace,
             "ViewingConditions": self.ViewingConditions,
         }
-
-    def __repr__(self):
-        return "flapi.DRTInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "DRTInfo", DRTInfo.from_dict );
 
@@ -1,11 +1,16 @@
-from . import Library
+from . import Library, Value
 import json
 
 # DecodeParameterChoice
 #
 #
 
-class DecodeParameterChoice:
+class DecodeParameterChoice(Value):
+
+    __slots__ = (
+        "Value",
+        "Label",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -28,10 +33,5 @@ class DecodeParameterChoice:
             "Value": self.Value,
             "Label": self.Label,
         }
-
-    def __repr__(self):
-        return "flapi.DecodeParameterChoice(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "DecodeParameterChoice", DecodeParameterChoice.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # DecodeParameterDefinition
@@ -6,7 +6,17 @@ import json
 # This type is returned by get_decode_parameter_definitions to define the data type, label, ranges and values for each decode parameter that can be get or set for a Shot.
 #
 
-class DecodeParameterDefinition:
+class DecodeParameterDefinition(Value):
+
+    __slots__ = (
+        "Parameter",
+        "Type",
+        "Default",
+        "Label",
+        "Min",
+        "Max",
+        "Choices",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -44,10 +54,5 @@ class DecodeParameterDefinition:
             "Max": self.Max,
             "Choices": self.Choices,
         }
-
-    def __repr__(self):
-        return "flapi.DecodeParameterDefinition(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "DecodeParameterDefinition", DecodeParameterDefinition.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # DiagHostResult
@@ -6,7 +6,13 @@ import json
 # Result information for diagnostic tests run on a specific host
 #
 
-class DiagHostResult:
+class DiagHostResult(Value):
+
+    __slots__ = (
+        "Host",
+        "Messages",
+        "Status",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -32,10 +38,5 @@ class DiagHostResult:
             "Messages": self.Messages,
             "Status": self.Status,
         }
-
-    def __repr__(self):
-        return "flapi.DiagHostResult(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "DiagHostResult", DiagHostResult.from_dict );
 
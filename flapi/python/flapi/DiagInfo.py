@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # DiagInfo
@@ -6,7 +6,15 @@ import json
 # Information about a particular diagnostic test
 #
 
-class DiagInfo:
+class DiagInfo(Value):
+
+    __slots__ = (
+        "Key",
+        "Name",
+        "Group",
+        "Hosts",
+        "Weight",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -38,10 +46,5 @@ class DiagInfo:
             "Hosts": self.Hosts,
             "Weight": self.Weight,
         }
-
-    def __repr__(self):
-        return "flapi.DiagInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "DiagInfo", DiagInfo.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # DiagProgress
@@ -6,7 +6,16 @@ import json
 # Overall process of diagnostic test operation
 #
 
-class DiagProgress:
+class DiagProgress(Value):
+
+    __slots__ = (
+        "Running",
+        "Total",
+        "NumComplete",
+        "NumInProgress",
+        "NumWaiting",
+        "NumSkipped",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -41,10 +50,5 @@ class DiagProgress:
             "NumWaiting": self.NumWaiting,
             "NumSkipped": self.NumSkipped,
         }
-
-    def __repr__(self):
-        return "flapi.DiagProgress(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "DiagProgress", DiagProgress.from_dict );
 
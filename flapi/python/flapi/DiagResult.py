@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # DiagResult
@@ -6,7 +6,12 @@ import json
 # Result information for an individual diagnostic test across all hosts running this test
 #
 
-class DiagResult:
+class DiagResult(Value):
+
+    __slots__ = (
+        "Name",
+        "Hosts",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class DiagResult:
             "Name": self.Name,
             "Hosts": self.Hosts,
         }
-
-    def __repr__(self):
-        return "flapi.DiagResult(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "DiagResult", DiagResult.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # DialogItem
@@ -6,7 +6,25 @@ import json
 # Definition of an item to be shown in a DynamicDialog
 #
 
-class DialogItem:
+class DialogItem(Value):
+
+    __slots__ = (
+        "Key",
+        "Label",
+        "Type",
+        "Help",
+        "Default",
+        "Options",
+        "RegExp",
+        "Password",
+        "IntMin",
+        "IntMax",
+        "FloatMin",
+        "FloatMax",
+        "FloatSnap",
+        "Style",
+        "Height",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -68,10 +86,5 @@ class DialogItem:
             "Style": self.Style,
             "Height": self.Height,
         }
-
-    def __repr__(self):
-        return "flapi.DialogItem(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "DialogItem", DialogItem.from_dict );
 
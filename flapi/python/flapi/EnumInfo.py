@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # EnumInfo
@@ -6,7 +6,12 @@ import json
 # Information about a defined enumerated value
 #
 
-class EnumInfo:
+class EnumInfo(Value):
+
+    __slots__ = (
+        "Value",
+        "Desc",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class EnumInfo:
             "Value": self.Value,
             "Desc": self.Desc,
         }
-
-    def __repr__(self):
-        return "flapi.EnumInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "EnumInfo", EnumInfo.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # ExportOpInfo
@@ -6,7 +6,12 @@ import json
 # This type is returned to return information about export operations queued via QueueManager
 #
 
-class ExportOpInfo:
+class ExportOpInfo(Value):
+
+    __slots__ = (
+        "ID",
+        "Log",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class ExportOpInfo:
             "ID": self.ID,
             "Log": self.Log,
         }
-
-    def __repr__(self):
-        return "flapi.ExportOpInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "ExportOpInfo", ExportOpInfo.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # ExportProgress
@@ -6,7 +6,14 @@ import json
 # Progress information from Export operation
 #
 
-class ExportProgress:
+class ExportProgress(Value):
+
+    __slots__ = (
+        "Status",
+        "Summary",
+        "ShotID",
+        "Frame",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class ExportProgress:
             "ShotID": self.ShotID,
             "Frame": self.Frame,
         }
-
-    def __repr__(self):
-        return "flapi.ExportProgress(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "ExportProgress", ExportProgress.from_dict );
 
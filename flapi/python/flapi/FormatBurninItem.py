@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # FormatBurninItem
@@ -6,7 +6,24 @@ import json
 # Definition of a text element within a FormatBurnin
 #
 
-class FormatBurninItem:
+class FormatBurninItem(Value):
+
+    __slots__ = (
+        "Type",
+        "X",
+        "Y",
+        "XAlign",
+        "YAlign",
+        "Box",
+        "Height",
+        "Text",
+        "XScale",
+        "YScale",
+        "ResX",
+        "ResY",
+        "Opacity",
+        "File",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -65,10 +82,5 @@ class FormatBurninItem:
             "Opacity": self.Opacity,
             "File": self.File,
         }
-
-    def __repr__(self):
-        return "flapi.FormatBurninItem(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "FormatBurninItem", FormatBurninItem.from_dict );
 
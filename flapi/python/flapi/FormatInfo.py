@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # FormatInfo
@@ -6,7 +6,13 @@ import json
 # Specifies the width, height, pixel aspect ratio
 #
 
-class FormatInfo:
+class FormatInfo(Value):
+
+    __slots__ = (
+        "Width",
+        "Height",
+        "PixelAspectRatio",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -32,10 +38,5 @@ class FormatInfo:
             "Height": self.Height,
             "PixelAspectRatio": self.PixelAspectRatio,
         }
-
-    def __repr__(self):
-        return "flapi.FormatInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "FormatInfo", FormatInfo.from_dict );
 
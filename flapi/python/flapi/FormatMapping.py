@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # FormatMapping
@@ -6,7 +6,17 @@ import json
 # Defines the mapping from one Format to another Format
 #
 
-class FormatMapping:
+class FormatMapping(Value):
+
+    __slots__ = (
+        "sx",
+        "sy",
+        "tx",
+        "ty",
+        "inside",
+        "src_mask",
+        "dst_mask",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -44,10 +54,5 @@ class FormatMapping:
             "src_mask": self.src_mask,
             "dst_mask": self.dst_mask,
         }
-
-    def __repr__(self):
-        return "flapi.FormatMapping(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "FormatMapping", FormatMapping.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # FormatMask
@@ -6,7 +6,15 @@ import json
 # Specifies the area of Mark defined with a Format
 #
 
-class FormatMask:
+class FormatMask(Value):
+
+    __slots__ = (
+        "Name",
+        "XMin",
+        "XMax",
+        "YMin",
+        "YMax",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -38,10 +46,5 @@ class FormatMask:
             "YMin": self.YMin,
             "YMax": self.YMax,
         }
-
-    def __repr__(self):
-        return "flapi.FormatMask(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "FormatMask", FormatMask.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # FrameRange
@@ -6,7 +6,12 @@ import json
 # Defines a range of frames
 #
 
-class FrameRange:
+class FrameRange(Value):
+
+    __slots__ = (
+        "Start",
+        "End",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class FrameRange:
             "Start": self.Start,
             "End": self.End,
         }
-
-    def __repr__(self):
-        return "flapi.FrameRange(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "FrameRange", FrameRange.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # KeyTextItem
@@ -6,7 +6,12 @@ import json
 # A mapping for a key object to a user-readable string describing that key
 #
 
-class KeyTextItem:
+class KeyTextItem(Value):
+
+    __slots__ = (
+        "Key",
+        "Text",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class KeyTextItem:
             "Key": self.Key,
             "Text": self.Text,
         }
-
-    def __repr__(self):
-        return "flapi.KeyTextItem(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "KeyTextItem", KeyTextItem.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # LicenceItem
@@ -6,7 +6,17 @@ import json
 # Description of a installed licence option
 #
 
-class LicenceItem:
+class LicenceItem(Value):
+
+    __slots__ = (
+        "Product",
+        "Version",
+        "Options",
+        "Permanent",
+        "Start",
+        "Duration",
+        "DaysLeft",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -44,10 +54,5 @@ class LicenceItem:
             "Duration": self.Duration,
             "DaysLeft": self.DaysLeft,
         }
-
-    def __repr__(self):
-        return "flapi.LicenceItem(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "LicenceItem", LicenceItem.from_dict );
 
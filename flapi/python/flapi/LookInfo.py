@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # LookInfo
@@ -6,7 +6,12 @@ import json
 # Information for a Look
 #
 
-class LookInfo:
+class LookInfo(Value):
+
+    __slots__ = (
+        "Name",
+        "Group",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class LookInfo:
             "Name": self.Name,
             "Group": self.Group,
         }
-
-    def __repr__(self):
-        return "flapi.LookInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "LookInfo", LookInfo.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # MetadataItem
@@ -6,7 +6,17 @@ import json
 # Definition of a Metadata field that exists across all shots in a Scene
 #
 
-class MetadataItem:
+class MetadataItem(Value):
+
+    __slots__ = (
+        "Key",
+        "Name",
+        "Type",
+        "NumElements",
+        "IsReadOnly",
+        "IsUserDefined",
+        "Properties",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -44,10 +54,5 @@ class MetadataItem:
             "IsUserDefined": self.IsUserDefined,
             "Properties": self.Properties,
         }
-
-    def __repr__(self):
-        return "flapi.MetadataItem(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "MetadataItem", MetadataItem.from_dict );
 
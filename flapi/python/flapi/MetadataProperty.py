@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # MetadataProperty
@@ -6,7 +6,12 @@ import json
 # Definition of a Property that can specified for each MetadataItem defined in a Scene
 #
 
-class MetadataProperty:
+class MetadataProperty(Value):
+
+    __slots__ = (
+        "Key",
+        "Name",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class MetadataProperty:
             "Key": self.Key,
             "Name": self.Name,
         }
-
-    def __repr__(self):
-        return "flapi.MetadataProperty(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "MetadataProperty", MetadataProperty.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # MultiPasteProgress
@@ -6,7 +6,14 @@ import json
 # Progress information from Multi-Paste operation
 #
 
-class MultiPasteProgress:
+class MultiPasteProgress(Value):
+
+    __slots__ = (
+        "Status",
+        "Summary",
+        "ShotID",
+        "Frame",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class MultiPasteProgress:
             "ShotID": self.ShotID,
             "Frame": self.Frame,
         }
-
-    def __repr__(self):
-        return "flapi.MultiPasteProgress(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "MultiPasteProgress", MultiPasteProgress.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # MultiPasteSettings
@@ -6,7 +6,53 @@ import json
 # Settings to use for MultiPaste operation
 #
 
-class MultiPasteSettings:
+class MultiPasteSettings(Value):
+
+    __slots__ = (
+        "Source",
+        "SourceScenes",
+        "SourceDirectory",
+        "SourceEDL",
+        "EDLApplyASCCDL",
+        "ASCCDLLayerNumber",
+        "ASCCDLColour",
+        "ASCCDLCategories",
+        "BLGResourceConflict",
+        "DestSelection",
+        "LUTDirectory",
+        "LUTLayerNum",
+        "LUTLayerColour",
+        "LUTCategories",
+        "CDLDirectory",
+        "CDLLayerNum",
+        "CDLLayerColour",
+        "CDLCategories",
+        "MatchBy",
+        "MatchQuality",
+        "PasteGrades",
+        "LayerZeroBehaviour",
+        "LayerZeroOverwrite",
+        "LayerZeroAudio",
+        "InputColourSpace",
+        "SourceShots",
+        "SourceShotCategories",
+        "DestShots",
+        "DestShotCategories",
+        "DetectGradeChanges",
+        "GradeChangedCategory",
+        "ClearUnchangedGrades",
+        "PasteLocation",
+        "LayerZeroCategories",
+        "LayerZeroExcludeCategories",
+        "PasteMetadata",
+        "MetadataColumns",
+        "AddExtraMetadata",
+        "OverwriteMetadata",
+        "PasteGroups",
+        "ShredComps",
+        "ShredProtectCategories",
+        "ShredExternalMattes",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -152,10 +198,5 @@ class MultiPasteSettings:
             "ShredProtectCategories": self.ShredProtectCategories,
             "ShredExternalMattes": self.ShredExternalMattes,
         }
-
-    def __repr__(self):
-        return "flapi.MultiPasteSettings(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "MultiPasteSettings", MultiPasteSettings.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # NewSceneOptions
@@ -6,7 +6,16 @@ import json
 # Options for create a new database or temporary scene
 #
 
-class NewSceneOptions:
+class NewSceneOptions(Value):
+
+    __slots__ = (
+        "format",
+        "colourspace",
+        "frame_rate",
+        "field_order",
+        "template",
+        "blg_template",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -41,10 +50,5 @@ class NewSceneOptions:
             "template": self.template,
             "blg_template": self.blg_template,
         }
-
-    def __repr__(self):
-        return "flapi.NewSceneOptions(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "NewSceneOptions", NewSceneOptions.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # OpenSceneStatus
@@ -6,7 +6,14 @@ import json
 # Status of scene opening or creation operation
 #
 
-class OpenSceneStatus:
+class OpenSceneStatus(Value):
+
+    __slots__ = (
+        "Done",
+        "Error",
+        "Progress",
+        "Message",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class OpenSceneStatus:
             "Progress": self.Progress,
             "Message": self.Message,
         }
-
-    def __repr__(self):
-        return "flapi.OpenSceneStatus(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "OpenSceneStatus", OpenSceneStatus.from_dict );
 
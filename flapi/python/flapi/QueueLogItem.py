@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # QueueLogItem
@@ -6,7 +6,16 @@ import json
 # Log Item from Queue Operation
 #
 
-class QueueLogItem:
+class QueueLogItem(Value):
+
+    __slots__ = (
+        "Time",
+        "Type",
+        "Task",
+        "Frame",
+        "Message",
+        "Detail",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -41,10 +50,5 @@ class QueueLogItem:
             "Message": self.Message,
             "Detail": self.Detail,
         }
-
-    def __repr__(self):
-        return "flapi.QueueLogItem(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "QueueLogItem", QueueLogItem.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # QueueOp
@@ -6,7 +6,14 @@ import json
 # Description of an Operation in a Queue
 #
 
-class QueueOp:
+class QueueOp(Value):
+
+    __slots__ = (
+        "ID",
+        "Description",
+        "SubmitUser",
+        "SubmitHost",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class QueueOp:
             "SubmitUser": self.SubmitUser,
             "SubmitHost": self.SubmitHost,
         }
-
-    def __repr__(self):
-        return "flapi.QueueOp(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "QueueOp", QueueOp.from_dict );
 
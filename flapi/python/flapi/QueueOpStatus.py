@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # QueueOpStatus
@@ -6,7 +6,18 @@ import json
 # Status of an Operation in a Queue
 #
 
-class QueueOpStatus:
+class QueueOpStatus(Value):
+
+    __slots__ = (
+        "ID",
+        "Status",
+        "Progress",
+        "ProgressText",
+        "TimeElapsed",
+        "TimeRemaining",
+        "Warnings",
+        "Errors",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -47,10 +58,5 @@ class QueueOpStatus:
             "Warnings": self.Warnings,
             "Errors": self.Errors,
         }
-
-    def __repr__(self):
-        return "flapi.QueueOpStatus(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "QueueOpStatus", QueueOpStatus.from_dict );
 
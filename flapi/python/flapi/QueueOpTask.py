@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # QueueOpTask
@@ -6,7 +6,17 @@ import json
 # Task information for FLAPI queue operation
 #
 
-class QueueOpTask:
+class QueueOpTask(Value):
+
+    __slots__ = (
+        "ID",
+        "Seq",
+        "Type",
+        "Desc",
+        "Skip",
+        "Params",
+        "Weight",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -44,10 +54,5 @@ class QueueOpTask:
             "Params": self.Params,
             "Weight": self.Weight,
         }
-
-    def __repr__(self):
-        return "flapi.QueueOpTask(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "QueueOpTask", QueueOpTask.from_dict );
 
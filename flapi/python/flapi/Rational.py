@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # Rational
@@ -6,7 +6,12 @@ import json
 # Holds a rational number.  Used in situations where exact ratios are required.
 #
 
-class Rational:
+class Rational(Value):
+
+    __slots__ = (
+        "Numerator",
+        "Denominator",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class Rational:
             "Numerator": self.Numerator,
             "Denominator": self.Denominator,
         }
-
-    def __repr__(self):
-        return "flapi.Rational(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "Rational", Rational.from_dict );
 
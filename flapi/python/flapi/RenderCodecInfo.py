@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # RenderCodecInfo
@@ -6,7 +6,13 @@ import json
 # Definition of a Codec that is supported for an image or movie file type
 #
 
-class RenderCodecInfo:
+class RenderCodecInfo(Value):
+
+    __slots__ = (
+        "Key",
+        "Text",
+        "Params",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -32,10 +38,5 @@ class RenderCodecInfo:
             "Text": self.Text,
             "Params": self.Params,
         }
-
-    def __repr__(self):
-        return "flapi.RenderCodecInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "RenderCodecInfo", RenderCodecInfo.from_dict );
 
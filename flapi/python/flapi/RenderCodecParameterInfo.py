@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # RenderCodecParameterInfo
@@ -6,7 +6,14 @@ import json
 # Definition of a parameter to an image or movie codec
 #
 
-class RenderCodecParameterInfo:
+class RenderCodecParameterInfo(Value):
+
+    __slots__ = (
+        "Key",
+        "Text",
+        "Type",
+        "Choices",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class RenderCodecParameterInfo:
             "Type": self.Type,
             "Choices": self.Choices,
         }
-
-    def __repr__(self):
-        return "flapi.RenderCodecParameterInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "RenderCodecParameterInfo", RenderCodecParameterInfo.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # RenderCodecParameterValue
@@ -6,7 +6,12 @@ import json
 # Definition of a valid value for a codec parameter
 #
 
-class RenderCodecParameterValue:
+class RenderCodecParameterValue(Value):
+
+    __slots__ = (
+        "Key",
+        "Text",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class RenderCodecParameterValue:
             "Key": self.Key,
             "Text": self.Text,
         }
-
-    def __repr__(self):
-        return "flapi.RenderCodecParameterValue(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "RenderCodecParameterValue", RenderCodecParameterValue.from_dict );
 
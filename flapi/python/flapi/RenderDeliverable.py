@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # RenderDeliverable
@@ -6,7 +6,48 @@ import json
 # This type is used to specify the render settings for an individual deliverable defined within a RenderSetup
 #
 
-class RenderDeliverable:
+class RenderDeliverable(Value):
+
+    __slots__ = (
+        "Name",
+        "Disabled",
+        "IsMovie",
+        "FileType",
+        "MovieCodec",
+        "AudioCodec",
+        "ImageOptions",
+        "FastStart",
+        "AudioSampleRate",
+        "AudioNumChannels",
+        "Container",
+        "OutputDirectory",
+        "FileNamePrefix",
+        "FileNamePostfix",
+        "FileNameNumDigits",
+        "FileNameNumber",
+        "FileNameExtension",
+        "ColourSpaceTag",
+        "RenderFormat",
+        "RenderResolution",
+        "RenderFrameRate",
+        "RenderFieldOrder",
+        "RenderDecodeQuality",
+        "RenderColourSpace",
+        "RenderVideoLUT",
+        "RenderLayer",
+        "RenderTrack",
+        "RenderMask",
+        "RenderMaskMode",
+        "RenderBurnin",
+        "RenderFlashBurnin",
+        "RenderDisableCache",
+        "HandleIncompleteStacks",
+        "HandleEmptyFrames",
+        "HandleError",
+        "EmbedTimecode",
+        "EmbedTape",
+        "EmbedClip",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -137,10 +178,5 @@ class RenderDeliverable:
             "EmbedTape": self.EmbedTape,
             "EmbedClip": self.EmbedClip,
         }
-
-    def __repr__(self):
-        return "flapi.RenderDeliverable(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "RenderDeliverable", RenderDeliverable.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # RenderFileTypeInfo
@@ -6,7 +6,14 @@ import json
 # Definition of an image or movie type
 #
 
-class RenderFileTypeInfo:
+class RenderFileTypeInfo(Value):
+
+    __slots__ = (
+        "Key",
+        "Text",
+        "Extensions",
+        "Params",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class RenderFileTypeInfo:
             "Extensions": self.Extensions,
             "Params": self.Params,
         }
-
-    def __repr__(self):
-        return "flapi.RenderFileTypeInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "RenderFileTypeInfo", RenderFileTypeInfo.from_dict );
 
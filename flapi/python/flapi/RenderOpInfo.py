@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # RenderOpInfo
@@ -6,7 +6,12 @@ import json
 # This type is returned to return information about render operations queued via QueueManager
 #
 
-class RenderOpInfo:
+class RenderOpInfo(Value):
+
+    __slots__ = (
+        "ID",
+        "Warning",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class RenderOpInfo:
             "ID": self.ID,
             "Warning": self.Warning,
         }
-
-    def __repr__(self):
-        return "flapi.RenderOpInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "RenderOpInfo", RenderOpInfo.from_dict );
 
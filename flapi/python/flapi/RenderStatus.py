@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # RenderStatus
@@ -6,7 +6,18 @@ import json
 # Status of render operation
 #
 
-class RenderStatus:
+class RenderStatus(Value):
+
+    __slots__ = (
+        "Status",
+        "Error",
+        "Total",
+        "Complete",
+        "Remaining",
+        "Failed",
+        "Progress",
+        "ProgressMessage",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -47,10 +58,5 @@ class RenderStatus:
             "Progress": self.Progress,
             "ProgressMessage": self.ProgressMessage,
         }
-
-    def __repr__(self):
-        return "flapi.RenderStatus(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "RenderStatus", RenderStatus.from_dict );
 
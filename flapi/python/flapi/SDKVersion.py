@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # SDKVersion
@@ -6,7 +6,14 @@ import json
 # Version information for 3rd-party SDKs used in the application
 #
 
-class SDKVersion:
+class SDKVersion(Value):
+
+    __slots__ = (
+        "Key",
+        "Name",
+        "Description",
+        "Version",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class SDKVersion:
             "Description": self.Description,
             "Version": self.Version,
         }
-
-    def __repr__(self):
-        return "flapi.SDKVersion(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "SDKVersion", SDKVersion.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # SceneInfo
@@ -6,7 +6,22 @@ import json
 # Return general information about the state of a scene
 #
 
-class SceneInfo:
+class SceneInfo(Value):
+
+    __slots__ = (
+        "CreatedDate",
+        "CreatedBy",
+        "CreatedVersion",
+        "OpenedDate",
+        "OpenedBy",
+        "OpenedVersion",
+        "ModifiedDate",
+        "ModifiedBy",
+        "ModifiedVersion",
+        "WorkingFormat",
+        "Notes",
+        "LastEDL",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -59,10 +74,5 @@ class SceneInfo:
             "Notes": self.Notes,
             "LastEDL": self.LastEDL,
         }
-
-    def __repr__(self):
-        return "flapi.SceneInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "SceneInfo", SceneInfo.from_dict );
 
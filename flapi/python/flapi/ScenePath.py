@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # ScenePath
@@ -6,7 +6,16 @@ import json
 # A ScenePath defines the host, job, folder and scene names required to create or open a FilmLight scene
 #
 
-class ScenePath:
+class ScenePath(Value):
+
+    __slots__ = (
+        "Type",
+        "Host",
+        "Job",
+        "Scene",
+        "Tag",
+        "Filename",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -41,10 +50,5 @@ class ScenePath:
             "Tag": self.Tag,
             "Filename": self.Filename,
         }
-
-    def __repr__(self):
-        return "flapi.ScenePath(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "ScenePath", ScenePath.from_dict );
 
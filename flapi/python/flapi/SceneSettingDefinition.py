@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # SceneSettingDefinition
@@ -6,7 +6,13 @@ import json
 # Type information for an SceneSettings parameter
 #
 
-class SceneSettingDefinition:
+class SceneSettingDefinition(Value):
+
+    __slots__ = (
+        "Type",
+        "Desc",
+        "Values",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -32,10 +38,5 @@ class SceneSettingDefinition:
             "Desc": self.Desc,
             "Values": self.Values,
         }
-
-    def __repr__(self):
-        return "flapi.SceneSettingDefinition(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "SceneSettingDefinition", SceneSettingDefinition.from_dict );
 
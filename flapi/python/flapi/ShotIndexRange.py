@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # ShotIndexRange
@@ -6,7 +6,12 @@ import json
 # shot index range
 #
 
-class ShotIndexRange:
+class ShotIndexRange(Value):
+
+    __slots__ = (
+        "FirstIndex",
+        "LastIndex",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -29,10 +34,5 @@ class ShotIndexRange:
             "FirstIndex": self.FirstIndex,
             "LastIndex": self.LastIndex,
         }
-
-    def __repr__(self):
-        return "flapi.ShotIndexRange(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "ShotIndexRange", ShotIndexRange.from_dict );
 
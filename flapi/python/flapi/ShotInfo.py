@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # ShotInfo
@@ -6,7 +6,14 @@ import json
 # Shot info object
 #
 
-class ShotInfo:
+class ShotInfo(Value):
+
+    __slots__ = (
+        "ShotId",
+        "StartFrame",
+        "EndFrame",
+        "PosterFrame",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -35,10 +42,5 @@ class ShotInfo:
             "EndFrame": self.EndFrame,
             "PosterFrame": self.PosterFrame,
         }
-
-    def __repr__(self):
-        return "flapi.ShotInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "ShotInfo", ShotInfo.from_dict );
 
@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # StillExportSettings
@@ -6,7 +6,31 @@ import json
 # Settings to use for Still exports
 #
 
-class StillExportSettings:
+class StillExportSettings(Value):
+
+    __slots__ = (
+        "Source",
+        "Filter",
+        "Category",
+        "CategoryMatch",
+        "Frames",
+        "MarkCategory",
+        "Stereo",
+        "Directory",
+        "Overwrite",
+        "FileType",
+        "ImageOptions",
+        "Path",
+        "Filename",
+        "ColourSpace",
+        "Format",
+        "Resolution",
+        "DecodeQuality",
+        "Mask",
+        "MaskMode",
+        "Burnin",
+        "Truelight",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -86,10 +110,5 @@ class StillExportSettings:
             "Burnin": self.Burnin,
             "Truelight": self.Truelight,
         }
-
-    def __repr__(self):
-        return "flapi.StillExportSettings(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "StillExportSettings", StillExportSettings.from_dict );
 
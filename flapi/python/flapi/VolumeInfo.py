@@ -1,4 +1,4 @@
-from . import Library
+from . import Library, Value
 import json
 
 # VolumeInfo
@@ -6,7 +6,15 @@ import json
 # Definition of a volume attached to, or accessible from, a FilmLight system
 #
 
-class VolumeInfo:
+class VolumeInfo(Value):
+
+    __slots__ = (
+        "Key",
+        "Name",
+        "Label",
+        "Zone",
+        "Path",
+    )
     
     # Constructor
     def __init__(self, obj=None, **kwargs):
@@ -38,10 +46,5 @@ class VolumeInfo:
             "Zone": self.Zone,
             "Path": self.Path,
         }
-
-    def __repr__(self):
-        return "flapi.VolumeInfo(%s)" % (vars(self))
-    def __str__(self):
-        return "%s" % vars(self)
 Library.register_decoder( "VolumeInfo", VolumeInfo.from_dict );
 
@@ -0,0 +1,393 @@
+#
+# FilmLight API Python bindings - asyncio client
+#
+# AsyncConnection speaks the same JSON-RPC protocol as flapi.Connection
+# over an asyncio websocket (requires the 'websockets' package).
+#
+# The generated interface classes are shared with flapi.Connection. When
+# bound to an AsyncConnection their methods return awaitables:
+#
+#   async with AsyncConnection("ws.baselight1", username=..., token=...) as conn:
+#       path = await conn.Scene.parse_path("fs.flux1:job:scene")
+#       scene = await conn.Scene.open_scene(path, { flapi.OPENFLAG_READ_ONLY })
+#       shot_infos = await scene.get_shot_ids()
+#       shots = await conn.gather(*[scene.get_shot(i.ShotId) for i in shot_infos])
+#
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import collections
+import traceback
+import weakref
+
+import websockets
+
+from . import Library, Connection, APIJSONEncoder, FLAPIException
+
+###############################################################################
+#
+# AsyncConnection
+#
+# Any number of coroutines may share one AsyncConnection. Requests are
+# queued for a single writer task and replies are matched by message id
+# by a single reader task, so calls from different coroutines interleave
+# on the wire without waiting for each other.
+#
+# 'max_in_flight' bounds the number of requests awaiting a reply, which
+# keeps memory bounded when many scenes are driven at once.
+
+class AsyncConnection:
+
+    def __init__(self, hostname="localhost", port=1984, username=None, password=None, token=None, max_in_flight=256):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.token = token
+        self.max_in_flight = max_in_flight
+
+        # Map of msg id to asyncio.Future for pending method calls
+        self.pending_replies = {}
+
+        self.websocket = None
+        self.outgoing = None
+        self.in_flight = None
+        self.reader_task = None
+        self.writer_task = None
+        self.id = 1
+        if os.environ.get("FLAPI_DEBUG") == "1":
+            self.debug = 1
+        else:
+            self.debug = 0
+        self.handles = weakref.WeakValueDictionary()
+        self.setup_interfaces()
+        self.set_json_backend(os.environ.get("FLAPI_JSON"))
+
+        self.release_queue = {}
+        self.release_threshold = 0
+        self.release_scopes = []
+        self.release_lock = threading.Lock()
+        self.collected_ids = collections.deque()
+
+        self.stats = None
+        self.stats_pending = {}
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        await self.close()
+        return False
+
+    def set_debug(self, debug):
+        self.debug = debug
+
+    async def connect(self):
+        if self.websocket != None:
+            return True
+
+        try:
+            self.websocket = await websockets.connect(
+                "ws://%s:%d/" % (self.hostname, self.port),
+                max_size=None
+            )
+        except Exception as err:
+            raise FLAPIException( "Cannot connect to %s: %s" % (self.hostname, err) )
+
+        self.outgoing = asyncio.Queue()
+        self.in_flight = asyncio.Semaphore(self.max_in_flight)
+        self.reader_task = asyncio.ensure_future(self.reader())
+        self.writer_task = asyncio.ensure_future(self.writer())
+
+        # Same token lookup for localhost as Connection.connect_ws()
+        curUser = os.environ.get("USER")
+        curToken = os.environ.get("FLAPI_TOKEN")
+        if curToken is None:
+            curToken = Connection.read_token()
+        if ((self.hostname == "localhost") and
+                (self.username == None or self.username == curUser) and
+                (self.password == None) and
+                (self.token == None) and
+                (curToken != None)):
+            self.username = curUser
+            self.token = curToken
+
+        args = {
+            "method": "connect",
+            "username": self.username,
+            "password": self.password,
+            "token": self.token,
+        }
+
+        try:
+            result = await self.send_message(args)
+            if result != 1:
+                raise FLAPIException( "Authentication failed" )
+        except Exception as err:
+            await self.close()
+            raise FLAPIException( "Cannot connect to %s: %s" % (self.hostname, err) )
+
+        return True
+
+    def is_connected(self):
+        return (self.websocket != None)
+
+    async def close(self):
+        if self.websocket != None and (self.release_queue or self.collected_ids):
+            self.flush_releases()
+            try:
+                await asyncio.wait_for(self.outgoing.join(), 5.0)
+            except Exception:
+                pass
+
+        for task in (self.reader_task, self.writer_task):
+            if task != None:
+                task.cancel()
+        self.reader_task = None
+        self.writer_task = None
+
+        if self.websocket != None:
+            try:
+                await self.websocket.close()
+            except Exception:
+                pass
+            self.websocket = None
+
+        self.fail_pending( FLAPIException( "Connection closed" ) )
+
+    # gather( *awaitables )
+    #
+    # Convenience wrapper around asyncio.gather()
+
+    async def gather(self, *awaitables, return_exceptions=False):
+        return await asyncio.gather(*awaitables, return_exceptions=return_exceptions)
+
+    ###########################################################################
+    # Private
+    ###########################################################################
+
+    setup_interfaces = Connection.setup_interfaces
+    __getattr__ = Connection.__getattr__
+    set_json_backend = Connection.set_json_backend
+    decode_obj = Connection.decode_obj
+    decode_tree = Connection.decode_tree
+    parse_reply = Connection.parse_reply
+    register_handle = Connection.register_handle
+    release_handle = Connection.release_handle
+    drain_collected = Connection.drain_collected
+    queue_forget = Connection.queue_forget
+    forget_done = Connection.forget_done
+    flush_releases = Connection.flush_releases
+    release_scope = Connection.release_scope
+    enable_stats = Connection.enable_stats
+    disable_stats = Connection.disable_stats
+    record_request = Connection.record_request
+    record_reply = Connection.record_reply
+
+    # Queue message for the writer task
+    #
+    # Returns an asyncio.Future resolved with the reply result if a reply
+    # is expected, otherwise None. This is a plain function so that the
+    # generated interface methods (which return self.conn.call(...))
+    # hand an awaitable back to the caller.
+    #
+    def send_message(self, msg, block=True, callback=None):
+        if self.websocket == None:
+            raise FLAPIException( "Not connected" )
+
+        future = None
+        if block == True or callback != None:
+            msg["id"] = self.id
+            self.id += 1
+            future = asyncio.get_event_loop().create_future()
+            self.pending_replies[msg["id"]] = future
+            if callback != None:
+                future.add_done_callback(lambda f: callback())
+
+        self.outgoing.put_nowait(msg)
+
+        if block == True:
+            return future
+
+    def call(self, target, method, params, block=True, callback=None):
+        if len(self.release_queue) + len(self.collected_ids) >= max(self.release_threshold, 1):
+            self.flush_releases()
+
+        msg = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "target": target,
+            "params": params
+        }
+        return self.send_message(msg, block, callback)
+
+    def connect_signal(self, target, signal):
+        msg = {
+            "jsonrpc": "2.0",
+            "method": "connect_signal",
+            "target": target,
+            "params": { "signal": signal }
+        }
+        return self.send_message(msg, True, None)
+
+    def disconnect_signal(self, target, signal):
+        msg = {
+            "jsonrpc": "2.0",
+            "method": "disconnect_signal",
+            "target": target,
+            "params": { "signal": signal }
+        }
+        return self.send_message(msg, True, None)
+
+    def forget(self, target):
+        msg = {
+            "jsonrpc": "2.0",
+            "method": "forget",
+            "target": target,
+        }
+        return self.send_message(msg, True, None)
+
+    def fail_pending(self, ex):
+        pending = self.pending_replies
+        self.pending_replies = {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ex)
+
+    # Writer task: send queued messages, holding an in-flight slot for
+    # every message that expects a reply
+    #
+    async def writer(self):
+        try:
+            while True:
+                msg = await self.outgoing.get()
+                if msg.get("id") != None:
+                    await self.in_flight.acquire()
+                msg_json = json.dumps(msg, cls=APIJSONEncoder)
+                if self.debug:
+                    print( "FLAPI Client: Sending JSON:\n%s\n" % msg_json )
+                if self.stats != None:
+                    self.record_request(msg, msg_json)
+                await self.websocket.send(msg_json)
+                self.outgoing.task_done()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            self.connection_lost(err)
+
+    # Reader task: route replies to their futures and dispatch signals
+    #
+    async def reader(self):
+        try:
+            while True:
+                buf = await self.websocket.recv()
+                if self.debug:
+                    print( "FLAPI Client: Received JSON:\n%s\n" % buf )
+
+                reply = self.parse_reply(buf)
+
+                # Signal handlers run in their own task, so that they can
+                # make calls on this connection without blocking the reader
+                if reply.get("method") == "signal":
+                    asyncio.ensure_future(self.handle_signal(reply))
+                    continue
+
+                msgid = reply.get("id")
+                future = self.pending_replies.pop(msgid, None)
+                if future == None:
+                    continue
+                self.in_flight.release()
+                if future.done():
+                    continue
+
+                error = reply.get("error")
+                if error != None:
+                    future.set_exception( FLAPIException( error.get("message") ) )
+                else:
+                    future.set_result( reply.get("result") )
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            self.connection_lost(err)
+
+    # Called by the reader or writer task when the websocket fails: the
+    # connection is marked closed, so that send_message() raises "Not
+    # connected" like Connection does after losing its session, instead
+    # of queueing messages nobody sends or answers
+    #
+    def connection_lost(self, err):
+        ws = self.websocket
+        self.websocket = None
+
+        current = asyncio.current_task()
+        for task in (self.reader_task, self.writer_task):
+            if task != None and task is not current:
+                task.cancel()
+        self.reader_task = None
+        self.writer_task = None
+
+        while True:
+            try:
+                self.outgoing.get_nowait()
+                self.outgoing.task_done()
+            except asyncio.QueueEmpty:
+                break
+
+        self.fail_pending( FLAPIException( "Connection lost: %s" % err ) )
+
+        if ws != None:
+            asyncio.ensure_future(self.close_websocket(ws))
+
+    async def close_websocket(self, ws):
+        try:
+            await ws.close()
+        except Exception:
+            pass
+
+    # Dispatch signal to the handlers connected with Interface.connect().
+    # Handlers may be plain functions or coroutine functions.
+    #
+    async def handle_signal(self, reply):
+        target = reply["target"]
+        obj = self.handles.get(target)
+        params = reply.get("params")
+        if params == None:
+            print( "FLAPI Client: 'signal' message has no params" )
+            return
+
+        signame = params.get("signal")
+        if signame == None:
+            print( "FLAPI Client: 'signal' params has no signal name" )
+            return
+
+        sigargs = params.get("args")
+
+        sigres = None
+        if obj != None:
+            for h in list(obj.handlers.get(signame) or ()):
+                try:
+                    r = h(obj, signame, sigargs)
+                    if asyncio.iscoroutine(r):
+                        r = await r
+                    if sigres == None and r != None:
+                        sigres = r
+                except Exception:
+                    print( "Failed to dispatch signal '%s' to handler '%s'" % (signame, h) )
+                    traceback.print_exc(file=sys.stdout)
+                    sys.stdout.flush()
+
+        if params.get("sync") == 1 and self.websocket != None:
+            sigreply = {
+                "jsonrpc": "2.0",
+                "method": "signal_result",
+                "target": target,
+                "params": {
+                    "sigid": params.get("sigid"),
+                    "result": sigres
+                }
+            }
+            self.send_message(sigreply, False, None)
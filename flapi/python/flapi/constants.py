@@ -0,0 +1,884 @@
+#
+# FilmLight API Python bindings - constants
+#
+# Values for the enumerated settings of the API. The enum.Enum class for
+# each group of values is defined in enums.py.
+#
+
+#  AUDIOSEQ_TYPE : Type of Audio in an Audio Sequence
+#    AUDIOSEQTYPE_NONE : No Audio
+#    AUDIOSEQTYPE_FILE : Audio File
+#    AUDIOSEQTYPE_STEMS : Audio Stems
+#    AUDIOSEQTYPE_MOVIE : Audio from Movie
+#    AUDIOSEQTYPE_TONE : Audio is generated Tone
+AUDIOSEQTYPE_NONE="AST_NONE"
+AUDIOSEQTYPE_FILE="AST_FILE"
+AUDIOSEQTYPE_STEMS="AST_STEMS"
+AUDIOSEQTYPE_MOVIE="AST_MOVIE"
+AUDIOSEQTYPE_TONE="AST_TONE"
+#  AUDIOSYNCSTATUS : Status info related to audio sync progress
+#    AUDIOSYNCSTATUS_FAIL : Failure during audio sync operation
+#    AUDIOSYNCSTATUS_WARN : Warning during audio sync operation
+#    AUDIOSYNCSTATUS_INFO : Info from audio sync operation
+#    AUDIOSYNCSTATUS_NOTE : Note from audio sync operation
+#    AUDIOSYNCSTATUS_SCAN : Filesystem scanning progress
+AUDIOSYNCSTATUS_FAIL="FAIL"
+AUDIOSYNCSTATUS_WARN="WARN"
+AUDIOSYNCSTATUS_INFO="INFO"
+AUDIOSYNCSTATUS_NOTE="NOTE"
+AUDIOSYNCSTATUS_SCAN="SCAN"
+#  AUDIOSYNC_CRITERIA : Values for AudioSyncSettings Criteria
+#    AUDIOSYNC_CRITERIA_TIMECODE : Timecode
+#    AUDIOSYNC_CRITERIA_SRCTIMECODE : Source Timecode
+#    AUDIOSYNC_CRITERIA_DATESRCTIMECODE : Date & Source Timecode
+#    AUDIOSYNC_CRITERIA_SCENETAKE : Scene & Take
+#    AUDIOSYNC_CRITERIA_SHOTSCENETAKE : Shot Scene & Take
+AUDIOSYNC_CRITERIA_TIMECODE="Timecode"
+AUDIOSYNC_CRITERIA_SRCTIMECODE="SrcTimecode"
+AUDIOSYNC_CRITERIA_DATESRCTIMECODE="DateSrcTimecode"
+AUDIOSYNC_CRITERIA_SCENETAKE="SceneTake"
+AUDIOSYNC_CRITERIA_SHOTSCENETAKE="ShotSceneTake"
+#  AUDIOSYNC_FPS : Values for AudioSyncSettings FPS
+#    AUDIOSYNC_FPS_23976 : 23.976 fps
+#    AUDIOSYNC_FPS_24000 : 24 fps
+#    AUDIOSYNC_FPS_25000 : 25 fps
+#    AUDIOSYNC_FPS_29970 : 29.97 fps
+#    AUDIOSYNC_FPS_2997DF : 29.97 fps DF
+#    AUDIOSYNC_FPS_30000 : 30 fps
+#    AUDIOSYNC_FPS_48000 : 48 fps
+#    AUDIOSYNC_FPS_50000 : 50 fps
+#    AUDIOSYNC_FPS_59940 : 59.94 fps
+#    AUDIOSYNC_FPS_60000 : 60 fps
+AUDIOSYNC_FPS_23976="23976"
+AUDIOSYNC_FPS_24000="24000"
+AUDIOSYNC_FPS_25000="25000"
+AUDIOSYNC_FPS_29970="29970"
+AUDIOSYNC_FPS_2997DF="2997DF"
+AUDIOSYNC_FPS_30000="30000"
+AUDIOSYNC_FPS_48000="48000"
+AUDIOSYNC_FPS_50000="50000"
+AUDIOSYNC_FPS_59940="59940"
+AUDIOSYNC_FPS_60000="60000"
+#  AUDIOSYNC_METADATA : Values for AudioSyncSettings Metadata
+#    AUDIOSYNC_METADATA_SCENETAKE : Scene & Take
+#    AUDIOSYNC_METADATA_DATE : Date
+AUDIOSYNC_METADATA_SCENETAKE="SceneTake"
+AUDIOSYNC_METADATA_DATE="Date"
+#  AUDIOSYNC_RATIO : Values for AudioSyncSettings Ratio
+#    AUDIOSYNC_RATIO_1_TO_1 : 1:1
+#    AUDIOSYNC_RATIO_1001_TO_1000 : 1001:1000
+#    AUDIOSYNC_RATIO_1000_TO_1001 : 1000:1001
+#    AUDIOSYNC_RATIO_25_TO_24 : 25:24
+#    AUDIOSYNC_RATIO_24_TO_25 : 24:25
+AUDIOSYNC_RATIO_1_TO_1="1:1"
+AUDIOSYNC_RATIO_1001_TO_1000="1001:1000"
+AUDIOSYNC_RATIO_1000_TO_1001="1000:1001"
+AUDIOSYNC_RATIO_25_TO_24="25:24"
+AUDIOSYNC_RATIO_24_TO_25="24:25"
+#  AUDIOSYNC_READLTC : Values for AudioSyncSettings ReadLTC
+#    AUDIOSYNC_READLTC_NO : No
+#    AUDIOSYNC_READLTC_CHANNEL : From Channel
+#    AUDIOSYNC_READLTC_TRACK : From Track
+AUDIOSYNC_READLTC_NO="No"
+AUDIOSYNC_READLTC_CHANNEL="Channel"
+AUDIOSYNC_READLTC_TRACK="Track"
+#  AUDIOSYNC_SUBSEARCH : Values for AudioSyncSettings SubSearch
+#    AUDIOSYNC_SUBSEARCH_ALL : All Sub-Directories
+#    AUDIOSYNC_SUBSEARCH_NAMED : Sub-Directories Named
+#    AUDIOSYNC_SUBSEARCH_NEAREST : Nearest Sub-Directory Named
+AUDIOSYNC_SUBSEARCH_ALL="All"
+AUDIOSYNC_SUBSEARCH_NAMED="Named"
+AUDIOSYNC_SUBSEARCH_NEAREST="Nearest"
+#  AUDIO_RATE : Audio Sample Rate
+#    AUDIO_RATE_44100 : 44.1 kHz
+#    AUDIO_RATE_48000 : 48 kHz
+#    AUDIO_RATE_96000 : 96 kHz
+AUDIO_RATE_44100=44100
+AUDIO_RATE_48000=48000
+AUDIO_RATE_96000=96000
+#  BLGEXPORT_LOCKGRADE : Values for BLGExportSettings LockGrade
+#    BLGEXPORT_LOCKGRADE_READWRITE : No
+#    BLGEXPORT_LOCKGRADE_LOCKED : Yes
+BLGEXPORT_LOCKGRADE_READWRITE="ReadWrite"
+BLGEXPORT_LOCKGRADE_LOCKED="Locked"
+#  BLGEXPORT_SCALE : Values for BLGExportSettings Scale
+#    BLGEXPORT_SCALE_1 : Full
+#    BLGEXPORT_SCALE_2 : Half
+#    BLGEXPORT_SCALE_4 : Quarter
+#    BLGEXPORT_SCALE_16 : Sixteenth
+BLGEXPORT_SCALE_1=1
+BLGEXPORT_SCALE_2=2
+BLGEXPORT_SCALE_4=4
+BLGEXPORT_SCALE_16=16
+#  BURNIN_BORDER : Define border type for burnin text item
+#    BURNIN_BORDER_NONE : No border
+#    BURNIN_BORDER_RECTANGLE : Rectangle
+#    BURNIN_BORDER_LOZENGE : Lozenge
+BURNIN_BORDER_NONE="none"
+BURNIN_BORDER_RECTANGLE="rect"
+BURNIN_BORDER_LOZENGE="loz"
+#  BURNIN_HALIGN : Define horizontal alignment of burnin text item
+#    BURNIN_HALIGN_LEFT : Left aligned
+#    BURNIN_HALIGN_CENTER : Center aligned
+#    BURNIN_HALIGN_RIGHT : Right aligned
+BURNIN_HALIGN_LEFT=0
+BURNIN_HALIGN_CENTER=1
+BURNIN_HALIGN_RIGHT=2
+#  BURNIN_ITEM_TYPE : Specify burnin item type
+#    BURNIN_ITEM_TEXT : Text item
+#    BURNIN_ITEM_IMAGE : Image item
+BURNIN_ITEM_TEXT="text"
+BURNIN_ITEM_IMAGE="image"
+#  BURNIN_VALIGN : Define vertical alignment of burnin text item
+#    BURNIN_VALIGN_TOP : Top aligned
+#    BURNIN_VALIGN_MIDDLE : Middle aligned
+#    BURNIN_VALIGN_BOTTOM : Bottom aligned
+BURNIN_VALIGN_TOP=0
+BURNIN_VALIGN_MIDDLE=1
+BURNIN_VALIGN_BOTTOM=2
+#  CDLEXPORT_CDLLAYER : Values for CDLExportSettings CDLLayer
+#    CDLEXPORT_CDLLAYER_TOP : Top
+#    CDLEXPORT_CDLLAYER_BOTTOM : Bottom
+#    CDLEXPORT_CDLLAYER_CUSTOM : Layer n
+CDLEXPORT_CDLLAYER_TOP="top"
+CDLEXPORT_CDLLAYER_BOTTOM="bottom"
+CDLEXPORT_CDLLAYER_CUSTOM="custom"
+#  CDLEXPORT_FORMAT : Values for CDLExportSettings Format
+#    CDLEXPORT_FORMAT_CC : .cc file	Color Correction, one correction per file
+#    CDLEXPORT_FORMAT_CCC : .ccc file	Color Correction Collection, all corrections in one file
+CDLEXPORT_FORMAT_CC="CC"
+CDLEXPORT_FORMAT_CCC="CCC"
+#  CUBEEXPORT_CUBERESOLUTION : Values for CubeExportSettings CubeResolution
+#    CUBEEXPORT_CUBERESOLUTION_DEFAULT : Default
+#    CUBEEXPORT_CUBERESOLUTION_16 : 16x16x16
+#    CUBEEXPORT_CUBERESOLUTION_17 : 17x17x17
+#    CUBEEXPORT_CUBERESOLUTION_32 : 32x32x32
+#    CUBEEXPORT_CUBERESOLUTION_33 : 33x33x33
+#    CUBEEXPORT_CUBERESOLUTION_64 : 64x64x64
+CUBEEXPORT_CUBERESOLUTION_DEFAULT=-1
+CUBEEXPORT_CUBERESOLUTION_16=16
+CUBEEXPORT_CUBERESOLUTION_17=17
+CUBEEXPORT_CUBERESOLUTION_32=32
+CUBEEXPORT_CUBERESOLUTION_33=33
+CUBEEXPORT_CUBERESOLUTION_64=64
+#  CUBEEXPORT_EXTENDEDRANGES : Values for CubeExportSettings ExtendedRanges
+#    CUBEEXPORT_EXTENDEDRANGES_NO : No
+#    CUBEEXPORT_EXTENDEDRANGES_LINEAR : Linear
+#    CUBEEXPORT_EXTENDEDRANGES_LOG : Log
+CUBEEXPORT_EXTENDEDRANGES_NO="No"
+CUBEEXPORT_EXTENDEDRANGES_LINEAR="Linear"
+CUBEEXPORT_EXTENDEDRANGES_LOG="Log"
+#  CUBEEXPORT_LUT1OPTIONS : Values for CubeExportSettings LUT1Options
+#    CUBEEXPORT_LUT1OPTIONS_INPUT : Input Transform
+#    CUBEEXPORT_LUT1OPTIONS_GRADE : Grade
+#    CUBEEXPORT_LUT1OPTIONS_OUTPUT : Output Transform
+CUBEEXPORT_LUT1OPTIONS_INPUT="Input"
+CUBEEXPORT_LUT1OPTIONS_GRADE="Grade"
+CUBEEXPORT_LUT1OPTIONS_OUTPUT="Output"
+#  CUBEEXPORT_LUT2OPTIONS : Values for CubeExportSettings LUT2Options
+#    CUBEEXPORT_LUT2OPTIONS_INPUT : Input Transform
+#    CUBEEXPORT_LUT2OPTIONS_GRADE : Grade
+#    CUBEEXPORT_LUT2OPTIONS_OUTPUT : Output Transform
+CUBEEXPORT_LUT2OPTIONS_INPUT="Input"
+CUBEEXPORT_LUT2OPTIONS_GRADE="Grade"
+CUBEEXPORT_LUT2OPTIONS_OUTPUT="Output"
+#  CUBEEXPORT_LUT3OPTIONS : Values for CubeExportSettings LUT3Options
+#    CUBEEXPORT_LUT3OPTIONS_INPUT : Input Transform
+#    CUBEEXPORT_LUT3OPTIONS_GRADE : Grade
+#    CUBEEXPORT_LUT3OPTIONS_OUTPUT : Output Transform
+CUBEEXPORT_LUT3OPTIONS_INPUT="Input"
+CUBEEXPORT_LUT3OPTIONS_GRADE="Grade"
+CUBEEXPORT_LUT3OPTIONS_OUTPUT="Output"
+#  CUBEEXPORT_LUTFORMAT : Values for CubeExportSettings LUTFormat
+#    CUBEEXPORT_LUTFORMAT_TRUELIGHT : Truelight cube
+#    CUBEEXPORT_LUTFORMAT_TRUELIGHT_1D : Truelight 1D
+#    CUBEEXPORT_LUTFORMAT_AMIRA : AMIRA
+#    CUBEEXPORT_LUTFORMAT_ARRI : Arri
+#    CUBEEXPORT_LUTFORMAT_AUTODESK : Autodesk
+#    CUBEEXPORT_LUTFORMAT_AUTODESK_1D : Autodesk 1D
+#    CUBEEXPORT_LUTFORMAT_AUTODESK_1DF : Autodesk 1D half float
+#    CUBEEXPORT_LUTFORMAT_AUTODESK_MESH : Autodesk Lustre (Mesh)
+#    CUBEEXPORT_LUTFORMAT_AUTODESK_CTF : Autodesk CTF
+#    CUBEEXPORT_LUTFORMAT_BMD : BMD
+#    CUBEEXPORT_LUTFORMAT_BARCO : Barco
+#    CUBEEXPORT_LUTFORMAT_BLACKMAGIC : BlackMagic
+#    CUBEEXPORT_LUTFORMAT_BLACKMAGIC_1D : BlackMagic 1D
+#    CUBEEXPORT_LUTFORMAT_CANON_1D : Canon gamma 1D
+#    CUBEEXPORT_LUTFORMAT_CANON_3D : Canon gamut 3D
+#    CUBEEXPORT_LUTFORMAT_CINESPACE : CineSpace
+#    CUBEEXPORT_LUTFORMAT_COLORFRONT_1D : Colorfront 1D
+#    CUBEEXPORT_LUTFORMAT_COLORFRONT_3D : Colorfront 3D
+#    CUBEEXPORT_LUTFORMAT_DVS : DVS
+#    CUBEEXPORT_LUTFORMAT_DVS_1D : DVS 1D
+#    CUBEEXPORT_LUTFORMAT_DAVINCI : DaVinci
+#    CUBEEXPORT_LUTFORMAT_EVERTZ : Evertz
+#    CUBEEXPORT_LUTFORMAT_ICC : ICC
+#    CUBEEXPORT_LUTFORMAT_IRIDAS : IRIDAS
+#    CUBEEXPORT_LUTFORMAT_IRIDAS_1D : IRIDAS 1D
+#    CUBEEXPORT_LUTFORMAT_LUTHER : LUTher
+#    CUBEEXPORT_LUTFORMAT_NUCODA : Nucoda
+#    CUBEEXPORT_LUTFORMAT_PANASONIC : Panasonic
+#    CUBEEXPORT_LUTFORMAT_PANDORA : Pandora
+#    CUBEEXPORT_LUTFORMAT_QUANTEL : Quantel
+#    CUBEEXPORT_LUTFORMAT_QUANTEL_65 : Quantel 65x65x65
+#    CUBEEXPORT_LUTFORMAT_SCRATCH : Scratch
+#    CUBEEXPORT_LUTFORMAT_SONY : Sony
+#    CUBEEXPORT_LUTFORMAT_SONY_BVME : Sony BVME
+CUBEEXPORT_LUTFORMAT_TRUELIGHT="Truelight"
+CUBEEXPORT_LUTFORMAT_TRUELIGHT_1D="Truelight_1D"
+CUBEEXPORT_LUTFORMAT_AMIRA="AMIRA"
+CUBEEXPORT_LUTFORMAT_ARRI="Arri"
+CUBEEXPORT_LUTFORMAT_AUTODESK="Autodesk"
+CUBEEXPORT_LUTFORMAT_AUTODESK_1D="Autodesk_1D"
+CUBEEXPORT_LUTFORMAT_AUTODESK_1DF="Autodesk_1Df"
+CUBEEXPORT_LUTFORMAT_AUTODESK_MESH="Autodesk_Mesh"
+CUBEEXPORT_LUTFORMAT_AUTODESK_CTF="Autodesk_ctf"
+CUBEEXPORT_LUTFORMAT_BMD="BMD"
+CUBEEXPORT_LUTFORMAT_BARCO="Barco"
+CUBEEXPORT_LUTFORMAT_BLACKMAGIC="BlackMagic"
+CUBEEXPORT_LUTFORMAT_BLACKMAGIC_1D="BlackMagic_1D"
+CUBEEXPORT_LUTFORMAT_CANON_1D="Canon_1D"
+CUBEEXPORT_LUTFORMAT_CANON_3D="Canon_3D"
+CUBEEXPORT_LUTFORMAT_CINESPACE="CineSpace"
+CUBEEXPORT_LUTFORMAT_COLORFRONT_1D="Colorfront_1D"
+CUBEEXPORT_LUTFORMAT_COLORFRONT_3D="Colorfront_3D"
+CUBEEXPORT_LUTFORMAT_DVS="DVS"
+CUBEEXPORT_LUTFORMAT_DVS_1D="DVS_1D"
+CUBEEXPORT_LUTFORMAT_DAVINCI="DaVinci"
+CUBEEXPORT_LUTFORMAT_EVERTZ="Evertz"
+CUBEEXPORT_LUTFORMAT_ICC="ICC"
+CUBEEXPORT_LUTFORMAT_IRIDAS="IRIDAS"
+CUBEEXPORT_LUTFORMAT_IRIDAS_1D="IRIDAS_1D"
+CUBEEXPORT_LUTFORMAT_LUTHER="LUTher"
+CUBEEXPORT_LUTFORMAT_NUCODA="Nucoda"
+CUBEEXPORT_LUTFORMAT_PANASONIC="Panasonic"
+CUBEEXPORT_LUTFORMAT_PANDORA="Pandora"
+CUBEEXPORT_LUTFORMAT_QUANTEL="Quantel"
+CUBEEXPORT_LUTFORMAT_QUANTEL_65="Quantel_65"
+CUBEEXPORT_LUTFORMAT_SCRATCH="Scratch"
+CUBEEXPORT_LUTFORMAT_SONY="Sony"
+CUBEEXPORT_LUTFORMAT_SONY_BVME="Sony_BVME"
+#  CUBEEXPORT_LUTRESOLUTION : Values for CubeExportSettings LUTResolution
+#    CUBEEXPORT_LUTRESOLUTION_DEFAULT : Default
+#    CUBEEXPORT_LUTRESOLUTION_1024 : 1024
+#    CUBEEXPORT_LUTRESOLUTION_4096 : 4096
+#    CUBEEXPORT_LUTRESOLUTION_16384 : 16384
+CUBEEXPORT_LUTRESOLUTION_DEFAULT=-1
+CUBEEXPORT_LUTRESOLUTION_1024=1024
+CUBEEXPORT_LUTRESOLUTION_4096=4096
+CUBEEXPORT_LUTRESOLUTION_16384=16384
+#  CUBEEXPORT_NUMLUTS : Values for CubeExportSettings NumLUTs
+#    CUBEEXPORT_NUMLUTS_1 : 1
+#    CUBEEXPORT_NUMLUTS_2 : 2
+#    CUBEEXPORT_NUMLUTS_3 : 3
+CUBEEXPORT_NUMLUTS_1=1
+CUBEEXPORT_NUMLUTS_2=2
+CUBEEXPORT_NUMLUTS_3=3
+#  DECODEPARAM_TYPE : Data type for a DecodeParameterDefinition
+#    DECODEPARAMTYPE_INTEGER : Integer value
+#    DECODEPARAMTYPE_FLOAT : Floating-point value
+#    DECODEPARAMTYPE_BOOLEAN : Boolean value, represented as 1 or 0
+#    DECODEPARAMTYPE_CHOICE : A choice for a set of discrete values
+#    DECODEPARAMTYPE_FILE : Filename or path to a file
+DECODEPARAMTYPE_INTEGER="Integer"
+DECODEPARAMTYPE_FLOAT="Float"
+DECODEPARAMTYPE_BOOLEAN="Boolean"
+DECODEPARAMTYPE_CHOICE="Choice"
+DECODEPARAMTYPE_FILE="File"
+#  DECODEQUALITY : Decode Qulity to use for decoding source images for RAW codecs
+#    DECODEQUALITY_HIGH : Use highest quality RAW decode
+#    DECODEQUALITY_OPTIMISED : Use nearest decode quality for render format/resolution
+#    DECODEQUALITY_DRAFT : Use fastest decode quality
+DECODEQUALITY_HIGH="GMDQ_OPTIMISED_UNLESS_HIGH"
+DECODEQUALITY_OPTIMISED="GMDQ_OPTIMISED"
+DECODEQUALITY_DRAFT="GMDQ_DRAFT"
+#  DIAGSTATUS : Status of diagnostic test
+#    DIAG_READY : Ready to run
+#    DIAG_WAITING : Waiting on pre-requisite test to complete
+#    DIAG_RUNNING : Test is running
+#    DIAG_PASS : Diagnostic passed
+#    DIAG_WARNING : Diagnostic completed with warnings
+#    DIAG_FAILED : Diagnostiic test failed
+#    DIAG_SKIP : Skipped
+DIAG_READY="ready"
+DIAG_WAITING="waiting"
+DIAG_RUNNING="running"
+DIAG_PASS="pass"
+DIAG_WARNING="warning"
+DIAG_FAILED="failed"
+DIAG_SKIP="skipped"
+#  DIAGWEIGHT : Weight of test
+#    DIAGWEIGHT_LIGHT : Light tests
+#    DIAGWEIGHT_MEDIUM : Medium tests
+#    DIAGWEIGHT_HEAVY : Heavy tests
+DIAGWEIGHT_LIGHT="DM_LIGHT"
+DIAGWEIGHT_MEDIUM="DM_MEDIUM"
+DIAGWEIGHT_HEAVY="DM_HEAVY"
+#  DIALOG_ITEM_TYPE : Type for a DynamicDialogItem used in a DynamicDialog
+#    DIT_STRING : String
+#    DIT_INTEGER : Integer
+#    DIT_FLOAT : Floating-point number
+#    DIT_TIMECODE : Timecode
+#    DIT_DROPDOWN : Dropdown
+#    DIT_LIST : List of items
+#    DIT_TOGGLE : Toggle Button
+#    DIT_TOGGLE_SET : Set of Toggle buttons
+#    DIT_TOGGLE_DROPDOWN : Dropdown menu to allow toggling multiple items
+#    DIT_TOGGLE_LIST : List of toggle items
+#    DIT_RADIO_GROUP : Set of radio buttons
+#    DIT_FILEPATH : File Path
+#    DIT_IMAGEPATH : Image Path
+#    DIT_DIRECTORY : Directory Path
+#    DIT_SHOT_SELECTION : Shot Selection
+#    DIT_STATIC_TEXT : Static Text
+#    DIT_SHOT_CATEGORY : Shot Category
+#    DIT_SHOT_CATEGORY_SET : Shot Category Set
+#    DIT_MARK_CATEGORY : Shot Category
+#    DIT_MARK_CATEGORY_SET : Mark Category Set
+DIT_STRING="String"
+DIT_INTEGER="Integer"
+DIT_FLOAT="Float"
+DIT_TIMECODE="Timecode"
+DIT_DROPDOWN="Dropdown"
+DIT_LIST="List"
+DIT_TOGGLE="Toggle"
+DIT_TOGGLE_SET="ToggleSet"
+DIT_TOGGLE_DROPDOWN="ToggleDropdown"
+DIT_TOGGLE_LIST="ToggleList"
+DIT_RADIO_GROUP="RadioGroup"
+DIT_FILEPATH="File"
+DIT_IMAGEPATH="Image"
+DIT_DIRECTORY="Directory"
+DIT_SHOT_SELECTION="ShotSelection"
+DIT_STATIC_TEXT="StaticText"
+DIT_SHOT_CATEGORY="ShotCategory"
+DIT_SHOT_CATEGORY_SET="CategorySet"
+DIT_MARK_CATEGORY="MarkCategory"
+DIT_MARK_CATEGORY_SET="MarkCategorySet"
+#  EXPORTSTATUS : Status info related to Export progress
+#    EXPORTSTATUS_FAIL : Failure during export operation
+#    EXPORTSTATUS_WARN : Warning during export operation
+#    EXPORTSTATUS_INFO : Info from export operation
+#    EXPORTSTATUS_NOTE : Note from export operation
+#    EXPORTSTATUS_SCAN : Filesystem scanning progress
+EXPORTSTATUS_FAIL="FAIL"
+EXPORTSTATUS_WARN="WARN"
+EXPORTSTATUS_INFO="INFO"
+EXPORTSTATUS_NOTE="NOTE"
+EXPORTSTATUS_SCAN="SCAN"
+#  EXPORTTYPE : Type of Exporter
+#    EXPORTTYPE_STILL : Stills Exporter
+#    EXPORTTYPE_BLG : BLG Exporter
+#    EXPORTTYPE_CUBE : Cube Exporter
+#    EXPORTTYPE_CDL : CDL Exporter
+EXPORTTYPE_STILL="Still"
+EXPORTTYPE_BLG="BLG"
+EXPORTTYPE_CUBE="Cube"
+EXPORTTYPE_CDL="CDL"
+#  EXPORT_CATEGORYMATCH : Values for Exporter CategoryMatch field
+#    EXPORT_CATEGORYMATCH_ALL : All Categories
+#    EXPORT_CATEGORYMATCH_ANY : Any Category
+EXPORT_CATEGORYMATCH_ALL="all"
+EXPORT_CATEGORYMATCH_ANY="any"
+#  EXPORT_FRAMES : Values for Exporter Frames field
+#    EXPORT_FRAMES_FIRST : First Frame
+#    EXPORT_FRAMES_POSTER : Poster Frame
+#    EXPORT_FRAMES_MARKED : Marked Frames
+#    EXPORT_FRAMES_CURRENT : Current Frame
+EXPORT_FRAMES_FIRST="First"
+EXPORT_FRAMES_POSTER="Poster"
+EXPORT_FRAMES_MARKED="Marked"
+EXPORT_FRAMES_CURRENT="Current"
+#  EXPORT_OVERWRITE : Values for Exporter Overwrite field
+#    EXPORT_OVERWRITE_SKIP : Skip
+#    EXPORT_OVERWRITE_REPLACE : Replace
+EXPORT_OVERWRITE_SKIP="Skip"
+EXPORT_OVERWRITE_REPLACE="Replace"
+#  EXPORT_SOURCE : Values for Exporter Source field
+#    EXPORT_SOURCE_ALLSHOTS : All Shots
+#    EXPORT_SOURCE_SELECTEDSHOTS : Selected Shots
+#    EXPORT_SOURCE_CURRENTSHOT : Current Shot
+#    EXPORT_SOURCE_SHOTSINFILTER : Shots in Filter
+#    EXPORT_SOURCE_SHOTSOFCATEGORY : Shots of Category
+EXPORT_SOURCE_ALLSHOTS="AllShots"
+EXPORT_SOURCE_SELECTEDSHOTS="SelectedShots"
+EXPORT_SOURCE_CURRENTSHOT="CurrentShot"
+EXPORT_SOURCE_SHOTSINFILTER="ShotsInFilter"
+EXPORT_SOURCE_SHOTSOFCATEGORY="ShotsOfCategory"
+#  EXPORT_STEREO : Values for Exporter Stereo field
+#    EXPORT_STEREO_CURRENT : Current Eye
+#    EXPORT_STEREO_LEFT : Left Eye
+#    EXPORT_STEREO_RIGHT : Right Eye
+#    EXPORT_STEREO_BOTH : Left & Right Eyes
+#    EXPORT_STEREO_SINGLESTACKSTEREO : Single Stack Stereo (BLG exports only)
+EXPORT_STEREO_CURRENT="Current"
+EXPORT_STEREO_LEFT="Left"
+EXPORT_STEREO_RIGHT="Right"
+EXPORT_STEREO_BOTH="Both"
+EXPORT_STEREO_SINGLESTACKSTEREO="SingleStackStereo"
+#  FIELDORDER : Field order behaviour
+#    FIELDORDER_PROGRESSIVE : Progressive
+#    FIELDORDER_UPPER : Upper-field first (PAL/SECAM)
+#    FIELDORDER_LOWER : Lower-field first (NTSC)
+FIELDORDER_PROGRESSIVE="None"
+FIELDORDER_UPPER="upper"
+FIELDORDER_LOWER="lower"
+#  FORMATSET_SCOPE : Defines the scope that a FormatSet is defined in
+#    FORMATSET_SCOPE_FACTORY : Factory formats built-in to the software
+#    FORMATSET_SCOPE_GLOBAL : Global Formats from the global formats database
+#    FORMATSET_SCOPE_JOB : Formats defined for a given job in a database
+#    FORMATSET_SCOPE_SCENE : Formats defined for a given scene
+FORMATSET_SCOPE_FACTORY="factory"
+FORMATSET_SCOPE_GLOBAL="global"
+FORMATSET_SCOPE_JOB="job"
+FORMATSET_SCOPE_SCENE="scene"
+#  FSFILTER : Type of items to return from Filesystem get_items method
+#    FSFILTER_FILE : Return files
+#    FSFILTER_DIR : Return directories
+FSFILTER_FILE="file"
+FSFILTER_DIR="directory"
+#  IMAGESEARCHER_METADATA_TRACK : Metadata track to use to group image files together into sequences
+#    ISMT_FRAME_NUMBER : Collate frames into sequences based on frame number
+#    ISMT_TIMECODE_1 : Collate frames into sequences based on Timecode 1
+#    ISMT_TIMECODE_2 : Collate frames into sequences based on Timecode 2
+#    ISMT_KEYCODE_1 : Collate frames into sequences based on Keycode
+ISMT_FRAME_NUMBER="FSMT_FRAME_NUMBER"
+ISMT_TIMECODE_1="FSMT_TIMECODE_1"
+ISMT_TIMECODE_2="FSMT_TIMECODE_2"
+ISMT_KEYCODE_1="FSMT_KEYCODE_1"
+#  IMAGETRANSFORM_MODE : Specify filtering kernel to use for image resampling/transform operations
+#    IMAGETRANSFORM_ADAPTIVE : Adaptive
+#    IMAGETRANSFORM_BOX : Square Average (Box filter)
+#    IMAGETRANSFORM_CIRCLE : Circle average
+#    IMAGETRANSFORM_COMPOSITE : Composite
+#    IMAGETRANSFORM_CUBIC : Fixed Cubic
+#    IMAGETRANSFORM_CUBIC_SPLINE : Fixed Cubic Spline
+#    IMAGETRANSFORM_LANCZOS : Fixed Lanczos 4-tap
+#    IMAGETRANSFORM_6LANCZOS : Fixed Lanczos 6-tap
+#    IMAGETRANSFORM_6QUINTIC : Fixed Quintic 6-tap
+#    IMAGETRANSFORM_GAUSSIAN : Fixed Gaussian
+#    IMAGETRANSFORM_CATMULL_ROM : Fixed Catmull-Rom
+#    IMAGETRANSFORM_SIMON : Fixed Simon
+#    IMAGETRANSFORM_LINEAR : Fixed Linear
+#    IMAGETRANSFORM_NEAREST : Fixed Nearest Pixel
+#    IMAGETRANSFORM_SHARPEDGE : Sharp Edge
+IMAGETRANSFORM_ADAPTIVE="adaptive-soft"
+IMAGETRANSFORM_BOX="box"
+IMAGETRANSFORM_CIRCLE="circle"
+IMAGETRANSFORM_COMPOSITE="composite"
+IMAGETRANSFORM_CUBIC="cubic"
+IMAGETRANSFORM_CUBIC_SPLINE="cubic-spline"
+IMAGETRANSFORM_LANCZOS="Lanczos"
+IMAGETRANSFORM_6LANCZOS="6Lanczos"
+IMAGETRANSFORM_6QUINTIC="6quintic"
+IMAGETRANSFORM_GAUSSIAN="Gaussian"
+IMAGETRANSFORM_CATMULL_ROM="Catmull-Rom"
+IMAGETRANSFORM_SIMON="Simon"
+IMAGETRANSFORM_LINEAR="linear"
+IMAGETRANSFORM_NEAREST="nearest"
+IMAGETRANSFORM_SHARPEDGE="sharpEdge"
+#  INSERT_POSITION : Specify where to insert a sequence in a Scene
+#    INSERT_START : Insert sequence at start of scene
+#    INSERT_END : Insert sequence at end of scene
+#    INSERT_BEFORE : Insert sequence before specified Shot
+#    INSERT_AFTER : Insert sequence after specified Shot
+#    INSERT_ABOVE : Insert sequence above specified Shot
+#    INSERT_BELOW : Insert sequence below specified Shot
+INSERT_START="start"
+INSERT_END="end"
+INSERT_BEFORE="before"
+INSERT_AFTER="after"
+INSERT_ABOVE="above"
+INSERT_BELOW="below"
+#  LOG_SEVERITY : Log Message Severity
+#    LOGSEVERITY_HARD : Hard error
+#    LOGSEVERITY_SOFT : Soft error
+#    LOGSEVERITY_INFO : Information or transient message
+LOGSEVERITY_HARD="ERR_HARD"
+LOGSEVERITY_SOFT="ERR_SOFT"
+LOGSEVERITY_INFO="ERR_INFO_TRANSIENT"
+#  LUT_LOCATION : Specify where LUT data should be found for a LUT operator
+#    LUTLOCATION_FILE : LUT is stored in an external file
+#    LUTLOCATION_EMBEDDED : LUT is embedded in source image file
+LUTLOCATION_FILE="file"
+LUTLOCATION_EMBEDDED="embedded"
+#  MARK_TYPE : Used to distinguish between timeline, shot and strip marks
+#    MARKTYPE_TIMELINE : Timeline mark, position stored as time in seconds relative to start of timeline
+#    MARKTYPE_SHOT : Shot mark, position stored as source image frame number
+#    MARKTYPE_STRIP : Strip mark, position stored as time in seconds relative to start of strip
+MARKTYPE_TIMELINE="Timeline"
+MARKTYPE_SHOT="Shot"
+MARKTYPE_STRIP="Strip"
+#  MENU_LOCATION : Location within application of new menu or menu item
+#    MENULOCATION_APP_MENU : Main application menu, ie Baselight or Daylight
+#    MENULOCATION_SCENE_MENU : Scene menu
+#    MENULOCATION_EDIT_MENU : Edit menu
+#    MENULOCATION_JOB_MANAGER : Job Manager
+#    MENULOCATION_SHOT_VIEW : Shots View
+MENULOCATION_APP_MENU="ML_APPMENU"
+MENULOCATION_SCENE_MENU="ML_SCENE"
+MENULOCATION_EDIT_MENU="ML_EDIT"
+MENULOCATION_JOB_MANAGER="ML_JOB_MANAGER"
+MENULOCATION_SHOT_VIEW="ML_SHOTS_VIEW"
+#  MULTIPASTESTATUS : Status info related to Multi-Paste progress
+#    MULTIPASTESTATUS_FAIL : Failure during multi-paste operation
+#    MULTIPASTESTATUS_WARN : Warning during multi-paste operation
+#    MULTIPASTESTATUS_INFO : Info from multi-paste operation
+#    MULTIPASTESTATUS_NOTE : Note from multi-paste operation
+#    MULTIPASTESTATUS_SCAN : Filesystem scanning progress
+MULTIPASTESTATUS_FAIL="FAIL"
+MULTIPASTESTATUS_WARN="WARN"
+MULTIPASTESTATUS_INFO="INFO"
+MULTIPASTESTATUS_NOTE="NOTE"
+MULTIPASTESTATUS_SCAN="SCAN"
+#  MULTIPASTE_BLGRESOURCECONFLICT : Values for MultiPasteSettings BLGResourceConflict
+#    MULTIPASTE_BLGRESOURCECONFLICT_REPLACE : Replace Existing Resources with BLG Versions
+#    MULTIPASTE_BLGRESOURCECONFLICT_ORIGINAL : Use Existing Resources with the Same Name
+#    MULTIPASTE_BLGRESOURCECONFLICT_RENAME : Import BLG Resources Under a New Name
+MULTIPASTE_BLGRESOURCECONFLICT_REPLACE="Replace"
+MULTIPASTE_BLGRESOURCECONFLICT_ORIGINAL="Original"
+MULTIPASTE_BLGRESOURCECONFLICT_RENAME="Rename"
+#  MULTIPASTE_DESTSELECTION : Values for MultiPasteSettings DestSelection
+#    MULTIPASTE_DESTSELECTION_SELECTEDSTRIPS : Timeline Stacks Containing a Selected Strip
+#    MULTIPASTE_DESTSELECTION_SELECTEDSHOTS : Selected Shots in Shots View/Cuts View
+MULTIPASTE_DESTSELECTION_SELECTEDSTRIPS="SelectedStrips"
+MULTIPASTE_DESTSELECTION_SELECTEDSHOTS="SelectedShots"
+#  MULTIPASTE_DESTSHOTS : Values for MultiPasteSettings DestShots
+#    MULTIPASTE_DESTSHOTS_OVERWRITEALL : Overwrite All
+#    MULTIPASTE_DESTSHOTS_OVERWRITEALLEXCEPTCATS : Overwrite All, Except Layers of Category
+#    MULTIPASTE_DESTSHOTS_RETAINALL : Retain All
+#    MULTIPASTE_DESTSHOTS_RETAINALLEXCEPTCATS : Retain All, Except Layers of Category
+MULTIPASTE_DESTSHOTS_OVERWRITEALL="OverwriteAll"
+MULTIPASTE_DESTSHOTS_OVERWRITEALLEXCEPTCATS="OverwriteAllExceptCats"
+MULTIPASTE_DESTSHOTS_RETAINALL="RetainAll"
+MULTIPASTE_DESTSHOTS_RETAINALLEXCEPTCATS="RetainAllExceptCats"
+#  MULTIPASTE_EDLAPPLYASCCDL : Values for MultiPasteSettings EDLApplyASCCDL
+#    MULTIPASTE_EDLAPPLYASCCDL_NO : No
+#    MULTIPASTE_EDLAPPLYASCCDL_CDL : Yes
+MULTIPASTE_EDLAPPLYASCCDL_NO="No"
+MULTIPASTE_EDLAPPLYASCCDL_CDL="CDL"
+#  MULTIPASTE_LAYERZEROBEHAVIOUR : Values for MultiPasteSettings LayerZeroBehaviour
+#    MULTIPASTE_LAYERZEROBEHAVIOUR_STACKONLY : All Layers, Except Layer 0
+#    MULTIPASTE_LAYERZEROBEHAVIOUR_LAYERZEROANDSTACK : All Layers, Including Layer 0
+#    MULTIPASTE_LAYERZEROBEHAVIOUR_LAYERZEROONLY : Layer 0 Only
+#    MULTIPASTE_LAYERZEROBEHAVIOUR_NOLAYERS : No Layers
+MULTIPASTE_LAYERZEROBEHAVIOUR_STACKONLY="StackOnly"
+MULTIPASTE_LAYERZEROBEHAVIOUR_LAYERZEROANDSTACK="LayerZeroAndStack"
+MULTIPASTE_LAYERZEROBEHAVIOUR_LAYERZEROONLY="LayerZeroOnly"
+MULTIPASTE_LAYERZEROBEHAVIOUR_NOLAYERS="NoLayers"
+#  MULTIPASTE_LAYERZEROCATEGORIES : Values for MultiPasteSettings LayerZeroCategories
+#    MULTIPASTE_LAYERZEROCATEGORIES_INCLUDE : Append Categories, Except
+#    MULTIPASTE_LAYERZEROCATEGORIES_OVERWRITE : Replace Categories, Add All Except
+#    MULTIPASTE_LAYERZEROCATEGORIES_NO : Do Not Copy Layer 0 Categories
+MULTIPASTE_LAYERZEROCATEGORIES_INCLUDE="Include"
+MULTIPASTE_LAYERZEROCATEGORIES_OVERWRITE="Overwrite"
+MULTIPASTE_LAYERZEROCATEGORIES_NO="No"
+#  MULTIPASTE_MATCHBY : Values for MultiPasteSettings MatchBy
+#    MULTIPASTE_MATCHBY_TAPENAME : Source Tape Name
+#    MULTIPASTE_MATCHBY_FILENAME : Source Path+Filename
+#    MULTIPASTE_MATCHBY_CLIPNAME : Source Clip Name
+#    MULTIPASTE_MATCHBY_AVIDUID : Source Avid UID
+#    MULTIPASTE_MATCHBY_CAMERA : Source Camera
+#    MULTIPASTE_MATCHBY_BLGNAME : Source BLG Name
+#    MULTIPASTE_MATCHBY_BLGID : Source BLG ID
+#    MULTIPASTE_MATCHBY_SCENE : Source Scene
+#    MULTIPASTE_MATCHBY_SCENETAKE : Source Scene & Take
+#    MULTIPASTE_MATCHBY_CAMERAROLL : Source Camera Roll
+#    MULTIPASTE_MATCHBY_LABROLL : Source Lab Roll
+#    MULTIPASTE_MATCHBY_LUT : Source LUT
+#    MULTIPASTE_MATCHBY_LUT2 : Source LUT2
+#    MULTIPASTE_MATCHBY_ASC_CC_XML : Source ASC_CC_XML
+#    MULTIPASTE_MATCHBY_FRAMENUMBER : Source Frame Number
+#    MULTIPASTE_MATCHBY_TIMECODE : Source Timecode
+#    MULTIPASTE_MATCHBY_KEYCODE : Source Keycode
+#    MULTIPASTE_MATCHBY_RECORDFRAMENUMBER : Record Frame Number
+#    MULTIPASTE_MATCHBY_RECORDTIMECODE : Record Timecode
+#    MULTIPASTE_MATCHBY_ALWAYSMATCH : Ignore Time Ranges
+MULTIPASTE_MATCHBY_TAPENAME="TapeName"
+MULTIPASTE_MATCHBY_FILENAME="Filename"
+MULTIPASTE_MATCHBY_CLIPNAME="ClipName"
+MULTIPASTE_MATCHBY_AVIDUID="AvidUID"
+MULTIPASTE_MATCHBY_CAMERA="Camera"
+MULTIPASTE_MATCHBY_BLGNAME="BLGName"
+MULTIPASTE_MATCHBY_BLGID="BLGId"
+MULTIPASTE_MATCHBY_SCENE="Scene"
+MULTIPASTE_MATCHBY_SCENETAKE="SceneTake"
+MULTIPASTE_MATCHBY_CAMERAROLL="CameraRoll"
+MULTIPASTE_MATCHBY_LABROLL="LabRoll"
+MULTIPASTE_MATCHBY_LUT="LUT"
+MULTIPASTE_MATCHBY_LUT2="LUT2"
+MULTIPASTE_MATCHBY_ASC_CC_XML="ASC_CC_XML"
+MULTIPASTE_MATCHBY_FRAMENUMBER="FrameNumber"
+MULTIPASTE_MATCHBY_TIMECODE="Timecode"
+MULTIPASTE_MATCHBY_KEYCODE="Keycode"
+MULTIPASTE_MATCHBY_RECORDFRAMENUMBER="RecordFrameNumber"
+MULTIPASTE_MATCHBY_RECORDTIMECODE="RecordTimecode"
+MULTIPASTE_MATCHBY_ALWAYSMATCH="AlwaysMatch"
+#  MULTIPASTE_MATCHQUALITY : Values for MultiPasteSettings MatchQuality
+#    MULTIPASTE_MATCHQUALITY_EXACTMATCH : Exact
+#    MULTIPASTE_MATCHQUALITY_FUZZYMATCH : Fuzzy
+MULTIPASTE_MATCHQUALITY_EXACTMATCH="ExactMatch"
+MULTIPASTE_MATCHQUALITY_FUZZYMATCH="FuzzyMatch"
+#  MULTIPASTE_PASTELOCATION : Values for MultiPasteSettings PasteLocation
+#    MULTIPASTE_PASTELOCATION_ABOVE : Above Remaining Destination Layers
+#    MULTIPASTE_PASTELOCATION_BELOW : Below Remaining Destination Layers
+MULTIPASTE_PASTELOCATION_ABOVE="Above"
+MULTIPASTE_PASTELOCATION_BELOW="Below"
+#  MULTIPASTE_SOURCE : Values for MultiPasteSettings Source
+#    MULTIPASTE_SOURCE_COPYBUFFER : Current Copy Buffer
+#    MULTIPASTE_SOURCE_MULTIPLESCENES : Multiple Scenes
+#    MULTIPASTE_SOURCE_BLG : BLG Files
+#    MULTIPASTE_SOURCE_LUT : LUT Files
+#    MULTIPASTE_SOURCE_CDL : CDL/CCC XML Files
+#    MULTIPASTE_SOURCE_EDL : EDL/ALE files
+MULTIPASTE_SOURCE_COPYBUFFER="CopyBuffer"
+MULTIPASTE_SOURCE_MULTIPLESCENES="MultipleScenes"
+MULTIPASTE_SOURCE_BLG="BLG"
+MULTIPASTE_SOURCE_LUT="LUT"
+MULTIPASTE_SOURCE_CDL="CDL"
+MULTIPASTE_SOURCE_EDL="EDL"
+#  MULTIPASTE_SOURCESHOTS : Values for MultiPasteSettings SourceShots
+#    MULTIPASTE_SOURCESHOTS_COPYALL : Copy All
+#    MULTIPASTE_SOURCESHOTS_COPYALLEXCEPTCATS : Copy All, Except Layers of Category
+#    MULTIPASTE_SOURCESHOTS_COPYONLYCATS : Copy Only Layers of Category
+MULTIPASTE_SOURCESHOTS_COPYALL="CopyAll"
+MULTIPASTE_SOURCESHOTS_COPYALLEXCEPTCATS="CopyAllExceptCats"
+MULTIPASTE_SOURCESHOTS_COPYONLYCATS="CopyOnlyCats"
+#  OPENFLAG : Flags used to control opening a scene
+#    OPENFLAG_DISCARD : Discard any unsaved changes when opening scene
+#    OPENFLAG_RECOVER : Recover any unsaved changes when opening scene
+#    OPENFLAG_OLD : Allow opening of old scenes
+#    OPENFLAG_IGNORE_REVISION : Ignore data revision number when opening scene
+#    OPENFLAG_READ_ONLY : Open scene read-only
+#    OPENFLAG_ALLOW_UNKNOWN_OFX : Allow opening scenes that reference unknown OpenFX plugins
+#    OPENFLAG_NO_CONTAINER_WARNING : Don't warn if scene uses container that is not known on this machine
+OPENFLAG_DISCARD="discard"
+OPENFLAG_RECOVER="recover"
+OPENFLAG_OLD="openold"
+OPENFLAG_IGNORE_REVISION="ignorerevision"
+OPENFLAG_READ_ONLY="readonly"
+OPENFLAG_ALLOW_UNKNOWN_OFX="allow_unknown_openfx"
+OPENFLAG_NO_CONTAINER_WARNING="nocontainerwarning"
+#  OPERATOR_BARS_TYPE : Define the type of Bars to render
+#    OPERATOR_BARS_TYPE_RP219HD_2a3a : SMPTE 75% white
+#    OPERATOR_BARS_TYPE_RP219HD_2b3a : SMPTE 100% white
+#    OPERATOR_BARS_TYPE_RP219HD_2c3b : SMPTE +I +Q
+#    OPERATOR_BARS_TYPE_RP219HD_2d3b : SMPTE -I +Q
+#    OPERATOR_BARS_TYPE_GREYS17 : Grey bars
+#    OPERATOR_BARS_TYPE_RAMP : Grey ramp
+#    OPERATOR_BARS_TYPE_RGBGREY : RGB and greys
+#    OPERATOR_BARS_TYPE_B72 : BT.2111/ARIB B72 (HLG)
+#    OPERATOR_BARS_TYPE_ITU2111_PQ : BT.2111 (PQ)
+#    OPERATOR_BARS_TYPE_B66_4K : ARIB B66 (UHDTV 4K)
+#    OPERATOR_BARS_TYPE_B66_8K : ARIB B66 (UHDTV 8K)
+OPERATOR_BARS_TYPE_RP219HD_2a3a="RP219HD_2a3a"
+OPERATOR_BARS_TYPE_RP219HD_2b3a="RP219HD_2b3a"
+OPERATOR_BARS_TYPE_RP219HD_2c3b="RP219HD_2c3b"
+OPERATOR_BARS_TYPE_RP219HD_2d3b="RP219HD_2d3b"
+OPERATOR_BARS_TYPE_GREYS17="GREYS17"
+OPERATOR_BARS_TYPE_RAMP="RAMP"
+OPERATOR_BARS_TYPE_RGBGREY="RGBGREY"
+OPERATOR_BARS_TYPE_B72="B72"
+OPERATOR_BARS_TYPE_ITU2111_PQ="ITU2111_PQ"
+OPERATOR_BARS_TYPE_B66_4K="B66_4K"
+OPERATOR_BARS_TYPE_B66_8K="B66_8K"
+#  OPSTATUS : Status of an operation in Queue or Processor
+#    OPSTATUS_CREATING : Operation is being created
+#    OPSTATUS_QUEUED : Operation is waiting in the queue
+#    OPSTATUS_ACTIVE : Operation is active
+#    OPSTATUS_CRASHED : Operation crashed
+#    OPSTATUS_STOPPED : Operation has been manually stopped
+#    OPSTATUS_TOONEW : Operation was submitted to the queue by a newer version of the software and cannot be processed
+#    OPSTATUS_DONE : Operation is complete
+OPSTATUS_CREATING="Creating"
+OPSTATUS_QUEUED="Queued"
+OPSTATUS_ACTIVE="Active"
+OPSTATUS_CRASHED="Crashed"
+OPSTATUS_STOPPED="Stopped"
+OPSTATUS_TOONEW="Too New"
+OPSTATUS_DONE="Done"
+#  OPTICALFLOW_QUALITY : Optical Flow Quality
+#    OFLOWQUAL_BEST : Best Quality
+#    OFLOWQUAL_HIGH : High Quality
+#    OFLOWQUAL_MEDIUM : Medium Quality
+OFLOWQUAL_BEST="Best"
+OFLOWQUAL_HIGH="High"
+OFLOWQUAL_MEDIUM="Medium"
+#  OPTICALFLOW_SMOOTHING : Optical Flow Smoothing
+#    OFLOWSMOOTH_NONE : None
+#    OFLOWSMOOTH_LOW : Low
+#    OFLOWSMOOTH_MEDIUM : Medium
+#    OFLOWSMOOTH_HIGH : High
+#    OFLOWSMOOTH_MAX : Maximum
+OFLOWSMOOTH_NONE=0
+OFLOWSMOOTH_LOW=1
+OFLOWSMOOTH_MEDIUM=2
+OFLOWSMOOTH_HIGH=3
+OFLOWSMOOTH_MAX=4
+#  PROXY_RESOLUTION : Proxy Resolution of Render Format
+#    RES_HIGH : High (full) resolution
+#    RES_MEDIUM : Medium proxy resolution
+#    RES_LOW : Low proxy resolution
+RES_HIGH="GMPR_HIGH"
+RES_MEDIUM="GMPR_MEDIUM"
+RES_LOW="GMPR_LOW"
+#  QUEUE_LOG_TYPE : Message type for log entry queue operation log
+#    QUEUELOGTYPE_INFO : Information
+#    QUEUELOGTYPE_WARN : Warning
+#    QUEUELOGTYPE_FAIL : Error/failure
+QUEUELOGTYPE_INFO="info"
+QUEUELOGTYPE_WARN="warn"
+QUEUELOGTYPE_FAIL="fail"
+#  RENDER_CLIPNAME_SOURCE : Which clip name to embed into rendered output
+#    RENDER_CLIPNAME_FILE : Source File Clip Name
+#    RENDER_CLIPNAME_SHOT : Shot Clip Name
+#    RENDER_CLIPNAME_STRIP : Clip Name from Strip Name
+RENDER_CLIPNAME_FILE=0
+RENDER_CLIPNAME_SHOT=1
+RENDER_CLIPNAME_STRIP=2
+#  RENDER_COLOURSPACE : Special values to use for RenderColourSpace in RenderDeliverable
+#    RENDER_COLOURSPACE_USEINPUT : Use Input Colour Space of Shot
+#    RENDER_COLOURSPACE_USESTACKOUTPUT : Use Stack Output Colour Space.This will resolve to the Scene Grade Result Colour Space if specified, otherwise this will resolve to the Scene Working Colour Space.
+RENDER_COLOURSPACE_USEINPUT="Input"
+RENDER_COLOURSPACE_USESTACKOUTPUT="None"
+#  RENDER_EMPTY_BEHAVIOUR : Action to take when encountering frames in timeline with no strips/shots
+#    RENDER_EMPTY_FAIL : Fail Render
+#    RENDER_EMPTY_BLACK : Render Black Frame
+#    RENDER_EMPTY_CHEQUER : Render Chequerboard Frame
+RENDER_EMPTY_FAIL="GMREB_FAIL"
+RENDER_EMPTY_BLACK="GMREB_BLACK"
+RENDER_EMPTY_CHEQUER="GMREB_CHEQUER"
+#  RENDER_ERROR_BEHAVIOUR : Action to take when encountering frames in timeline with no strips/shots
+#    RENDER_ERROR_FAIL : Fail Render
+#    RENDER_ERROR_SKIP : Skip Frame And Continue
+#    RENDER_ERROR_BLACK : Render Black Frame
+#    RENDER_ERROR_CHEQUER : Render Chequerboard Frame And Continue
+RENDER_ERROR_FAIL="ABORT"
+RENDER_ERROR_SKIP="SKIP"
+RENDER_ERROR_BLACK="BLACK"
+RENDER_ERROR_CHEQUER="CHEQUER"
+#  RENDER_FORMAT : Special values to use for RenderFormat in RenderDeliverable
+#    RENDER_FORMAT_USEINPUT : Use Shot Input Format
+RENDER_FORMAT_USEINPUT="0"
+#  RENDER_FRAMENUM : Specify how frame number for sequence should be calculated
+#    RENDER_FRAMENUM_SCENE_FRAME : Scene Frame Number
+#    RENDER_FRAMENUM_SHOT_FRAME : Shot  Frame Number
+#    RENDER_FRAMENUM_SCENE_TIMECODE : Record Timecode as Frame Number
+#    RENDER_FRAMENUM_SHOT_TIMECODE : Shot Timecode as Frame Number
+RENDER_FRAMENUM_SCENE_FRAME="F"
+RENDER_FRAMENUM_SHOT_FRAME="G"
+RENDER_FRAMENUM_SCENE_TIMECODE="T"
+RENDER_FRAMENUM_SHOT_TIMECODE="H"
+#  RENDER_INCOMPLETE_BEHAVIOUR : Action to take when encountering shots with missing strips
+#    RENDER_INCOMPLETE_FAIL : Fail Render
+#    RENDER_INCOMPLETE_CONTINUE : Render As Baselight (Chequerboard Missing)
+#    RENDER_INCOMPLETE_BLACK : Render Black Frame
+#    RENDER_INCOMPLETE_CHEQUER : Render Chequerboard Frame
+RENDER_INCOMPLETE_FAIL="GMREB_FAIL"
+RENDER_INCOMPLETE_CONTINUE="GMREB_CONTINUE"
+RENDER_INCOMPLETE_BLACK="GMREB_BLACK"
+RENDER_INCOMPLETE_CHEQUER="GMREB_CHEQUER"
+#  RENDER_LAYER : Layers to include when rendering. This can be a layer number or one of the following constants.
+#    RENDER_LAYER_ALL : Include all grade layers in rendered output
+#    RENDER_LAYER_LAYERS_INPUTONLY : Do not include any grade layers or operators in layer 0
+#    RENDER_LAYER_LAYER0 : Do not include any grade layers
+RENDER_LAYER_ALL=-1
+RENDER_LAYER_LAYERS_INPUTONLY=-2
+RENDER_LAYER_LAYER0=0
+#  RENDER_MASK : Select whether to crop to the mask, or set the black value for the masked area
+#    RENDER_MASK_CROP : Crop image to mask
+#    RENDER_MASK_BLACK : Set mask area to absolue black (0)
+#    RENDER_MASK_VIDEO : Set mask area to video black (16/255)
+#    RENDER_MASK_FILM : Set mask area to film black (95/1023)
+RENDER_MASK_CROP=-1
+RENDER_MASK_BLACK=0
+RENDER_MASK_VIDEO=64
+RENDER_MASK_FILM=95
+#  RENDER_NCLC_TAG : Which NCLC tag to use in QuickTime Movie files for colourimetry
+#    RENDER_NCLC_LEGACY : Use legacy NCLC tag
+#    RENDER_NCLC_AUTOMATIC : Use NCLC tag based on RenderColourSpace
+RENDER_NCLC_LEGACY=0
+RENDER_NCLC_AUTOMATIC=1
+#  RENDER_TAPENAME_SOURCE : Which tape name to embed into rendered output
+#    RENDER_TAPENAME_FILE : Source File Tape Name
+#    RENDER_TAPENAME_SHOT : Shot Tape Name
+#    RENDER_TAPENAME_CLIP : Shot Clip Name
+#    RENDER_TAPENAME_STRIP : Tape Name from Strip Name
+RENDER_TAPENAME_FILE=0
+RENDER_TAPENAME_SHOT=1
+RENDER_TAPENAME_CLIP=3
+RENDER_TAPENAME_STRIP=2
+#  RENDER_TIMECODE_SOURCE : Which timecode to embed into rendered output
+#    RENDER_TIMECODE_FILETC1 : File Timecode 1
+#    RENDER_TIMECODE_FILETC2 : File Timecode 2
+#    RENDER_TIMECODE_SHOTTC : Shot Timecode
+#    RENDER_TIMECODE_RECTC : Record (Timeline) Timecode
+RENDER_TIMECODE_FILETC1=0
+RENDER_TIMECODE_FILETC2=3
+RENDER_TIMECODE_SHOTTC=2
+RENDER_TIMECODE_RECTC=1
+#  ROP_TEXT_ALIGN : Text alignment
+#    ROP_TEXT_ALIGN_LEFT : Left
+#    ROP_TEXT_ALIGN_CENTER : Center
+#    ROP_TEXT_ALIGN_RIGHT : Right
+ROP_TEXT_ALIGN_LEFT=0
+ROP_TEXT_ALIGN_CENTER=1
+ROP_TEXT_ALIGN_RIGHT=2
+#  SEQRESAMPLE_MODE : Sequence Resample Mode to use when resampling a sequence to a different video frame rate
+#    SEQRESAMPLE_SNAP_TO_FRAME : Snap to Frame
+#    SEQRESAMPLE_ROLLING_MAX : Mix Nearest Frames
+#    SEQRESAMPLE_OPTICAL_FLOW : Optical Flow
+SEQRESAMPLE_SNAP_TO_FRAME="SnapToFrame"
+SEQRESAMPLE_ROLLING_MAX="RollingMix"
+SEQRESAMPLE_OPTICAL_FLOW="OpticalFlow"
+#  STEREO_EYE : Stereo eye
+#    STEREOEYE_MONO : Mono (no stereo)
+#    STEREOEYE_LEFT : Left eye
+#    STEREOEYE_RIGHT : Right eye
+STEREOEYE_MONO="GMSE_MONO"
+STEREOEYE_LEFT="GMSE_LEFT"
+STEREOEYE_RIGHT="GMSE_RIGHT"
+#  STILLEXPORT_BURNIN : Values for StillExportSettings Burnin
+#  STILLEXPORT_DECODEQUALITY : Values for StillExportSettings DecodeQuality
+#    STILLEXPORT_DECODEQUALITY_GMDQ_OPTIMISED_UNLESS_HIGH : Max Quality	Decode at maximum resolution
+#    STILLEXPORT_DECODEQUALITY_GMDQ_OPTIMISED : Optimised	Decode at half resolution where possible, for speed
+#    STILLEXPORT_DECODEQUALITY_GMDQ_DRAFT : Draft	Decode at draft quality, for maximum speed
+STILLEXPORT_DECODEQUALITY_GMDQ_OPTIMISED_UNLESS_HIGH="GMDQ_OPTIMISED_UNLESS_HIGH"
+STILLEXPORT_DECODEQUALITY_GMDQ_OPTIMISED="GMDQ_OPTIMISED"
+STILLEXPORT_DECODEQUALITY_GMDQ_DRAFT="GMDQ_DRAFT"
+#  STILLEXPORT_FILETYPE : Values for StillExportSettings FileType
+#  STILLEXPORT_FORMAT : Values for StillExportSettings Format
+#  STILLEXPORT_MASK : Values for StillExportSettings Mask
+#  STILLEXPORT_MASKMODE : Values for StillExportSettings MaskMode
+#    STILLEXPORT_MASKMODE_CROP : Crop Image To Mask
+#    STILLEXPORT_MASKMODE_HARDBLACK : Hard Black (0) Mask
+#    STILLEXPORT_MASKMODE_VIDEOBLACK : Video Black (16/255) Mask
+#    STILLEXPORT_MASKMODE_FILMBLACK : Film Black (95/1023) Mask
+STILLEXPORT_MASKMODE_CROP="Crop"
+STILLEXPORT_MASKMODE_HARDBLACK="HardBlack"
+STILLEXPORT_MASKMODE_VIDEOBLACK="VideoBlack"
+STILLEXPORT_MASKMODE_FILMBLACK="FilmBlack"
+#  STILLEXPORT_RESOLUTION : Values for StillExportSettings Resolution
+#  STILLEXPORT_TRUELIGHT : Values for StillExportSettings Truelight
+#  SVGFITMODE : Controls how an SVG is transformed/fitted into a shape strip's 'target area' (the working format area or an optional mask area transformed to the working format).
+#    SVGFITMODE_NONE : The SVG is translated to the corner of the target area. No Scaling is applied.
+#    SVGFITMODE_BEST : The SVG image is translated to the centre of the target area and pillarboxed or letterboxed to fit the target area's height or width respectively.
+#    SVGFITMODE_STRETCH : The SVG is stretched horizontally and vertically to fit the target area.
+SVGFITMODE_NONE="None"
+SVGFITMODE_BEST="Best"
+SVGFITMODE_STRETCH="Stretch"
+#  VIDEOLUT : Video Scaling LUT
+#    VIDEOLUT_NONE : No video scaling LUT applied
+#    VIDEOLUT_SCALE : Full to Legal Scale
+#    VIDEOLUT_SCALE_NOCLIP : Full to Legal Scale (Unclipped)
+#    VIDEOLUT_UNSCALE : Legal to Full Scale
+#    VIDEOLUT_FULLRANGE_SOFTCLIP : Soft Clip to Full Range
+#    VIDEOLUT_CLIP : Clip to Legal
+#    VIDEOLUT_SOFTCLIP : Soft Clip to Legal
+VIDEOLUT_NONE="none"
+VIDEOLUT_SCALE="scale"
+VIDEOLUT_SCALE_NOCLIP="scalenoclip"
+VIDEOLUT_UNSCALE="unscale"
+VIDEOLUT_FULLRANGE_SOFTCLIP="fullrangesoftclip"
+VIDEOLUT_CLIP="clip"
+VIDEOLUT_SOFTCLIP="softclip"
@@ -0,0 +1,350 @@
+#
+# FilmLight API Python bindings - session recording and replay
+#
+# A Connection talks to flapid through a websocket-like transport object
+# (send/recv/close). This module provides two such transports:
+#
+#   RecordingSocket  wraps a real websocket and writes every message sent
+#                    and received, with its time, to a session file
+#   ReplaySocket     answers requests from a session file without any
+#                    flapid, at the recorded speed or as fast as possible
+#
+# Either can be selected per Connection with the 'transport' attribute:
+#
+#   conn = flapi.Connection("fs.flux1", username=..., token=...)
+#   conn.transport = flapi.replay.record_transport("/tmp/sync.flapi.gz")
+#   conn.connect()
+#
+# or for every Connection of a process with environment variables:
+#
+#   FLAPI_RECORD=<dir>        record each connection to its own file in <dir>
+#   FLAPI_REPLAY=<file|dir>   replay a session file, or the files in <dir>
+#                             in name order, one per connection opened
+#   FLAPI_REPLAY_SPEED=<x>    1 plays back at recorded speed (default),
+#                             2 twice as fast, 0 without any delay
+#
+# Session files are JSON lines, gzip compressed if the name ends in '.gz'.
+# The first line is a header, then one line per message:
+#
+#   { "flapi_session": 1, "url": ..., "started": <unix time> }
+#   { "t": <seconds since start>, "send": <message text> }
+#   { "t": <seconds since start>, "recv": <message text> }
+#
+# Passwords and tokens of 'connect' messages are not recorded.
+#
+
+import gzip
+import heapq
+import itertools
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+import websocket
+
+from . import FLAPIException
+
+SESSION_VERSION = 1
+
+def open_session(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t")
+    return open(path, mode)
+
+def load_session(path):
+    with open_session(path, "r") as f:
+        lines = [ json.loads(line) for line in f if line.strip() ]
+    if not lines or lines[0].get("flapi_session") != SESSION_VERSION:
+        raise FLAPIException( "%s is not a flapi session file" % path )
+    return lines[0], lines[1:]
+
+###############################################################################
+#
+# RecordingSocket
+#
+# Pass-through websocket that writes each message to a session file.
+# send() and recv() may be called from different threads.
+
+class RecordingSocket:
+
+    def __init__(self, ws, path, url=None):
+        self.ws = ws
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open_session(path, "w")
+        self.started = time.time()
+        self.write({
+            "flapi_session": SESSION_VERSION,
+            "url": url,
+            "started": self.started,
+        })
+
+    def write(self, entry):
+        line = json.dumps(entry) + "\n"
+        with self.lock:
+            if self.file != None:
+                self.file.write(line)
+
+    def send(self, data):
+        entry = { "t": round(time.time() - self.started, 6), "send": self.redact(data) }
+        self.write(entry)
+        return self.ws.send(data)
+
+    def recv(self):
+        data = self.ws.recv()
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        self.write({ "t": round(time.time() - self.started, 6), "recv": data })
+        return data
+
+    def settimeout(self, timeout):
+        self.ws.settimeout(timeout)
+
+    def close(self):
+        try:
+            self.ws.close()
+        finally:
+            with self.lock:
+                if self.file != None:
+                    self.file.close()
+                    self.file = None
+
+    def redact(self, data):
+        if '"connect"' not in data:
+            return data
+        msg = json.loads(data)
+        if msg.get("method") != "connect":
+            return data
+        for key in ("password", "token"):
+            if msg.get(key) != None:
+                msg[key] = None
+        return json.dumps(msg)
+
+###############################################################################
+#
+# ReplaySocket
+#
+# Stand-in websocket which answers from a session file.
+#
+# Each message sent is matched to an unanswered request of the recording
+# with the same method, target and parameters; failing that, to the first
+# one with the same method. The replies and signals which followed that
+# request are then delivered by recv() with their recorded delay divided
+# by 'speed' (no delay if speed is 0), and with the message id of the
+# request actually sent.
+#
+# Object ids in replies are those of the recording, so replay only works
+# for clients which repeat the recorded sequence of calls. A request
+# that cannot be matched raises FLAPIException. 'forget' messages are an
+# exception: their timing depends on garbage collection, so unmatched
+# forgets are simply acknowledged.
+
+class ReplaySocket:
+
+    # Number of unanswered requests searched for a match. Replies to
+    # threaded or pipelined calls may be reordered within this window.
+    WINDOW = 256
+
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = speed
+        self.header, entries = load_session(path)
+        self.exchanges = self.build_exchanges(entries)
+        self.cond = threading.Condition()
+        self.queue = []
+        self.seq = itertools.count()
+        self.closed = False
+        self.timeout = None
+
+    @staticmethod
+    def request_key(msg):
+        key = dict(msg)
+        key.pop("id", None)
+        key.pop("jsonrpc", None)
+        return json.dumps(key, sort_keys=True)
+
+    # Group the recording into requests, each with the messages received
+    # in response: replies matched by id, and signals received after it.
+    #
+    def build_exchanges(self, entries):
+        exchanges = []
+        by_id = {}
+        last = None
+        for entry in entries:
+            if "send" in entry:
+                msg = json.loads(entry["send"])
+                last = {
+                    "t": entry["t"],
+                    "method": msg.get("method"),
+                    "key": self.request_key(msg),
+                    "replies": [],
+                }
+                exchanges.append(last)
+                if msg.get("id") != None:
+                    by_id[msg["id"]] = last
+            elif "recv" in entry:
+                reply = json.loads(entry["recv"])
+                exchange = None
+                if reply.get("method") != "signal":
+                    exchange = by_id.pop(reply.get("id"), None)
+                if exchange == None:
+                    exchange = last
+                if exchange == None:
+                    continue
+                exchange["replies"].append( (max(entry["t"] - exchange["t"], 0.0), reply) )
+        return exchanges
+
+    def match(self, msg):
+        key = self.request_key(msg)
+        method = msg.get("method")
+        window = self.exchanges[:self.WINDOW]
+        for ix, exchange in enumerate(window):
+            if exchange["key"] == key:
+                return self.exchanges.pop(ix)
+        for ix, exchange in enumerate(window):
+            if exchange["method"] == method:
+                return self.exchanges.pop(ix)
+        return None
+
+    def send(self, data):
+        if self.closed:
+            raise FLAPIException( "Connection closed" )
+
+        msg = json.loads(data)
+        with self.cond:
+            exchange = self.match(msg)
+        if exchange == None:
+            if msg.get("method") == "forget":
+                exchange = { "replies": [ (0.0, { "jsonrpc": "2.0", "result": None }) ] }
+            else:
+                raise FLAPIException( "Replay of %s diverged: no recorded request matches %s" % (self.path, data) )
+
+        now = time.time()
+        with self.cond:
+            for delay, reply in exchange["replies"]:
+                if reply.get("method") != "signal":
+                    reply = dict(reply)
+                    reply["id"] = msg.get("id")
+                if self.speed:
+                    due = now + delay / self.speed
+                else:
+                    due = now
+                heapq.heappush( self.queue, (due, next(self.seq), json.dumps(reply)) )
+            self.cond.notify_all()
+
+    # Like a websocket, recv() raises socket.timeout after settimeout()
+    #
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def recv(self):
+        deadline = None
+        if self.timeout != None:
+            deadline = time.time() + self.timeout
+        with self.cond:
+            while True:
+                if self.closed:
+                    raise FLAPIException( "Connection closed" )
+                wait = None
+                if self.queue:
+                    wait = self.queue[0][0] - time.time()
+                    if wait <= 0:
+                        return heapq.heappop(self.queue)[2]
+                if deadline != None:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise socket.timeout( "timed out" )
+                    if wait == None or remaining < wait:
+                        wait = remaining
+                self.cond.wait(wait)
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def remaining(self):
+        with self.cond:
+            return len(self.exchanges)
+
+###############################################################################
+#
+# Transport factories
+#
+# A transport is called by Connection.connect_ws() with the websocket URL
+# and returns the object to use as Connection.websocket.
+
+def record_transport(path):
+    def transport(url):
+        return RecordingSocket(websocket.create_connection(url), path, url)
+    return transport
+
+def replay_transport(path, speed=1.0):
+    def transport(url):
+        return ReplaySocket(path, speed)
+    return transport
+
+connection_counter = itertools.count(1)
+
+# Transport selected by FLAPI_RECORD / FLAPI_REPLAY, or None
+#
+def transport_from_env(hostname):
+    record = os.environ.get("FLAPI_RECORD")
+    replay = os.environ.get("FLAPI_REPLAY")
+    if replay:
+        speed = float(os.environ.get("FLAPI_REPLAY_SPEED", "1"))
+        if os.path.isdir(replay):
+            sessions = sorted(os.listdir(replay))
+            ix = next(connection_counter) - 1
+            if ix >= len(sessions):
+                raise FLAPIException( "No session left in %s for connection %d" % (replay, ix + 1) )
+            replay = os.path.join(replay, sessions[ix])
+        return replay_transport(replay, speed)
+    if record:
+        path = os.path.join(record, "%s-%d-%04d.flapi.gz" % (hostname, os.getpid(), next(connection_counter)))
+        return record_transport(path)
+    return None
+
+# summarize( path )
+#
+# Per-method request count and recorded reply latency of a session file
+#
+def summarize(path):
+    header, entries = load_session(path)
+    sent = {}
+    methods = {}
+    duration = 0.0
+    for entry in entries:
+        duration = max(duration, entry["t"])
+        if "send" in entry:
+            msg = json.loads(entry["send"])
+            m = methods.setdefault(msg.get("method"), { "count": 0, "total_ms": 0.0, "max_ms": 0.0 })
+            m["count"] += 1
+            if msg.get("id") != None:
+                sent[msg["id"]] = (entry["t"], m)
+        else:
+            reply = json.loads(entry["recv"])
+            pending = sent.pop(reply.get("id"), None)
+            if pending != None:
+                ms = (entry["t"] - pending[0]) * 1000.0
+                pending[1]["total_ms"] += ms
+                pending[1]["max_ms"] = max(pending[1]["max_ms"], ms)
+    return {
+        "url": header.get("url"),
+        "started": header.get("started"),
+        "duration": duration,
+        "methods": methods,
+    }
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print( "usage: python -m flapi.replay <session file> ..." )
+        sys.exit(1)
+    for path in sys.argv[1:]:
+        summary = summarize(path)
+        print( "%s: %s, %.3f s" % (path, summary["url"], summary["duration"]) )
+        for method, m in sorted(summary["methods"].items(), key=lambda x: -x[1]["total_ms"]):
+            print( "  %-40s %8d calls %12.1f ms total %10.1f ms max" % (method, m["count"], m["total_ms"], m["max_ms"]) )
@@ -14,6 +14,7 @@ setuptools.setup(
     url="http://www.filmlight.ltd.uk/",
     packages=setuptools.find_packages(),
     install_requires=["websocket-client>=0.48"],
+    extras_require={"aio": ["websockets>=10.0"]},
     classifiers=[
         "Programming Language :: Python",
         "Programming Language :: Python :: 2.7",
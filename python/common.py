@@ -12,16 +12,8 @@ def log(message):
     print ('[' + datetime.now().strftime("%Y%m%d %H:%M") + ']\n' + message + '\n')
 
 def remote_listdir(path, config):
-    cmd_ls_remote = [
-            'ssh',
-            config.get('server_user') + '@' + config.get('server_host'),
-            'ls', '-1',
-            path
-            ]
-
-    cmd_ls_remote_result = subprocess.run(cmd_ls_remote, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    cmd_ls_remote_result = cmd_ls_remote_result.stdout.decode()
-    return cmd_ls_remote_result.split('\n')[:-1]
+    from .util import remote_listdir as util_remote_listdir
+    return util_remote_listdir(path, config.get('server_user'), config.get('server_host'))
 
 def apply_fields(string, fields):
     for k, v in fields.items():
@@ -0,0 +1,89 @@
+import time
+import random
+import threading
+
+from pprint import pformat
+
+
+# Connection options for a flapi_hosts.json entry:
+#
+#   flapi_timeout          deadline in seconds for each flapi call
+#   flapi_connect_timeout  deadline for connecting and authenticating
+#                          (default flapi_timeout)
+#
+# and robot.json "flapi_reconnect_attempts" (default 3), the number of
+# attempts to reconnect a connection lost in the middle of a sync.
+
+def flapi_connection_options(config, flapi_host):
+    robot_config = config.get('robot', {})
+    timeout = flapi_host.get('flapi_timeout')
+    return {
+        'timeout': timeout,
+        'connect_timeout': flapi_host.get('flapi_connect_timeout', timeout),
+        'reconnect_attempts': robot_config.get('flapi_reconnect_attempts', 3)
+    }
+
+
+# Keeps track of Baselight hosts that fail or time out, so that their
+# sequences are skipped for a while instead of stalling every sync cycle.
+#
+# After a failure a host is skipped for robot.json "flapi_host_backoff"
+# seconds (default 30), doubling with each consecutive failure up to
+# "flapi_host_backoff_max" (default 600), with random jitter. The first
+# successful connection clears it.
+
+class FlapiHostHealth(object):
+    def __init__(self, config):
+        self.config = config
+        self.log = config.get('log')
+        self.lock = threading.Lock()
+        self.hosts = {}
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        return {
+            'backoff': robot_config.get('flapi_host_backoff', 30),
+            'backoff_max': robot_config.get('flapi_host_backoff_max', 600)
+        }
+
+    def available(self, hostname):
+        with self.lock:
+            host = self.hosts.get(hostname)
+            if host is None:
+                return True
+            retry_in = host['retry_at'] - time.time()
+        if retry_in <= 0:
+            return True
+        self.log.verbose('skipping flapi host %s for another %d s after %s failure(s): %s' % (
+            hostname, retry_in, host['failures'], host['last_error']
+        ))
+        return False
+
+    def failure(self, hostname, error):
+        settings = self.settings()
+        with self.lock:
+            host = self.hosts.setdefault(hostname, {'failures': 0})
+            host['failures'] += 1
+            delay = min(settings['backoff'] * 2 ** (host['failures'] - 1), settings['backoff_max'])
+            delay = random.uniform(delay / 2.0, delay)
+            host['retry_at'] = time.time() + delay
+            host['last_error'] = str(error)
+        self.log.info('flapi host %s failed, retrying in %d s: %s' % (hostname, delay, pformat(error)))
+
+    def success(self, hostname):
+        with self.lock:
+            host = self.hosts.pop(hostname, None)
+        if host is not None:
+            self.log.info('flapi host %s is back after %s failure(s)' % (hostname, host['failures']))
+
+    def get_stats(self):
+        now = time.time()
+        with self.lock:
+            return {
+                hostname: {
+                    'failures': host['failures'],
+                    'retry_in': max(int(host['retry_at'] - now), 0),
+                    'last_error': host['last_error']
+                }
+                for hostname, host in self.hosts.items()
+            }
@@ -0,0 +1,170 @@
+import time
+import threading
+
+from pprint import pformat
+
+from .flapi_hosts import flapi_connection_options
+
+
+# Keeps authenticated flapi connections warm between sync cycles.
+#
+# Connections are keyed by the flapi_hostname / flapi_user / flapi_token
+# of a flapi_hosts.json entry and checked out exclusively: acquire()
+# hands out an idle connection after validating it, or opens a new one,
+# release() puts it back. Idle connections are closed after
+# robot.json "flapi_pool_idle_ttl" seconds (default 300).
+
+class FlapiConnectionPool(object):
+    def __init__(self, config):
+        self.config = config
+        self.log = config.get('log')
+        self.lock = threading.Lock()
+        self.idle = {}
+        self.stats = {
+            'connects': 0,
+            'reused': 0,
+            'failed_checks': 0,
+            'evicted': 0,
+            'discarded': 0
+        }
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        return {
+            'idle_ttl': robot_config.get('flapi_pool_idle_ttl', 300),
+            'validate_after': robot_config.get('flapi_pool_validate_after', 30),
+            'max_idle': robot_config.get('flapi_pool_max_idle', 4)
+        }
+
+    def key(self, flapi_host):
+        return (
+            flapi_host.get('flapi_hostname'),
+            flapi_host.get('flapi_user'),
+            flapi_host.get('flapi_token')
+        )
+
+    def acquire(self, flapi, flapi_host):
+        key = self.key(flapi_host)
+        settings = self.settings()
+        options = flapi_connection_options(self.config, flapi_host)
+        self.evict_idle()
+
+        while True:
+            with self.lock:
+                idle_conns = self.idle.get(key)
+                if not idle_conns:
+                    break
+                conn, last_used = idle_conns.pop()
+
+            # flapi_hosts.json may have changed since the connection was opened
+            conn.set_timeout(options['timeout'], options['connect_timeout'])
+            conn.reconnect_attempts = options['reconnect_attempts']
+            if self.is_healthy(flapi, conn, time.time() - last_used > settings['validate_after']):
+                with self.lock:
+                    self.stats['reused'] += 1
+                return conn
+
+            self.log.verbose('discarding stale flapi connection to %s' % key[0])
+            with self.lock:
+                self.stats['failed_checks'] += 1
+            self.close_connection(conn)
+
+        conn = flapi.Connection(
+            key[0],
+            username=key[1],
+            token=key[2],
+            threaded=True,
+            **options
+        )
+        conn.connect()
+        with self.lock:
+            self.stats['connects'] += 1
+        return conn
+
+    def release(self, conn, flapi_host, discard=False):
+        if conn is None:
+            return
+
+        key = self.key(flapi_host)
+        max_idle = self.settings()['max_idle']
+
+        # a connection that timed out or was lost may be out of sync
+        if conn.timeouts or conn.session_lost:
+            discard = True
+
+        if not discard and conn.is_connected():
+            # forgets queued by garbage collected handles
+            if conn.release_queue:
+                try:
+                    conn.flush_releases()
+                except Exception as e:
+                    self.log.debug('error flushing flapi releases: %s' % pformat(e))
+            with self.lock:
+                idle_conns = self.idle.setdefault(key, [])
+                if len(idle_conns) < max_idle:
+                    idle_conns.append((conn, time.time()))
+                    return
+
+        with self.lock:
+            self.stats['discarded'] += 1
+        self.close_connection(conn)
+
+    def is_healthy(self, flapi, conn, ping):
+        if not conn.is_connected():
+            return False
+        if conn.reader_thread is not None:
+            if conn.reader_error is not None or not conn.reader_thread.is_alive():
+                return False
+        if not ping:
+            return True
+        try:
+            conn.Utilities.timecode_from_string('00:00:00:00', 24)
+            return True
+        except flapi.FLAPIException as e:
+            return False
+        except Exception as e:
+            return False
+
+    def evict_idle(self):
+        idle_ttl = self.settings()['idle_ttl']
+        now = time.time()
+        expired = []
+
+        with self.lock:
+            for key in list(self.idle.keys()):
+                keep = []
+                for conn, last_used in self.idle[key]:
+                    if now - last_used > idle_ttl:
+                        expired.append((key, conn))
+                    else:
+                        keep.append((conn, last_used))
+                if keep:
+                    self.idle[key] = keep
+                else:
+                    del self.idle[key]
+            self.stats['evicted'] += len(expired)
+
+        for key, conn in expired:
+            self.log.verbose('closing idle flapi connection to %s' % key[0])
+            self.close_connection(conn)
+
+    def close_connection(self, conn):
+        try:
+            conn.close()
+        except Exception as e:
+            self.log.debug('error closing flapi connection: %s' % pformat(e))
+
+    def close_all(self):
+        with self.lock:
+            idle = self.idle
+            self.idle = {}
+        for key in idle.keys():
+            for conn, last_used in idle[key]:
+                self.close_connection(conn)
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats['idle'] = sum(len(x) for x in self.idle.values())
+        stats['connects_avoided'] = stats['reused']
+        return stats
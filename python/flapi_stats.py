@@ -0,0 +1,79 @@
+import os
+import json
+import time
+import threading
+
+from pprint import pformat
+
+
+# Collects per-method flapi call statistics for every connection the robot
+# opens and writes them to the log folder.
+#
+# Enabled with robot.json "flapi_stats" (default false). All connections
+# share one flapi.CallStats, so the snapshot covers every thread. dump()
+# writes it to <log_folder>/flapi_stats.json at most once every
+# robot.json "flapi_stats_interval" seconds (default 300).
+
+class FlapiStats(object):
+    def __init__(self, config):
+        self.config = config
+        self.log = config.get('log')
+        self.lock = threading.Lock()
+        self.call_stats = None
+        self.last_dump = time.time()
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        return {
+            'enabled': robot_config.get('flapi_stats', False),
+            'interval': robot_config.get('flapi_stats_interval', 300)
+        }
+
+    def attach(self, flapi, conn):
+        if conn is None:
+            return
+        if not self.settings()['enabled']:
+            conn.disable_stats()
+            return
+        with self.lock:
+            if self.call_stats is None:
+                self.call_stats = flapi.CallStats()
+        if conn.stats is not self.call_stats:
+            conn.enable_stats(self.call_stats)
+
+    def snapshot(self):
+        if self.call_stats is None:
+            return None
+        return self.call_stats.snapshot()
+
+    def dump(self, force=False):
+        settings = self.settings()
+        if not force and time.time() - self.last_dump < settings['interval']:
+            return
+        self.last_dump = time.time()
+
+        snapshot = self.snapshot()
+        if not snapshot or not snapshot.get('methods'):
+            return
+
+        log_folder = self.config.get('log_folder')
+        if not log_folder:
+            return
+        stats_path = os.path.join(log_folder, 'flapi_stats.json')
+        try:
+            with open(stats_path + '.tmp', 'w') as f:
+                json.dump(snapshot, f, indent=4, sort_keys=True)
+            os.replace(stats_path + '.tmp', stats_path)
+        except Exception as e:
+            self.log.debug('unable to write flapi stats to %s: %s' % (stats_path, pformat(e)))
+            return
+
+        slowest = sorted(
+            snapshot['methods'].items(),
+            key=lambda x: x[1]['total_ms'],
+            reverse=True
+        )[:5]
+        for method, m in slowest:
+            self.log.debug('flapi %s: %s calls, %s errors, mean %.1f ms, p95 %s ms, %s bytes in' % (
+                method, m['count'], m['errors'], m['mean_ms'], m['p95_ms'], m['reply_bytes']
+            ))
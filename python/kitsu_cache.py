@@ -0,0 +1,152 @@
+import time
+import copy
+import threading
+
+
+# Process wide cache of Kitsu entities, shared by the set_metadata_fields
+# and sequence_sync threads.
+#
+#   projects, sequences    kept for robot.json "kitsu_cache_ttl" seconds
+#                          (default 60)
+#   shots                  kept for kitsu_cache_ttl, and dropped as soon as
+#                          a listing shows a different updated_at
+#   task types, statuses   kept for "kitsu_cache_static_ttl" seconds
+#                          (default 600)
+#
+# Shot listings (gazu.shot.all_shots_for_sequence) are not cached, they are
+# what tells the robot that Kitsu changed, but they fill the shot cache so
+# that gazu.shot.get_shot() is not needed for shots that were just listed.
+# Callers get copies and may modify them. "kitsu_cache": false turns the
+# cache off.
+
+def get_kitsu_cache(config):
+    kitsu_cache = config.get('kitsu_cache')
+    if kitsu_cache is None:
+        kitsu_cache = config.setdefault('kitsu_cache', KitsuCache(config))
+    return kitsu_cache
+
+
+class KitsuCache(object):
+    def __init__(self, config):
+        self.config = config
+        self.log = config.get('log')
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.stats = {}
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        return {
+            'enabled': robot_config.get('kitsu_cache', True),
+            'ttl': robot_config.get('kitsu_cache_ttl', 60),
+            'static_ttl': robot_config.get('kitsu_cache_static_ttl', 600)
+        }
+
+    def count(self, kind, stat):
+        kind_stats = self.stats.setdefault(kind, {'hits': 0, 'misses': 0, 'invalidated': 0})
+        kind_stats[stat] += 1
+
+    # returns a copy of the cached (kind, key) entry, or of fetch() which
+    # is then cached for ttl seconds. updated_at, if given, has to match.
+    def get(self, kind, key, fetch, ttl, updated_at=None):
+        if not self.settings()['enabled']:
+            return fetch()
+
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get((kind, key))
+            if entry is not None:
+                value, expires = entry
+                if expires < now:
+                    entry = None
+                elif updated_at is not None and isinstance(value, dict) and value.get('updated_at') != updated_at:
+                    self.count(kind, 'invalidated')
+                    entry = None
+            if entry is not None:
+                self.count(kind, 'hits')
+                return copy.deepcopy(value)
+            self.count(kind, 'misses')
+
+        value = fetch()
+        self.put(kind, key, value, ttl)
+        return copy.deepcopy(value)
+
+    def put(self, kind, key, value, ttl):
+        if value is None or not self.settings()['enabled']:
+            return
+        with self.lock:
+            self.entries[(kind, key)] = (copy.deepcopy(value), time.time() + ttl)
+
+    def invalidate(self, kind, key=None):
+        with self.lock:
+            for entry_key in list(self.entries.keys()):
+                if entry_key[0] == kind and (key is None or entry_key[1] == key):
+                    del self.entries[entry_key]
+
+    def all_open_projects(self, gazu, client=None):
+        def fetch():
+            if client is None:
+                return gazu.project.all_open_projects()
+            return gazu.project.all_open_projects(client=client)
+        return self.get('projects', 'open', fetch, self.settings()['ttl'])
+
+    def get_project(self, gazu, project_id):
+        return self.get(
+            'project', project_id,
+            lambda: gazu.project.get_project(project_id),
+            self.settings()['ttl']
+        )
+
+    def project_sequences(self, gazu, project_id):
+        return self.get(
+            'sequences', project_id,
+            lambda: gazu.client.get('/data/projects/' + project_id + '/sequences'),
+            self.settings()['ttl']
+        )
+
+    def all_shots_for_sequence(self, gazu, sequence):
+        shots = gazu.shot.all_shots_for_sequence(sequence)
+        self.put_shots(shots)
+        return shots
+
+    def put_shots(self, shots):
+        ttl = self.settings()['ttl']
+        for shot in shots:
+            if shot.get('id'):
+                self.put('shot', shot['id'], shot, ttl)
+
+    def get_shot(self, gazu, shot_id, updated_at=None):
+        return self.get(
+            'shot', shot_id,
+            lambda: gazu.shot.get_shot(shot_id),
+            self.settings()['ttl'],
+            updated_at
+        )
+
+    def update_shot(self, gazu, shot):
+        updated_shot = gazu.shot.update_shot(shot)
+        if isinstance(updated_shot, dict) and updated_shot.get('id'):
+            self.put('shot', updated_shot['id'], updated_shot, self.settings()['ttl'])
+        else:
+            self.invalidate('shot', shot.get('id'))
+        return updated_shot
+
+    def all_task_types(self, gazu):
+        return self.get(
+            'task_types', 'all',
+            gazu.task.all_task_types,
+            self.settings()['static_ttl']
+        )
+
+    def get_task_status_by_short_name(self, gazu, short_name):
+        return self.get(
+            'task_status', short_name,
+            lambda: gazu.task.get_task_status_by_short_name(short_name),
+            self.settings()['static_ttl']
+        )
+
+    def get_stats(self):
+        with self.lock:
+            stats = {kind: dict(kind_stats) for kind, kind_stats in self.stats.items()}
+            stats['entries'] = len(self.entries)
+        return stats
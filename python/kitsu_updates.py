@@ -0,0 +1,161 @@
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pprint import pformat
+
+from .kitsu_cache import get_kitsu_cache
+
+
+# Collects the Kitsu shot updates of a sequence and sends them together.
+#
+#   updater = KitsuShotUpdater(config, gazu)
+#   updater.add(kitsu_shot, new_data)      # any number of times per shot
+#   results = updater.flush()              # {shot_id: updated shot or None}
+#
+# Updates to the same shot are merged into one request. flush() sends them
+# on the process-wide KitsuRequestPool, shared by all sequences synced at
+# once, so there are never more than robot.json "kitsu_update_workers"
+# requests in flight (default: gazu.json "max_concurrency", 4). The gazu
+# client's HTTP connection pool is sized to match, once.
+# A shot update puts the whole shot, so a failed request is simply sent
+# again, up to "kitsu_update_retries" times (default 3) with backoff.
+
+def size_http_pool(gazu, pool_size):
+    client = getattr(gazu.client, 'default_client', None)
+    session = getattr(client, 'session', None)
+    if session is None or getattr(session, 'kitsu_robot_pool_size', 0) >= pool_size:
+        return
+    try:
+        from requests.adapters import HTTPAdapter
+    except ImportError:
+        return
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.kitsu_robot_pool_size = pool_size
+
+
+# The pool is sized when it is first used; a changed setting applies
+# after a restart of the robot.
+class KitsuRequestPool(object):
+    def __init__(self, config):
+        self.config = config
+        self.lock = threading.Lock()
+        self.executor = None
+        self.workers = None
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        config_gazu = self.config.get('gazu', {})
+        workers = robot_config.get('kitsu_update_workers', config_gazu.get('max_concurrency', 4))
+        return {
+            'workers': max(int(workers), 1)
+        }
+
+    def get_executor(self, gazu):
+        with self.lock:
+            if self.executor is None:
+                self.workers = self.settings()['workers']
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix='kitsu request'
+                )
+            # mounts an adapter only the first time for a session
+            size_http_pool(gazu, self.workers)
+            return self.executor
+
+
+def get_kitsu_request_pool(config):
+    kitsu_request_pool = config.get('kitsu_request_pool')
+    if kitsu_request_pool is None:
+        kitsu_request_pool = config.setdefault('kitsu_request_pool', KitsuRequestPool(config))
+    return kitsu_request_pool
+
+
+class KitsuShotUpdater(object):
+    def __init__(self, config, gazu):
+        self.config = config
+        self.log = config.get('log')
+        self.gazu = gazu
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.stats = {
+            'added': 0,
+            'coalesced': 0,
+            'sent': 0,
+            'retried': 0,
+            'failed': 0,
+            'seconds': 0
+        }
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        return {
+            'retries': max(int(robot_config.get('kitsu_update_retries', 3)), 0),
+            'retry_delay': robot_config.get('kitsu_update_retry_delay', 1)
+        }
+
+    def add(self, kitsu_shot, new_data):
+        shot_id = kitsu_shot.get('id')
+        with self.lock:
+            self.stats['added'] += 1
+            if shot_id in self.pending:
+                self.stats['coalesced'] += 1
+                self.pending[shot_id]['data'].update(new_data)
+                return
+            kitsu_shot = dict(kitsu_shot)
+            kitsu_shot['data'] = dict(kitsu_shot.get('data') or {})
+            kitsu_shot['data'].update(new_data)
+            self.pending[shot_id] = kitsu_shot
+
+    def update(self, kitsu_shot):
+        settings = self.settings()
+        kitsu_cache = get_kitsu_cache(self.config)
+        attempt = 0
+        while True:
+            try:
+                return kitsu_cache.update_shot(self.gazu, kitsu_shot)
+            except Exception as e:
+                if attempt >= settings['retries']:
+                    with self.lock:
+                        self.stats['failed'] += 1
+                    self.log.error('unable to update shot %s: %s' % (kitsu_shot.get('name'), pformat(e)))
+                    return None
+                delay = settings['retry_delay'] * 2 ** attempt
+                attempt += 1
+                with self.lock:
+                    self.stats['retried'] += 1
+                self.log.verbose('retrying update of shot %s in %.1f s: %s' % (kitsu_shot.get('name'), delay, pformat(e)))
+                time.sleep(random.uniform(delay / 2.0, delay))
+
+    def flush(self):
+        with self.lock:
+            pending = self.pending
+            self.pending = {}
+        if not pending:
+            return {}
+
+        executor = get_kitsu_request_pool(self.config).get_executor(self.gazu)
+
+        start = time.time()
+        results = {}
+        futures = {shot_id: executor.submit(self.update, kitsu_shot) for shot_id, kitsu_shot in pending.items()}
+        for shot_id, future in futures.items():
+            results[shot_id] = future.result()
+        elapsed = time.time() - start
+
+        sent = len([x for x in results.values() if x is not None])
+        with self.lock:
+            self.stats['sent'] += sent
+            self.stats['seconds'] += elapsed
+        self.log.info('updated %s Kitsu shot(s) in %.2f s (%.1f/s)' % (sent, elapsed, sent / max(elapsed, 0.001)))
+        return results
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+        stats['seconds'] = round(stats['seconds'], 3)
+        stats['per_second'] = round(stats['sent'] / stats['seconds'], 1) if stats['seconds'] else 0
+        return stats
@@ -0,0 +1,124 @@
+import json
+
+
+# Reconciles Baselight shot marks with the "01_locator" of Kitsu shots.
+#
+# Marks are compared as (category, record frame, note) tuples. The marks a
+# locator asks for are added, and marks the robot added earlier that are
+# no longer asked for are removed. Marks made in Baselight are never
+# removed. Which marks the robot added is kept per shot in the sync state.
+#
+# read_shot_marks() reads the marks of many shots in a few pipelined
+# round trips instead of one per mark.
+
+def mark_key(category, frame, note):
+    return (category, int(frame), note or '')
+
+def match_category(category, mark_categories):
+    for candidate in (category, category.lower(), category.upper()):
+        if candidate in mark_categories:
+            return candidate
+    return None
+
+def parse_locator(locator_string, mark_categories):
+    try:
+        locator = json.loads(locator_string)
+    except ValueError:
+        category = match_category(locator_string, mark_categories)
+        if category is None:
+            return []
+        locator = [{'type': category}]
+
+    if isinstance(locator, list):
+        return locator
+    else:
+        return [locator]
+
+# Mark keys asked for by a parsed locator, for a shot starting at
+# start_frame. Entries that are not usable are returned separately.
+def locator_marks(locator, mark_categories, start_frame):
+    wanted = set()
+    skipped = []
+    for new_mark_info in locator:
+        if not isinstance(new_mark_info, dict):
+            skipped.append((new_mark_info, 'mark info is not a dict'))
+            continue
+        try:
+            frame = int(new_mark_info.get('frame', 0))
+        except (TypeError, ValueError):
+            frame = 0
+        category = match_category(str(new_mark_info.get('type', mark_categories[0])), mark_categories)
+        if category is None:
+            skipped.append((new_mark_info, 'mark type is not in mark categories'))
+            continue
+        wanted.add(mark_key(category, start_frame + frame, new_mark_info.get('label', '')))
+    return wanted, skipped
+
+# Returns {shot_id: {'start_frame', 'src_start_frame', 'marks': {key: mark_id}}}
+def read_shot_marks(conn, scene, shot_ids):
+    if not shot_ids:
+        return {}
+
+    with conn.pipeline():
+        shot_futures = [scene.get_shot(shot_id) for shot_id in shot_ids]
+    shots = conn.gather(shot_futures)
+
+    with conn.pipeline():
+        start_futures = [shot.get_start_frame() for shot in shots]
+        src_start_futures = [shot.get_src_start_frame() for shot in shots]
+        mark_ids_futures = [shot.get_mark_ids() for shot in shots]
+    start_frames = conn.gather(start_futures)
+    src_start_frames = conn.gather(src_start_futures)
+    shot_mark_ids = conn.gather(mark_ids_futures)
+
+    mark_refs = []
+    with conn.pipeline():
+        mark_futures = []
+        for shot_ix, shot in enumerate(shots):
+            for mark_id in shot_mark_ids[shot_ix]:
+                mark_refs.append((shot_ix, mark_id))
+                mark_futures.append(shot.get_mark(mark_id))
+    marks = conn.gather(mark_futures)
+
+    with conn.pipeline():
+        category_futures = [mark.get_category() for mark in marks]
+        frame_futures = [mark.get_record_frame() for mark in marks]
+        note_futures = [mark.get_note_text() for mark in marks]
+    categories = conn.gather(category_futures)
+    frames = conn.gather(frame_futures)
+    notes = conn.gather(note_futures)
+
+    with conn.release_scope():
+        for mark in marks:
+            mark.release()
+        for shot in shots:
+            shot.release()
+
+    shot_marks = {}
+    for shot_ix, shot_id in enumerate(shot_ids):
+        shot_marks[shot_id] = {
+            'start_frame': start_frames[shot_ix],
+            'src_start_frame': src_start_frames[shot_ix],
+            'marks': {}
+        }
+    for mark_ix, (shot_ix, mark_id) in enumerate(mark_refs):
+        key = mark_key(categories[mark_ix], frames[mark_ix], notes[mark_ix])
+        shot_marks[shot_ids[shot_ix]]['marks'][key] = mark_id
+    return shot_marks
+
+# Returns (keys to add, {key: mark_id} to remove)
+def reconcile_marks(wanted, existing, owned):
+    to_add = wanted - set(existing.keys())
+    to_remove = dict((key, existing[key]) for key in (owned - wanted) if key in existing)
+    return to_add, to_remove
+
+def encode_marks(keys):
+    return json.dumps(sorted(list(key) for key in keys))
+
+def decode_marks(value):
+    if not value:
+        return set()
+    try:
+        return set(mark_key(*key) for key in json.loads(value))
+    except (ValueError, TypeError):
+        return set()
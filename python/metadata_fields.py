@@ -2,6 +2,7 @@ import os
 import sys
 import time
 from .config import get_config_data
+from .kitsu_cache import get_kitsu_cache
 from pprint import pprint, pformat
 
 def set_metadata_fields(config):
@@ -24,7 +25,7 @@ def set_metadata_fields(config):
             gazu_client = gazu.client.create_client(host)
             gazu.log_in(name, password, client = gazu_client)
 
-            projects = gazu.project.all_open_projects(client = gazu_client)
+            projects = get_kitsu_cache(config).all_open_projects(gazu, client = gazu_client)
             for project in projects:
                 project_descriptors = gazu.all_metadata_descriptors(project, client = gazu_client)
                 pprint (project)
@@ -0,0 +1,163 @@
+import time
+import threading
+
+from pprint import pformat
+
+
+# Waits for operations on a Baselight queue.
+#
+#   tracker = QueueOperationTracker(config, flapi, qm)
+#   statuses = tracker.wait([op_id, ...])      # {op_id: QueueOpStatus}
+#   log = tracker.finish(op_id)                # operation log, archived
+#   tracker.close()
+#
+# On a threaded flapi connection the tracker subscribes to the queue's
+# QueueOpStatusChanged signal once, and waiting threads only query the
+# operations a signal was received for. Signals are backed by a check of
+# every pending operation each robot.json "queue_signal_check" seconds
+# (default 5) in case one is missed. Without signals the operations are
+# polled, starting every "queue_poll_min" seconds (default 0.25) and
+# backing off to "queue_poll_max" (default 5) while nothing changes.
+#
+# wait() gives up on operations that made no progress for
+# "queue_stall_timeout" seconds (default 60).
+
+class QueueOperationTracker(object):
+    def __init__(self, config, flapi, qm):
+        self.config = config
+        self.log = config.get('log')
+        self.flapi = flapi
+        self.qm = qm
+        self.cond = threading.Condition()
+        self.changed = set()
+        self.all_changed = False
+        self.signals = False
+        self.stats = {
+            'signals': 0,
+            'queries': 0
+        }
+
+        # signals are only delivered while waiting on a threaded connection
+        if getattr(qm.conn, 'reader_thread', None) is None:
+            return
+        try:
+            qm.connect('QueueOpStatusChanged', self.on_status_changed)
+            qm.enable_updates()
+            self.signals = True
+        except flapi.FLAPIException as e:
+            self.log.verbose('queue status signals unavailable, polling: %s' % e)
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        return {
+            'signal_check': robot_config.get('queue_signal_check', 5),
+            'poll_min': robot_config.get('queue_poll_min', 0.25),
+            'poll_max': robot_config.get('queue_poll_max', 5),
+            'stall_timeout': robot_config.get('queue_stall_timeout', 60)
+        }
+
+    def finished_statuses(self):
+        return (
+            self.flapi.OPSTATUS_DONE,
+            self.flapi.OPSTATUS_CRASHED,
+            self.flapi.OPSTATUS_STOPPED,
+            self.flapi.OPSTATUS_TOONEW
+        )
+
+    def on_status_changed(self, qm, signal, args):
+        op_id = args
+        if isinstance(args, dict):
+            op_id = args.get('ID', args.get('id'))
+        with self.cond:
+            self.stats['signals'] += 1
+            if op_id is None:
+                self.all_changed = True
+            else:
+                self.changed.add(op_id)
+            self.cond.notify_all()
+
+    def query(self, op_ids):
+        conn = self.qm.conn
+        with conn.pipeline():
+            futures = [self.qm.get_operation_status(op_id) for op_id in op_ids]
+        with self.cond:
+            self.stats['queries'] += len(op_ids)
+        return dict(zip(op_ids, conn.gather(futures)))
+
+    # Waits until the given operations finish or stall, calling
+    # progress(op_id, status) on every change. Returns their last status.
+    def wait(self, op_ids, progress=None):
+        settings = self.settings()
+        finished = self.finished_statuses()
+        pending = set(op_ids)
+        statuses = {}
+        last_change = dict((op_id, time.time()) for op_id in pending)
+        poll_delay = settings['poll_min']
+        to_check = set(pending)
+
+        while pending:
+            changed = False
+            for op_id, status in self.query(sorted(to_check)).items():
+                previous = statuses.get(op_id)
+                statuses[op_id] = status
+                if previous is None or (status.Status, status.Progress) != (previous.Status, previous.Progress):
+                    changed = True
+                    last_change[op_id] = time.time()
+                    if progress:
+                        progress(op_id, status)
+                if status.Status in finished:
+                    pending.discard(op_id)
+
+            now = time.time()
+            for op_id in list(pending):
+                if now - last_change[op_id] > settings['stall_timeout']:
+                    self.log.info('stopped waiting for queue operation %s: no progress for %s s' % (
+                        op_id, settings['stall_timeout']
+                    ))
+                    pending.discard(op_id)
+            if not pending:
+                break
+
+            with self.cond:
+                if self.signals:
+                    if not (self.all_changed or self.changed & pending):
+                        self.cond.wait(settings['signal_check'])
+                    if self.all_changed or not (self.changed & pending):
+                        # a full check, after a signal for all or a quiet period
+                        to_check = set(pending)
+                    else:
+                        to_check = self.changed & pending
+                    self.changed -= to_check
+                    self.all_changed = False
+                else:
+                    poll_delay = settings['poll_min'] if changed else min(poll_delay * 1.5, settings['poll_max'])
+                    self.cond.wait(poll_delay)
+                    to_check = set(pending)
+
+        return statuses
+
+    # Returns the log of a finished operation and archives it, in one
+    # round trip.
+    def finish(self, op_id):
+        conn = self.qm.conn
+        with conn.pipeline():
+            log_future = self.qm.get_operation_log(op_id)
+            archive_future = self.qm.archive_operation(op_id)
+        operation_log, archived = conn.gather([log_future, archive_future])
+        return operation_log
+
+    def close(self):
+        if not self.signals:
+            return
+        self.signals = False
+        try:
+            self.qm.disable_updates()
+            self.qm.disconnect('QueueOpStatusChanged', self.on_status_changed)
+        except self.flapi.FLAPIException as e:
+            self.log.debug('error unsubscribing from queue status signals: %s' % pformat(e))
+
+    def get_stats(self):
+        with self.cond:
+            stats = dict(self.stats)
+        stats['signals_enabled'] = self.signals
+        return stats
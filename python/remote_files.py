@@ -0,0 +1,282 @@
+import os
+import time
+import shlex
+import tarfile
+import tempfile
+import threading
+import subprocess
+
+from pprint import pformat
+
+
+# File operations on the Baselight hosts.
+#
+# RemoteFiles keeps one backend per flapi_hostname and batches operations:
+#
+#   listdir(flapi_host, path)     names in a folder
+#   stat(flapi_host, paths)       {path: {'size': bytes, 'mtime': seconds}}
+#   fetch(flapi_host, paths)      {path: file contents}, read into memory
+#   delete(flapi_host, paths)     remove files
+#
+# Backends, robot.json "remote_files_backend":
+#
+#   "ssh"    (default) OpenSSH with a shared ControlMaster connection per
+#            host, kept open for "remote_files_persist" seconds (default
+#            600), so only the first operation pays for the key exchange.
+#            Each batch is one remote command; fetch streams a tar of the
+#            files back instead of a copy per file.
+#   "local"  folders under "remote_files_local_root" stand in for the
+#            hosts' file systems, for tests and benchmarks
+#
+# The time taken by each operation is kept per operation type.
+
+def quote_args(args):
+    return ' '.join(shlex.quote(str(arg)) for arg in args)
+
+def chunks(items, size):
+    for ix in range(0, len(items), size):
+        yield items[ix:ix + size]
+
+
+class SSHBackend(object):
+    batch_size = 200
+
+    def __init__(self, user, host, persist=600, timeout=60, control_dir=None):
+        self.target = user + '@' + host if user else host
+        self.timeout = timeout
+        control_dir = control_dir or tempfile.gettempdir()
+        self.options = [
+            '-o', 'ControlMaster=auto',
+            '-o', 'ControlPath=' + os.path.join(control_dir, 'kitsu-robot-ssh-%C'),
+            '-o', 'ControlPersist=%d' % persist,
+            '-o', 'BatchMode=yes',
+            '-o', 'ConnectTimeout=%d' % min(timeout, 30)
+        ]
+
+    def command(self, remote_command):
+        return ['ssh'] + self.options + [self.target, remote_command]
+
+    def run(self, remote_command, check=True):
+        result = subprocess.run(
+            self.command(remote_command),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=self.timeout
+        )
+        # 255 is ssh itself failing, other codes come from the remote command
+        if result.returncode == 255 or (check and result.returncode != 0):
+            raise IOError('ssh %s "%s" failed: %s' % (
+                self.target, remote_command, result.stderr.decode(errors='replace').strip()
+            ))
+        return result.stdout
+
+    def listdir(self, path):
+        output = self.run('ls -1 -- %s' % quote_args([path]), check=False)
+        return [x for x in output.decode(errors='replace').split('\n') if x]
+
+    def stat(self, paths):
+        stats = {}
+        for batch in chunks(paths, self.batch_size):
+            output = self.run("stat -c '%%s %%Y %%n' -- %s" % quote_args(batch), check=False)
+            for line in output.decode(errors='replace').split('\n'):
+                parts = line.split(' ', 2)
+                if len(parts) == 3:
+                    stats[parts[2]] = {'size': int(parts[0]), 'mtime': int(parts[1])}
+        return stats
+
+    def fetch(self, paths):
+        files = {}
+        by_folder = {}
+        for path in paths:
+            by_folder.setdefault(os.path.dirname(path), []).append(os.path.basename(path))
+
+        for folder, names in by_folder.items():
+            for batch in chunks(names, self.batch_size):
+                proc = subprocess.Popen(
+                    self.command('tar -cf - -C %s -- %s' % (quote_args([folder or '/']), quote_args(batch))),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE
+                )
+                try:
+                    with tarfile.open(fileobj=proc.stdout, mode='r|') as tar:
+                        for member in tar:
+                            if not member.isfile():
+                                continue
+                            files[os.path.join(folder, member.name)] = tar.extractfile(member).read()
+                except tarfile.TarError:
+                    pass
+                finally:
+                    proc.stdout.close()
+                    stderr = proc.stderr.read()
+                    proc.stderr.close()
+                    if proc.wait(timeout=self.timeout) == 255:
+                        raise IOError('ssh %s failed: %s' % (self.target, stderr.decode(errors='replace').strip()))
+        return files
+
+    def delete(self, paths):
+        for batch in chunks(paths, self.batch_size):
+            self.run('rm -f -- %s' % quote_args(batch), check=False)
+
+    def close(self):
+        subprocess.run(
+            ['ssh'] + self.options + ['-O', 'exit', self.target],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+
+class LocalBackend(object):
+    def __init__(self, root):
+        self.root = root
+
+    def local_path(self, path):
+        return os.path.join(self.root, path.lstrip('/'))
+
+    def listdir(self, path):
+        try:
+            return sorted(os.listdir(self.local_path(path)))
+        except OSError:
+            return []
+
+    def stat(self, paths):
+        stats = {}
+        for path in paths:
+            try:
+                st = os.stat(self.local_path(path))
+            except OSError:
+                continue
+            stats[path] = {'size': st.st_size, 'mtime': int(st.st_mtime)}
+        return stats
+
+    def fetch(self, paths):
+        files = {}
+        for path in paths:
+            try:
+                with open(self.local_path(path), 'rb') as f:
+                    files[path] = f.read()
+            except (IOError, OSError):
+                continue
+        return files
+
+    def delete(self, paths):
+        for path in paths:
+            try:
+                os.remove(self.local_path(path))
+            except OSError:
+                pass
+
+    def close(self):
+        pass
+
+
+# Shared ssh backends for the plain helpers in util.py
+ssh_backends = {}
+ssh_backends_lock = threading.Lock()
+
+def get_ssh_backend(user, host):
+    with ssh_backends_lock:
+        backend = ssh_backends.get((user, host))
+        if backend is None:
+            backend = ssh_backends[(user, host)] = SSHBackend(user, host)
+        return backend
+
+
+class RemoteFiles(object):
+    def __init__(self, config):
+        self.config = config
+        self.log = config.get('log')
+        self.lock = threading.Lock()
+        self.backends = {}
+        self.stats = {}
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        return {
+            'backend': robot_config.get('remote_files_backend', 'ssh'),
+            'local_root': robot_config.get('remote_files_local_root', ''),
+            'persist': robot_config.get('remote_files_persist', 600),
+            'timeout': robot_config.get('remote_files_timeout', 60)
+        }
+
+    def get_backend(self, flapi_host):
+        hostname = flapi_host.get('flapi_hostname')
+        with self.lock:
+            backend = self.backends.get(hostname)
+            if backend is not None:
+                return backend
+            settings = self.settings()
+            if settings['backend'] == 'local':
+                backend = LocalBackend(os.path.join(settings['local_root'], hostname))
+            else:
+                backend = SSHBackend(
+                    flapi_host.get('flapi_user'),
+                    hostname,
+                    persist=settings['persist'],
+                    timeout=settings['timeout']
+                )
+            self.backends[hostname] = backend
+            return backend
+
+    def timed(self, operation, items, fn):
+        start = time.time()
+        try:
+            return fn()
+        finally:
+            elapsed = time.time() - start
+            with self.lock:
+                op_stats = self.stats.setdefault(operation, {'calls': 0, 'items': 0, 'seconds': 0, 'max': 0})
+                op_stats['calls'] += 1
+                op_stats['items'] += items
+                op_stats['seconds'] += elapsed
+                op_stats['max'] = max(op_stats['max'], elapsed)
+
+    def listdir(self, flapi_host, path):
+        backend = self.get_backend(flapi_host)
+        return self.timed('listdir', 1, lambda: backend.listdir(path))
+
+    def stat(self, flapi_host, paths):
+        if not paths:
+            return {}
+        backend = self.get_backend(flapi_host)
+        return self.timed('stat', len(paths), lambda: backend.stat(list(paths)))
+
+    def fetch(self, flapi_host, paths):
+        if not paths:
+            return {}
+        backend = self.get_backend(flapi_host)
+        return self.timed('fetch', len(paths), lambda: backend.fetch(list(paths)))
+
+    def delete(self, flapi_host, paths):
+        if not paths:
+            return
+        backend = self.get_backend(flapi_host)
+        self.timed('delete', len(paths), lambda: backend.delete(list(paths)))
+
+    def close_all(self):
+        with self.lock:
+            backends = self.backends
+            self.backends = {}
+        for hostname, backend in backends.items():
+            try:
+                backend.close()
+            except Exception as e:
+                self.log.debug('error closing remote files backend for %s: %s' % (hostname, pformat(e)))
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                operation: {
+                    'calls': op_stats['calls'],
+                    'items': op_stats['items'],
+                    'avg_ms': round(1000 * op_stats['seconds'] / op_stats['calls'], 1),
+                    'max_ms': round(1000 * op_stats['max'], 1)
+                }
+                for operation, op_stats in self.stats.items()
+            }
+
+
+def get_remote_files(config):
+    remote_files = config.get('remote_files')
+    if remote_files is None:
+        remote_files = config.setdefault('remote_files', RemoteFiles(config))
+    return remote_files
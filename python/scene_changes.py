@@ -0,0 +1,135 @@
+import time
+import hashlib
+import threading
+
+
+# Decides which linked sequences need a full sync.
+#
+# Before the expensive per-shot crawl of a scene, sequence_sync takes a
+# cheap signature of the sequence (see get_sequence_signature() in
+# sequence.py):
+#
+#   modified    ModifiedDate from JobManager.get_scene_info()
+#   shots       digest of the ids and frames from Scene.get_shot_ids()
+#   kitsu       digest of the ids and updated_at of the Kitsu shots
+#
+# and compares it with the watermark stored after the last sync. Only
+# sequences whose signature moved are crawled and synced. Watermarks are
+# kept in the sync state store (sync_state.py) when there is one, so a
+# restart does not sync every sequence again.
+#
+# robot.json settings:
+#
+#   scene_change_detection    false crawls every sequence every cycle
+#                             (default true)
+#   scene_check_shot_ids      also open the scene for its shot ids, not
+#                             only its ModifiedDate (default true)
+#   scene_full_sync_interval  seconds after which a sequence is synced
+#                             even if nothing seems to have changed
+#                             (default 3600)
+
+def digest(items):
+    h = hashlib.sha1()
+    for item in items:
+        h.update(str(item).encode('utf-8'))
+        h.update(b'\n')
+    return h.hexdigest()
+
+
+class SceneChangeDetector(object):
+    def __init__(self, config):
+        self.config = config
+        self.log = config.get('log')
+        self.lock = threading.Lock()
+        self.watermarks = {}
+        self.stats = {
+            'checked': 0,
+            'unchanged': 0,
+            'changed': 0,
+            'synced': 0
+        }
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        return {
+            'enabled': robot_config.get('scene_change_detection', True),
+            'check_shot_ids': robot_config.get('scene_check_shot_ids', True),
+            'full_sync_interval': robot_config.get('scene_full_sync_interval', 3600)
+        }
+
+    def enabled(self):
+        return self.settings()['enabled']
+
+    def get_watermark(self, key):
+        with self.lock:
+            watermark = self.watermarks.get(key)
+        if watermark is not None:
+            return watermark
+        sync_state = self.config.get('sync_state')
+        if not sync_state:
+            return None
+        watermark = sync_state.get_sequence(key)
+        if watermark is None or watermark['signature'] is None:
+            return None
+        with self.lock:
+            self.watermarks[key] = watermark
+        return watermark
+
+    def needs_sync(self, key, signature):
+        settings = self.settings()
+        with self.lock:
+            self.stats['checked'] += 1
+        watermark = self.get_watermark(key)
+
+        reason = None
+        if signature is None:
+            reason = 'no signature'
+        elif watermark is None:
+            reason = 'not synced yet'
+        elif time.time() - watermark['synced'] > settings['full_sync_interval']:
+            reason = 'full sync interval'
+        else:
+            for part in ('scene', 'modified', 'shots', 'kitsu'):
+                if signature.get(part) != watermark['signature'].get(part):
+                    reason = '%s changed' % part
+                    break
+
+        with self.lock:
+            if reason:
+                self.stats['changed'] += 1
+            else:
+                self.stats['unchanged'] += 1
+
+        if reason:
+            self.log.verbose('syncing %s: %s' % (key, reason))
+            return True
+        self.log.debug('%s unchanged since last sync' % key)
+        return False
+
+    def synced(self, key, signature):
+        if signature is None:
+            self.forget(key)
+            return
+        synced = time.time()
+        with self.lock:
+            self.watermarks[key] = {
+                'signature': signature,
+                'synced': synced
+            }
+            self.stats['synced'] += 1
+        sync_state = self.config.get('sync_state')
+        if sync_state:
+            sync_state.set_sequence(key, signature, synced)
+
+    def forget(self, key):
+        with self.lock:
+            self.watermarks.pop(key, None)
+        sync_state = self.config.get('sync_state')
+        if sync_state:
+            sync_state.forget_sequence(key)
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats['watermarks'] = len(self.watermarks)
+        return stats
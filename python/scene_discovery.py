@@ -0,0 +1,187 @@
+import re
+import time
+import threading
+import calendar
+import email.utils
+from datetime import datetime
+
+
+# Resolves Baselight scene name patterns to the most recently modified
+# matching scene.
+#
+# A blpath whose scene name contains "*" is a regular expression matched
+# against the scenes of its job folder. SceneFinder keeps, for robot.json
+# "scene_discovery_ttl" seconds (default 60):
+#
+#   the scene list of each (host, job, folder), from JobManager.get_scenes()
+#   the scene each pattern resolved to
+#
+# so the job is not listed again every sync cycle. When a resolution
+# expires, the ModifiedDate of the matching scenes is asked for with
+# pipelined JobManager.get_scene_info() calls and the newest one is
+# picked. Patterns are compiled once.
+#
+# flapi documents ModifiedDate only as a time and date string. It is
+# expected in ISO 8601 form ("2024-03-01 14:05:12", as local time when it
+# has no offset); RFC 2822 and ctime() forms and Unix timestamps are read
+# too. Ambiguous forms such as "01/03/2024" are not guessed at: a date
+# that can not be read is logged, and its scene counts as older than any
+# scene with a readable date.
+#
+# A folder is listed again before its TTL is up if a scene resolved in it
+# can not be found or opened, see forget_scene().
+
+DATE_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%a %b %d %H:%M:%S %Y'
+)
+
+# Returns seconds since the epoch, or None
+def parse_modified_date(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    value = str(value).strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        date = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if date.tzinfo is None:
+            return time.mktime(date.timetuple()) + date.microsecond / 1e6
+        return date.timestamp()
+    except ValueError:
+        pass
+    for date_format in DATE_FORMATS:
+        try:
+            return time.mktime(time.strptime(value, date_format))
+        except ValueError:
+            pass
+    try:
+        parsed = email.utils.parsedate_tz(value)
+    except (TypeError, ValueError):
+        parsed = None
+    if parsed:
+        if parsed[9] is None:
+            return time.mktime(parsed[:9])
+        return calendar.timegm(parsed[:9]) - parsed[9]
+    return None
+
+class SceneFinder(object):
+    def __init__(self, config):
+        self.config = config
+        self.log = config.get('log')
+        self.lock = threading.Lock()
+        self.patterns = {}
+        self.listings = {}
+        self.resolved = {}
+        self.stats = {
+            'resolved': 0,
+            'resolve_hits': 0,
+            'listed': 0,
+            'list_hits': 0,
+            'scene_infos': 0,
+            'forgotten': 0
+        }
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        return {
+            'ttl': robot_config.get('scene_discovery_ttl', 60)
+        }
+
+    def compile(self, pattern):
+        with self.lock:
+            regex = self.patterns.get(pattern)
+            if regex is None:
+                regex = self.patterns[pattern] = re.compile(pattern)
+            return regex
+
+    def list_scenes(self, conn, host, job, folder):
+        key = (host, job, folder)
+        now = time.time()
+        with self.lock:
+            listing = self.listings.get(key)
+            if listing and now - listing[0] < self.settings()['ttl']:
+                self.stats['list_hits'] += 1
+                return listing[1]
+
+        scene_names = conn.JobManager.get_scenes(host, job, folder)
+        with self.lock:
+            self.listings[key] = (now, scene_names)
+            self.stats['listed'] += 1
+        return scene_names
+
+    # Returns the name of the newest scene in the folder matching pattern,
+    # or None if there is none
+    def find_scene(self, conn, host, job, folder, pattern):
+        key = (host, job, folder, pattern)
+        now = time.time()
+        with self.lock:
+            resolved = self.resolved.get(key)
+            if resolved and now - resolved[0] < self.settings()['ttl']:
+                self.stats['resolve_hits'] += 1
+                return resolved[1]
+
+        regex = self.compile(pattern)
+        candidates = [x for x in self.list_scenes(conn, host, job, folder) if regex.search(x)]
+
+        scene_name = None
+        if len(candidates) == 1:
+            scene_name = candidates[0]
+        elif candidates:
+            with conn.pipeline():
+                info_futures = [
+                    conn.JobManager.get_scene_info(host, job, folder + ':' + x if folder else x)
+                    for x in candidates
+                ]
+            scene_infos = conn.gather(info_futures, return_exceptions=True)
+            modified = {}
+            for candidate, scene_info in zip(candidates, scene_infos):
+                if isinstance(scene_info, Exception):
+                    self.log.verbose('unable to get info of scene %s: %s' % (candidate, scene_info))
+                    modified_date = None
+                else:
+                    modified_date = scene_info.ModifiedDate
+                timestamp = parse_modified_date(modified_date)
+                if timestamp is None and modified_date is not None:
+                    self.log.info('unable to read modification date "%s" of scene %s' % (modified_date, candidate))
+                modified[candidate] = timestamp if timestamp is not None else float('-inf')
+            # newest first, the name settles equal or unreadable dates
+            scene_name = max(candidates, key=lambda x: (modified[x], x))
+            with self.lock:
+                self.stats['scene_infos'] += len(candidates)
+
+        with self.lock:
+            self.resolved[key] = (now, scene_name)
+            self.stats['resolved'] += 1
+        return scene_name
+
+    # Drops what is known about a folder
+    def forget(self, host, job, folder):
+        with self.lock:
+            self.listings.pop((host, job, folder), None)
+            for key in [x for x in self.resolved.keys() if x[:3] == (host, job, folder)]:
+                del self.resolved[key]
+            self.stats['forgotten'] += 1
+
+    # Drops what is known about the folder of a scene that could not be
+    # found or opened; scene is "folder:name"
+    def forget_scene(self, host, job, scene):
+        self.forget(host, job, ''.join(scene.split(':')[:-1]))
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats)
+
+
+def get_scene_finder(config):
+    scene_finder = config.get('scene_finder')
+    if scene_finder is None:
+        scene_finder = config.setdefault('scene_finder', SceneFinder(config))
+    return scene_finder
@@ -0,0 +1,81 @@
+from pprint import pformat
+
+
+# Collects metadata writes to the shots of a Baselight scene and applies
+# them together.
+#
+#   writer = SceneMetadataWriter(config, session)
+#   writer.set(shot_id, {md_key: value, ...})   # any number of times per shot
+#   if not writer.commit('Add kitsu metadata'):
+#       ...                                     # nothing was written
+#
+# commit() makes all writes in one delta with one scene save, the calls
+# pipelined. If any write fails the delta is cancelled. If the save fails
+# the scene is closed, so that the unsaved delta is discarded instead of
+# being saved along with a later change. Either way, none of the writes
+# end up in the scene, and commit() returns False rather than raising.
+
+class SceneMetadataWriter(object):
+    def __init__(self, config, session):
+        self.config = config
+        self.log = config.get('log')
+        self.session = session
+        self.pending = {}
+
+    def set(self, shot_id, md_values):
+        self.pending.setdefault(shot_id, {}).update(md_values)
+
+    def commit(self, delta_name):
+        pending = self.pending
+        self.pending = {}
+        if not pending:
+            return True
+
+        flapi = self.session.flapi
+        conn = self.session.conn
+        shot_ids = sorted(pending.keys())
+
+        try:
+            scene = self.session.get_writable_scene()
+        except flapi.FLAPIException as ex:
+            self.log.error('Error opening scene: %s' % ex)
+            return False
+
+        shots = []
+        try:
+            scene.start_delta(delta_name)
+            with conn.pipeline():
+                shot_futures = [scene.get_shot(shot_id) for shot_id in shot_ids]
+            shots = conn.gather(shot_futures)
+            with conn.pipeline():
+                write_futures = [shot.set_metadata(pending[shot_id]) for shot_id, shot in zip(shot_ids, shots)]
+            conn.gather(write_futures)
+        except flapi.FLAPIException as ex:
+            self.log.error('Unable to write metadata of %s shot(s), cancelling "%s": %s' % (
+                len(shot_ids), delta_name, pformat(ex)
+            ))
+            try:
+                scene.cancel_delta()
+            except flapi.FLAPIException as ex:
+                # also when the delta was not started
+                self.log.error('Unable to cancel "%s", discarding it: %s' % (delta_name, ex))
+                self.session.close_scene()
+            return False
+        finally:
+            try:
+                with conn.release_scope():
+                    for shot in shots:
+                        shot.release()
+            except flapi.FLAPIException as ex:
+                self.log.debug('Unable to release shots: %s' % ex)
+
+        try:
+            scene.end_delta()
+            scene.save_scene()
+        except flapi.FLAPIException as ex:
+            self.log.error('Unable to save "%s", discarding it: %s' % (delta_name, ex))
+            self.session.close_scene()
+            return False
+
+        self.log.verbose('wrote metadata of %s shot(s) in "%s"' % (len(shot_ids), delta_name))
+        return True
@@ -1,12 +1,23 @@
 import os
 import sys
 import time
-
-from .util import remote_listdir
-from .util import remote_rm
-from .util import rsync
+import hashlib
 
 from .config import get_config_data
+from .flapi_hosts import flapi_connection_options
+from .scene_changes import digest
+from .sync_scheduler import SequenceScheduler
+from .kitsu_cache import get_kitsu_cache
+from .kitsu_updates import KitsuShotUpdater
+from .thumbnails import get_thumbnail_fetcher
+from .thumbnails import resolve_thumbnail_uri
+from .thumbnails import upload_shot_thumbnail
+from .remote_files import get_remote_files
+from .queue_tracker import QueueOperationTracker
+from .scene_writes import SceneMetadataWriter
+from .scene_discovery import get_scene_finder
+from .marks import parse_locator, locator_marks, read_shot_marks
+from .marks import reconcile_marks, encode_marks, decode_marks
 
 from pprint import pprint, pformat
 
@@ -51,11 +62,11 @@ def sequence_sync(config):
             gazu.set_host(host)
             gazu.log_in(name, password)
 
+            kitsu_cache = get_kitsu_cache(config)
             baselight_linked_sequences = []
-            projects = gazu.project.all_open_projects()
+            projects = kitsu_cache.all_open_projects(gazu)
             for project in projects:
-                sequences_api_path = '/data/projects/' + project.get('id') + '/sequences'
-                project_sequences = gazu.client.get(sequences_api_path)
+                project_sequences = kitsu_cache.project_sequences(gazu, project.get('id'))
                 for project_sequence in project_sequences:
                     data = project_sequence.get('data')
                     if isinstance(data, dict):
@@ -63,6 +74,7 @@ def sequence_sync(config):
                             blpath = data.get('blpath')
                             if blpath:
                                 baselight_linked_sequences.append(project_sequence)
+            sync_jobs = []
             for baselight_linked_sequence in baselight_linked_sequences:
                 # collect common data queries
                 blpath = resolve_blpath(config, baselight_linked_sequence)
@@ -77,20 +89,45 @@ def sequence_sync(config):
                 if not blpath:
                     continue
                 baselight_linked_sequence['blpath'] = blpath
-                baselight_shots = get_baselight_scene_shots(config, blpath)
-                if not baselight_shots:
-                    continue
-
-                baselight_linked_sequence['baselight_shots'] = baselight_shots
-                kitsu_uid_metadata_obj = check_or_add_kitsu_metadata_definition(config, blpath)
-                baselight_linked_sequence['kitsu_uid_metadata_obj'] = kitsu_uid_metadata_obj
-                kitsu_shots = gazu.shot.all_shots_for_sequence(baselight_linked_sequence)
-                baselight_linked_sequence['kitsu_shots'] = kitsu_shots
+                flapi_host = resolve_flapi_host(config, blpath)
+                sync_jobs.append((
+                    baselight_linked_sequence.get('project_id'),
+                    flapi_host.get('flapi_hostname'),
+                    baselight_linked_sequence
+                ))
+
+            sync_scheduler = config.get('sync_scheduler')
+            if not sync_scheduler:
+                sync_scheduler = config['sync_scheduler'] = SequenceScheduler(config)
+            sync_scheduler.run(
+                sync_jobs,
+                lambda baselight_linked_sequence: sync_sequence(config, gazu, baselight_linked_sequence)
+            )
+            log.debug('sequence sync: %s' % pformat(sync_scheduler.get_stats()))
+
+            flapi_pool = config.get('flapi_pool')
+            if flapi_pool:
+                log.debug('flapi connection pool: %s' % pformat(flapi_pool.get_stats()))
+            scene_changes = config.get('scene_changes')
+            if scene_changes:
+                log.debug('scene change detection: %s' % pformat(scene_changes.get_stats()))
+            log.debug('kitsu cache: %s' % pformat(kitsu_cache.get_stats()))
+            scene_finder = config.get('scene_finder')
+            if scene_finder:
+                log.debug('scene discovery: %s' % pformat(scene_finder.get_stats()))
+            remote_files = config.get('remote_files')
+            if remote_files and remote_files.get_stats():
+                log.debug('remote file operations: %s' % pformat(remote_files.get_stats()))
+            sync_state = config.get('sync_state')
+            if sync_state and sync_state.enabled():
+                log.debug('sync state: %s' % pformat(sync_state.get_stats()))
+            flapi_health = config.get('flapi_health')
+            if flapi_health and flapi_health.get_stats():
+                log.debug('flapi hosts in backoff: %s' % pformat(flapi_health.get_stats()))
+            flapi_stats = config.get('flapi_stats')
+            if flapi_stats:
+                flapi_stats.dump()
 
-                populate_kitsu_from_baselight_sequence(config, gazu, baselight_linked_sequence)
-                sync_shot_marks(config, gazu, baselight_linked_sequence)
-                # sync_filenames_and_version_numbers(config, gazu, baselight_linked_sequence)
-                
             time.sleep(4)
             gazu.log_out()
         except KeyboardInterrupt:
@@ -100,6 +137,48 @@ def sequence_sync(config):
             time.sleep(4)
 
 
+def sync_sequence(config, gazu, baselight_linked_sequence):
+    blpath = baselight_linked_sequence.get('blpath')
+
+    # all stages share one connection and one open scene
+    session = SceneSession(config, blpath)
+    if not session.open():
+        return
+
+    try:
+        # skip the crawl if neither the scene nor the Kitsu shots moved
+        scene_changes = config.get('scene_changes')
+        if scene_changes and scene_changes.enabled():
+            signature = get_sequence_signature(config, gazu, baselight_linked_sequence, session)
+            if not scene_changes.needs_sync(baselight_linked_sequence.get('id'), signature):
+                return
+        else:
+            scene_changes = None
+
+        baselight_shots = get_baselight_scene_shots(config, blpath, session)
+        if not baselight_shots:
+            return
+
+        baselight_linked_sequence['baselight_shots'] = baselight_shots
+        kitsu_uid_metadata_obj = check_or_add_kitsu_metadata_definition(config, blpath, session)
+        baselight_linked_sequence['kitsu_uid_metadata_obj'] = kitsu_uid_metadata_obj
+        kitsu_shots = get_kitsu_cache(config).all_shots_for_sequence(gazu, baselight_linked_sequence)
+        baselight_linked_sequence['kitsu_shots'] = kitsu_shots
+
+        populate_kitsu_from_baselight_sequence(config, gazu, baselight_linked_sequence, session)
+        sync_shot_marks(config, gazu, baselight_linked_sequence, session)
+        # sync_filenames_and_version_numbers(config, gazu, baselight_linked_sequence)
+
+        # the watermark is the signature from before the crawl, so that
+        # edits made while syncing are picked up next cycle; the robot's
+        # own writes cost one more pass, in which unchanged shots are
+        # skipped by their sync state hashes
+        if scene_changes:
+            scene_changes.synced(baselight_linked_sequence.get('id'), signature)
+    finally:
+        session.close()
+
+
 def sync_filenames_and_version_numbers(config, gazu, baselight_linked_sequence):
     log = config.get('log')
     blpath = baselight_linked_sequence.get('blpath')
@@ -115,6 +194,7 @@ def sync_filenames_and_version_numbers(config, gazu, baselight_linked_sequence):
         return None
     scene_path = fl_get_scene_path(config, flapi, conn, blpath)
     if not scene_path:
+        fl_disconnect(config, flapi, flapi_host, conn)
         return None
 
     try:
@@ -122,6 +202,7 @@ def sync_filenames_and_version_numbers(config, gazu, baselight_linked_sequence):
         scene = conn.Scene.open_scene( scene_path, { flapi.OPENFLAG_READ_ONLY } )
     except flapi.FLAPIException as ex:
         log.error( "Error opening scene: %s" % ex )
+        fl_disconnect(config, flapi, flapi_host, conn)
         return None
 
     baselight_shots = baselight_linked_sequence.get('baselight_shots')
@@ -173,32 +254,11 @@ def sync_filenames_and_version_numbers(config, gazu, baselight_linked_sequence):
     scene.release()
 
 
-def sync_shot_marks(config, gazu, baselight_linked_sequence):
+def sync_shot_marks(config, gazu, baselight_linked_sequence, session=None):
     log = config.get('log')
     print ('---')
     print('--- Syncing shot marks ---')
 
-    def parse_locator(localtor_string, mark_categories):
-        import json
-
-        try:
-            locator = json.loads(locator_string)
-        except:
-            if localtor_string in mark_categories:
-                locator = [{'type': localtor_string}]
-            elif localtor_string.lower() in mark_categories:
-                locator = [{'type': localtor_string.lower()}]
-            elif localtor_string.upper() in mark_categories:
-                locator = [{'type': localtor_string.upper()}]
-            else:
-                return []
-        
-        if isinstance(locator, list):
-            return locator
-        else:
-            return [locator]
-
-
     blpath = baselight_linked_sequence.get('blpath')
     baselight_shots = baselight_linked_sequence.get('baselight_shots')
     kitsu_uid_metadata_obj = baselight_linked_sequence.get('kitsu_uid_metadata_obj')
@@ -207,121 +267,139 @@ def sync_shot_marks(config, gazu, baselight_linked_sequence):
     kitsu_shots = baselight_linked_sequence.get('kitsu_shots')
     baselight_shots_by_kitsu_uid = {x['shot_md'].get(kitsu_uid_metadata_obj.Key):x for x in baselight_shots}
 
-    flapi = import_flapi(config)
-    flapi_host = resolve_flapi_host(config, blpath)
-    conn = fl_connect(config, flapi, flapi_host)
-    if not conn:
-        return None
-    scene_path = fl_get_scene_path(config, flapi, conn, blpath)
-    if not scene_path:
-        return None
+    own_session = session is None
+    if own_session:
+        session = SceneSession(config, blpath)
+        if not session.open():
+            return None
+    flapi = session.flapi
+    conn = session.conn
 
     try:
-        log.verbose('Trying to open scene: %s in read-write mode' % scene_path.Host + ':' + scene_path.Job + ':' + scene_path.Scene)
-        scene = conn.Scene.open_scene( scene_path, {  flapi.OPENFLAG_DISCARD  })
+        scene = session.get_scene()
     except flapi.FLAPIException as ex:
         log.error( "Error opening scene: %s" % ex )
+        if own_session:
+            session.close()
         return
 
     mark_categories = scene.get_mark_categories()
     log.verbose('avaliable mark categorise: %s' % pformat(mark_categories))
-    scene.start_delta('Add marks')
 
-    for kitsu_shot in kitsu_shots:
-        data = kitsu_shot.get('data')
-        if not data:
-            continue
-        locator_string = data.get('01_locator')
-        if not locator_string:
-            continue
-
-        locator = parse_locator(locator_string, mark_categories)
-        if not locator:
-            log.verbose('unable to parse json locator: %s' % locator_string)
-            continue
+    # shots whose locator and Baselight marks did not change since they
+    # were last found in sync are not queried again
+    sync_state = config.get('sync_state')
+    sequence_id = baselight_linked_sequence.get('id')
+    shot_states = sync_state.get_shots(sequence_id) if sync_state else {}
+    marks_hashes = {}
 
+    # kitsu shot id: (baselight shot, parsed locator, marks added before)
+    candidates = {}
+    for kitsu_shot in kitsu_shots:
         baselight_shot = baselight_shots_by_kitsu_uid.get(kitsu_shot['id'])
         if not baselight_shot:
             continue
-        shot = scene.get_shot(baselight_shot['shot_id'])
-        start_frame = shot.get_start_frame()
-        src_start_frame = shot.get_src_start_frame()
-        mark_ids = shot.get_mark_ids()
-        existing_marks = []
-        if len(mark_ids) > 0:
-            for ix,m in enumerate(mark_ids):
-                mark = shot.get_mark(m)
-                # print( "%20d: Frame %d Type '%s' Message '%s'" % (
-                #        ix,
-                #        mark.get_record_frame(),
-                #        mark.get_category(),
-                #        mark.get_note_text()
-                #    )
-                #)
-                existing_marks.append(
-                    pformat({
-                        'type': mark.get_category(),
-                        'frame': mark.get_record_frame(),
-                        'label': mark.get_note_text()
-                    })
-                )
-                mark.release()
-                # shot.delete_mark(m)
-        # log.verbose('existing marks: %s' % pformat(existing_marks))
-
-        for new_mark_info in locator:
-            if not isinstance(new_mark_info, dict):
-                log.verbose('Skipping mark: mark info is not a dict but %s: %s' % (type(new_mark_info), pformat(new_mark_info)))
+        shot_state = shot_states.get(kitsu_shot['id'], {})
+        owned = decode_marks(shot_state.get('robot_marks'))
+
+        locator_string = (kitsu_shot.get('data') or {}).get('01_locator')
+        if locator_string:
+            locator = parse_locator(locator_string, mark_categories)
+            if not locator:
+                log.verbose('unable to parse json locator: %s' % locator_string)
                 continue
+        elif owned:
+            # a cleared locator removes the marks it added
+            locator = []
+        else:
+            continue
 
-            try:
-                frame = int(new_mark_info.get('frame', 0))
-            except:
-                frame = 0
-
-            mark_type = new_mark_info.get('type', mark_categories[0])
-            
-            new_mark = {
-                'type': mark_type,
-                'frame': start_frame + frame,
-                'label': new_mark_info.get('label', '')
-            }
+        marks_hash = digest([locator_string or ''] + sorted(baselight_shot.get('mark_ids') or []))
+        if shot_state.get('marks_hash') == marks_hash:
+            continue
+        marks_hashes[kitsu_shot['id']] = marks_hash
+        candidates[kitsu_shot['id']] = (baselight_shot, locator, owned)
+
+    shot_marks = read_shot_marks(
+        conn,
+        scene,
+        [baselight_shot['shot_id'] for baselight_shot, locator, owned in candidates.values()]
+    )
+
+    # compare with the existing marks first, so that the scene is only
+    # reopened writable if there are marks to change
+    changes = []
+    for kitsu_id, (baselight_shot, locator, owned) in candidates.items():
+        shot_info = shot_marks[baselight_shot['shot_id']]
+        wanted, skipped = locator_marks(locator, mark_categories, shot_info['start_frame'])
+        for new_mark_info, reason in skipped:
+            log.verbose('Skipping mark: %s: %s' % (reason, pformat(new_mark_info)))
+        to_add, to_remove = reconcile_marks(wanted, shot_info['marks'], owned)
+        if not (to_add or to_remove):
+            continue
+        changes.append((kitsu_id, baselight_shot['shot_id'], shot_info, owned, to_add, to_remove))
+        # changing marks changes the mark ids, the shot is checked again
+        # on the next sync
+        marks_hashes.pop(kitsu_id, None)
+
+    if sync_state:
+        sync_state.update_shots(sequence_id, {
+            shot_id: {'marks_hash': marks_hash} for shot_id, marks_hash in marks_hashes.items()
+        })
+
+    if not changes:
+        if own_session:
+            session.close()
+        return
 
+    try:
+        scene = session.get_writable_scene()
+    except flapi.FLAPIException as ex:
+        log.error( "Error opening scene: %s" % ex )
+        if own_session:
+            session.close()
+        return
 
-            if pformat(new_mark) not in existing_marks:
-                if mark_type not in mark_categories:
-                    if mark_type.lower() in mark_categories:
-                        mark_type = mark_type.lower()
-                    elif mark_type.upper() in mark_categories:
-                        mark_type = mark_type.upper()
-                    else:
-                        log.verbose('mark type %s is not in mark categories: %s' % (mark_type, pformat(mark_categories)))
-                        log.verbose('skipping marker creation')
-                        continue
+    robot_marks = {}
+    scene.start_delta('Sync marks')
+    with conn.release_scope():
+        for kitsu_id, shot_id, shot_info, owned, to_add, to_remove in changes:
+            shot = scene.get_shot(shot_id)
+            added = set()
+            removed = set()
+            for key, mark_id in to_remove.items():
+                try:
+                    shot.delete_mark(mark_id)
+                    removed.add(key)
+                    log.verbose('--- removing mark: %s' % pformat(key))
+                except flapi.FLAPIException as ex:
+                    log.error( "Unable to remove mark: %s" % ex )
+            for key in sorted(to_add):
+                category, frame, note = key
                 try:
                     shot.add_mark(
-                        (src_start_frame - start_frame) + new_mark.get('frame', 0), 
-                        new_mark.get('type', mark_categories[0]), 
-                        new_mark.get('label', ''))
-                    log.verbose('--- adding mark: %s' % pformat(new_mark))
+                        (shot_info['src_start_frame'] - shot_info['start_frame']) + frame,
+                        category,
+                        note)
+                    added.add(key)
+                    log.verbose('--- adding mark: %s' % pformat(key))
                 except flapi.FLAPIException as ex:
                     log.error( "Unable to create mark: %s" % ex )
-                    continue
-
-            else:
-                log.verbose('mark already exists: %s' % pformat(new_mark))
-        shot.release()
+            shot.release()
+            robot_marks[kitsu_id] = {'robot_marks': encode_marks((owned - removed) | added)}
 
     scene.end_delta()
     scene.save_scene()
-    scene.close_scene()
-    scene.release()
 
-    fl_disconnect(config, flapi, flapi_host, conn)
+    if sync_state:
+        sync_state.update_shots(sequence_id, robot_marks)
+
+    if own_session:
+        session.close()
     return
 
 
-def populate_kitsu_from_baselight_sequence(config, gazu, baselight_linked_sequence):
+def populate_kitsu_from_baselight_sequence(config, gazu, baselight_linked_sequence, session=None):
     log = config.get('log')
     print ('---')
     print('--- Populating Kitsu from baselight sequence ---')
@@ -337,14 +415,25 @@ def populate_kitsu_from_baselight_sequence(config, gazu, baselight_linked_sequen
         return
 
     baselight_shots = baselight_linked_sequence.get('baselight_shots')
-    project_dict = gazu.project.get_project(baselight_linked_sequence.get('project_id'))
+    kitsu_cache = get_kitsu_cache(config)
+    project_dict = kitsu_cache.get_project(gazu, baselight_linked_sequence.get('project_id'))
     kitsu_shots = baselight_linked_sequence.get('kitsu_shots')
 
     kitsu_shot_uids = set()
+    kitsu_updated_at = {}
     for kitsu_shot in kitsu_shots:
         kitsu_shot_uids.add(kitsu_shot.get('id'))
+        kitsu_updated_at[kitsu_shot.get('id')] = kitsu_shot.get('updated_at')
+
+    # shots whose Baselight metadata and Kitsu shot did not move since the
+    # last sync are not fetched from Kitsu again
+    sync_state = config.get('sync_state')
+    sequence_id = baselight_linked_sequence.get('id')
+    shot_states = sync_state.get_shots(sequence_id) if sync_state else {}
+    shot_state_updates = {}
 
     new_shots = []
+    shot_updater = KitsuShotUpdater(config, gazu)
     
     log.verbose('Looking for metadata updates...')
     for shot_ix, baselight_shot in enumerate(baselight_shots):        
@@ -358,8 +447,19 @@ def populate_kitsu_from_baselight_sequence(config, gazu, baselight_linked_sequen
 
             new_data = {}
             bl_shot_data = build_kitsu_shot_data(config, baselight_shot)
-            kitsu_shot = gazu.shot.get_shot(bl_kitsu_uid)
-            kitsu_shot_data = kitsu_shot.get('data', dict())
+            metadata_hash = digest(sorted(bl_shot_data.items()))
+            shot_state = shot_states.get(bl_kitsu_uid, {})
+            if shot_state.get('metadata_hash') == metadata_hash and \
+                    shot_state.get('kitsu_updated_at') == kitsu_updated_at.get(bl_kitsu_uid):
+                continue
+            shot_state_updates[bl_kitsu_uid] = {
+                'bl_shot_id': baselight_shot.get('shot_id'),
+                'metadata_hash': metadata_hash,
+                'kitsu_updated_at': kitsu_updated_at.get(bl_kitsu_uid)
+            }
+
+            kitsu_shot = kitsu_cache.get_shot(gazu, bl_kitsu_uid, kitsu_updated_at.get(bl_kitsu_uid))
+            kitsu_shot_data = kitsu_shot.get('data') or dict()
 
             for data_key in bl_shot_data.keys():
                 if kitsu_shot_data.get(data_key):
@@ -371,209 +471,261 @@ def populate_kitsu_from_baselight_sequence(config, gazu, baselight_linked_sequen
             if not new_data:
                 continue
             
-            for new_data_key in new_data.keys():
-                kitsu_shot_data[new_data_key] = new_data.get(new_data_key)
-            kitsu_shot['data'] = kitsu_shot_data
             log.info('updating shot: %s' % kitsu_shot.get('name'))
-            gazu.shot.update_shot(kitsu_shot)
             pprint (new_data)
+            shot_updater.add(kitsu_shot, new_data)
             continue
 
         else:
             new_shots.append(baselight_shot)
 
+    # updates go out together, shots that failed are checked again next time
+    for shot_id, updated_shot in shot_updater.flush().items():
+        if isinstance(updated_shot, dict):
+            shot_state_updates[shot_id]['kitsu_updated_at'] = updated_shot.get('updated_at')
+        else:
+            shot_state_updates.pop(shot_id, None)
 
-    # try to open baselight scene and fill the shots back in with kitsu-related metadata
-    flapi = import_flapi(config)
-    flapi_host = resolve_flapi_host(config, blpath)
+    if sync_state:
+        sync_state.update_shots(sequence_id, shot_state_updates)
 
-    conn = fl_connect(config, flapi, flapi_host)
-    if not conn:
-        return None
-    scene_path = fl_get_scene_path(config, flapi, conn, blpath)
-    if not scene_path:
-        return None
+    if not new_shots:
+        return
 
-    log.verbose( "Opening QueueManager connection" )
+    own_session = session is None
+    if own_session:
+        session = SceneSession(config, blpath)
+        if not session.open():
+            return None
 
+    # create the shots in Kitsu, then fill the Baselight shots back in with
+    # their kitsu uids in one delta and save
+    created_shots = []
+    writer = SceneMetadataWriter(config, session)
     try:
-        log.verbose('Trying to open scene: %s in read-write mode' % scene_path.Host + ':' + scene_path.Job + ':' + scene_path.Scene)
-        scene = conn.Scene.open_scene( scene_path, {  flapi.OPENFLAG_DISCARD  })
-    except flapi.FLAPIException as ex:
+        for baselight_shot in new_shots:
+            shot_name = create_kitsu_shot_name(config, baselight_shot)
+            shot_data = build_kitsu_shot_data(config, baselight_shot)
+
+            new_shot = gazu.shot.new_shot(
+                project_dict, 
+                baselight_linked_sequence, 
+                shot_name,
+                data = shot_data
+                # data = {'00_shot_id': baselight_shot.get('shot_id')}
+            )
+
+            pprint (shot_data)
+            created_shots.append((baselight_shot.get('shot_id'), shot_name, new_shot))
+            writer.set(baselight_shot.get('shot_id'), {
+                kitsu_uid_metadata_obj.Key: new_shot.get('id')
+            })
+    except Exception as e:
+        # the shots created so far are still written back below
+        log.error('unable to create Kitsu shots for "%s": %s' % (blpath, pformat(e)))
+
+    try:
+        committed = writer.commit('Add kitsu metadata to %s shot(s)' % len(created_shots))
+    except Exception as e:
+        log.error('unable to write kitsu uids to "%s": %s' % (blpath, pformat(e)))
+        committed = False
+    if not committed:
+        # without their uid in Baselight the shots would be created again on
+        # the next sync, so they are removed from Kitsu instead
+        for shot_id, shot_name, new_shot in created_shots:
+            try:
+                gazu.shot.remove_shot(new_shot)
+            except Exception as e:
+                log.error('unable to remove Kitsu shot %s: %s' % (shot_name, pformat(e)))
+        if own_session:
+            session.close()
+        return None
+
+    try:
+        scene = session.get_scene()
+    except session.flapi.FLAPIException as ex:
         log.error( "Error opening scene: %s" % ex )
+        if own_session:
+            session.close()
         return None
 
+    print ('')
+    print ('Generating %s thumbnail(s) for: "%s"' % (len(created_shots), blpath))
+    thumbnails = get_shot_thumbnails(config, session, scene, [x[0] for x in created_shots])
 
-    for baselight_shot in new_shots:
-        shot_name = create_kitsu_shot_name(config, baselight_shot)
-        shot_data = build_kitsu_shot_data(config, baselight_shot)
+    for shot_id, shot_name, new_shot in created_shots:
+        thumbnail = thumbnails.get(shot_id)
+        if not thumbnail:
+            log.verbose('Unable generate thumbnail for %s' % shot_name)
+            continue
 
-        new_shot = gazu.shot.new_shot(
-            project_dict, 
-            baselight_linked_sequence, 
-            shot_name,
-            data = shot_data
-            # data = {'00_shot_id': baselight_shot.get('shot_id')}
-        )
+        thumbnail_file_name, thumbnail_data = thumbnail
+        upload_shot_thumbnail(config, gazu, new_shot, thumbnail_file_name, thumbnail_data)
 
-        pprint (shot_data)
+        if sync_state:
+            sync_state.update_shots(sequence_id, {
+                new_shot.get('id'): {
+                    'bl_shot_id': shot_id,
+                    'thumbnail_hash': hashlib.sha1(thumbnail_data).hexdigest()
+                }
+            })
 
-        shot_id = baselight_shot.get('shot_id')
-        shot = scene.get_shot(shot_id)
+    if own_session:
+        session.close()
+    return
 
-        try:
-            qm = conn.QueueManager.create_local()
-        except flapi.FLAPIException as ex:
-            log.error( "Can not create queue manager: %s" % ex )
-            continue
-        try:
-            ex = conn.Export.create()
-            ex.select_shot(shot)
-            exSettings = flapi.StillExportSettings()
-            exSettings.ColourSpace = "sRGB"
-            exSettings.Format = "HD 1920x1080"
-            exSettings.Overwrite = flapi.EXPORT_OVERWRITE_REPLACE
-            exSettings.Directory = config.get('remote_temp_folder', '/var/tmp')
-            exSettings.Frames = flapi.EXPORT_FRAMES_FIRST 
-            # exSettings.Filename = "%{Job}/%{Clip}_%{TimelineFrame}"
-            exSettings.Filename = str(shot_id)
-            exSettings.Source = flapi.EXPORT_SOURCE_SELECTEDSHOTS
 
-            print ('')
-            # print ('Baselight sequence: %s' % blpath)
-            print ('Generating thumbnail for: "%s" Shot name: "%s"' % (blpath, shot_name))
-            log.verbose( "Submitting to queue" )
-            exportInfo = ex.do_export_still( qm, scene, exSettings)
-            waitForExportToComplete(qm, exportInfo)
-            del ex
-            print( "Closing QueueManager\n" )
-            qm.release()
-        except Exception as ex:
-            log.error( "Can not export thumbnail: %s" % ex )
+# Thumbnails of the given shots as {shot_id: (file name, image bytes)},
+# from their ThumbnailManager poster URIs, or from a still export with
+# robot.json "thumbnail_source": "export".
 
-        file_list = remote_listdir(
-            config.get('remote_temp_folder', '/var/tmp'),
-            flapi_host.get('flapi_user'),
-            flapi_host.get('flapi_hostname')
-            )
+def get_shot_thumbnails(config, session, scene, shot_ids):
+    log = config.get('log')
+    if not shot_ids:
+        return {}
+    thumbnail_fetcher = get_thumbnail_fetcher(config)
+    settings = thumbnail_fetcher.settings()
+
+    thumbnails = {}
+    if settings['source'] == 'export':
+        return export_shot_thumbnails(config, session, scene, shot_ids)
+
+    flapi = session.flapi
+    conn = session.conn
+    uris = {}
+    try:
+        with conn.pipeline():
+            shot_futures = [scene.get_shot(shot_id) for shot_id in shot_ids]
+        shots = conn.gather(shot_futures)
+        with conn.pipeline():
+            uri_futures = [conn.ThumbnailManager.get_poster_uri(shot, settings['options']) for shot in shots]
+        for shot_id, uri in zip(shot_ids, conn.gather(uri_futures)):
+            uri = resolve_thumbnail_uri(conn, uri)
+            if uri:
+                uris[shot_id] = uri
+        with conn.release_scope():
+            for shot in shots:
+                shot.release()
+    except flapi.FLAPIException as ex:
+        log.error( "Can not get thumbnail URIs: %s" % ex )
 
-        thumbnail_file_name = str(shot_id) + '.jpg'
-        thumbnail_local_path = ''
-        if thumbnail_file_name in file_list:
-            # get it over here to upload thumbnail
-            thumbnail_remote_path = os.path.join(
-                config.get('remote_temp_folder', '/var/tmp'),
-                thumbnail_file_name
-            )
-            thumbnail_local_path = config.get('temp_folder', '/var/tmp')
-            if not thumbnail_local_path.endswith(os.path.sep):
-                thumbnail_local_path = thumbnail_local_path + os.path.sep
-            rsync(
-                flapi_host.get('flapi_user'),
-                flapi_host.get('flapi_hostname'),
-                thumbnail_remote_path,
-                thumbnail_local_path
-            )
-            remote_rm(
-                thumbnail_remote_path,
-                flapi_host.get('flapi_user'),
-                flapi_host.get('flapi_hostname')    
-            )
-        
-        if not thumbnail_local_path:
-            log.verbose('Unable generate thumbnail for %s' % shot_name)
-            continue
+    for shot_id, data in thumbnail_fetcher.fetch(uris).items():
+        thumbnails[shot_id] = (str(shot_id) + '.jpg', data)
+    return thumbnails
 
-        task_types = gazu.task.all_task_types()
-        shot_task_types = [t for t in task_types if t['for_entity'] == 'Shot']
-        shot_task_types = sorted(shot_task_types, key=lambda d: d['priority'])
-        task = gazu.task.new_task(new_shot, shot_task_types[0])
-        todo = gazu.task.get_task_status_by_short_name("todo")
-        comment = gazu.task.add_comment(task, todo, "Add thumbnail")
-
-        log.verbose('Adding preview on task "%s"' % shot_task_types[0].get('name'))
-        preview_file = gazu.task.add_preview(
-            task,
-            comment,
-            os.path.join(
-                thumbnail_local_path,
-                thumbnail_file_name
-            )
-        )
 
-        log.verbose('Uploading thumbnail for shot: "%s"' % shot_name)
-        gazu.task.set_main_preview(preview_file)
-   
-        try:
-            os.remove(thumbnail_local_path)
-        except:
-            pass
+# Exports the first frame of each of the given shots in one queue
+# operation and reads the stills from the Baselight host.
+#
+# Stills are named after their timeline frame, which is the start frame of
+# their shot, under a prefix unique to this export.
+#
+# Returns {shot_id: (file name, image bytes)} for the stills that were found.
 
-        scene.start_delta('Add kitsu metadata to shot %s' % shot_name)
-        new_md_values = {
-            kitsu_uid_metadata_obj.Key: new_shot.get('id')
-        }
+def export_shot_thumbnails(config, session, scene, shot_ids):
+    import uuid
 
-        shot.set_metadata( new_md_values )
+    log = config.get('log')
+    flapi = session.flapi
+    flapi_host = session.flapi_host
+    conn = session.conn
+    remote_temp_folder = config.get('remote_temp_folder', '/var/tmp')
+    if not shot_ids:
+        return {}
 
-        shot.release()
+    prefix = 'kitsu_%s_' % uuid.uuid4().hex[:12]
+    shot_ids_by_frame = {}
 
-        scene.end_delta()
-        scene.save_scene()
-        # shot = scene.get_shot(shot_inf.ShotId)
+    try:
+        qm = conn.QueueManager.create_local()
+    except flapi.FLAPIException as ex:
+        log.error( "Can not create queue manager: %s" % ex )
+        return {}
+    tracker = QueueOperationTracker(config, flapi, qm)
 
+    try:
+        with conn.pipeline():
+            shot_futures = [scene.get_shot(shot_id) for shot_id in shot_ids]
+        shots = conn.gather(shot_futures)
+        with conn.pipeline():
+            start_frame_futures = [shot.get_start_frame() for shot in shots]
+        for shot_id, start_frame in zip(shot_ids, conn.gather(start_frame_futures)):
+            shot_ids_by_frame[int(start_frame)] = shot_id
+
+        ex = conn.Export.create()
+        ex.select_shots(shots)
+        exSettings = flapi.StillExportSettings()
+        exSettings.ColourSpace = "sRGB"
+        exSettings.Format = "HD 1920x1080"
+        exSettings.Overwrite = flapi.EXPORT_OVERWRITE_REPLACE
+        exSettings.Directory = remote_temp_folder
+        exSettings.Frames = flapi.EXPORT_FRAMES_FIRST 
+        # exSettings.Filename = "%{Job}/%{Clip}_%{TimelineFrame}"
+        exSettings.Filename = prefix + "%{TimelineFrame}"
+        exSettings.Source = flapi.EXPORT_SOURCE_SELECTEDSHOTS
+
+        log.verbose( "Submitting %s shot(s) to queue" % len(shots) )
+        exportInfo = ex.do_export_still( qm, scene, exSettings)
+        waitForExportToComplete(qm, exportInfo, tracker)
+        ex.release()
+        with conn.release_scope():
+            for shot in shots:
+                shot.release()
+    except Exception as ex:
+        log.error( "Can not export thumbnails: %s" % ex )
+    finally:
+        print( "Closing QueueManager\n" )
+        tracker.close()
+        try:
+            qm.release()
+        except flapi.FLAPIException:
+            pass
 
-    scene.save_scene()
-    scene.close_scene()
-    scene.release()
+    # list, fetch and clean up the stills in one batch each
+    remote_files = get_remote_files(config)
+    thumbnails = {}
+    try:
+        stills = {}
+        for thumbnail_file_name in remote_files.listdir(flapi_host, remote_temp_folder):
+            if not thumbnail_file_name.startswith(prefix):
+                continue
+            try:
+                frame = int(os.path.splitext(thumbnail_file_name[len(prefix):])[0])
+            except ValueError:
+                frame = None
+            stills[os.path.join(remote_temp_folder, thumbnail_file_name)] = shot_ids_by_frame.get(frame)
 
-    fl_disconnect(config, flapi, flapi_host, conn)
-    return
+        fetch_paths = [path for path, shot_id in stills.items() if shot_id is not None]
+        for path, data in remote_files.fetch(flapi_host, fetch_paths).items():
+            thumbnails[stills[path]] = (str(stills[path]) + '.jpg', data)
+        remote_files.delete(flapi_host, list(stills.keys()))
+    except Exception as ex:
+        log.error( "Can not read thumbnails from %s: %s" % (flapi_host.get('flapi_hostname'), ex) )
 
+    return thumbnails
 
-def waitForExportToComplete( qm, exportInfo ):
+
+def waitForExportToComplete( qm, exportInfo, tracker ):
     for msg in exportInfo.Log:
         if (msg.startswith("Error")):
             print("Export Submission Failed.  %s" % msg);
             return
 
     print( "Waiting on render job to complete" )
-    triesSinceChange = 0
-    lastProgress = -1
-    maxTries = 20
-    while True:
-        opstat = qm.get_operation_status( exportInfo.ID )
-        triesSinceChange +=1 
-        if opstat.Progress != lastProgress:
-            triesSinceChange = 0
-            lastProgress = opstat.Progress
-        dots = ""
-        if (triesSinceChange > 0):
-            dots = "..."[:(triesSinceChange%3)+1]
-        else:
-            pass
-            # print("")
-
-        # print( "\r  Status: {Status} {Progress:.0%} {ProgressText} ".format(**vars(opstat)), end=""), 
-        # print("%s    " % dots, end=""),
-        # sys.stdout.flush()
-        print( "  Status: {Status} {Progress:.0%} {ProgressText} ".format(**vars(opstat)))
-        if opstat.Status == "Done":
-            # print( "\nExport complete" )
-            print( "Export complete" )
-            break
-        if triesSinceChange == maxTries:
-            # print("\nStopped waiting for queue to complete.")
-            print("Stopped waiting for queue to complete.")
-            break
-        time.sleep(0.5)
-
-    exportLog = qm.get_operation_log( exportInfo.ID )
-    for l in exportLog:
-        print( "   %s %s: %s" % (l.Time, l.Message, l.Detail) )
+
+    def progress(op_id, opstat):
+        print( "  Status: {Status} {Progress:.0%} {ProgressText} ".format(**opstat.fields()))
+
+    opstat = tracker.wait([exportInfo.ID], progress).get(exportInfo.ID)
+    if opstat is not None and opstat.Status == "Done":
+        print( "Export complete" )
+    else:
+        print("Stopped waiting for queue to complete.")
 
     print( "Archiving operaton" )
-    qm.archive_operation ( exportInfo.ID )
+    exportLog = tracker.finish( exportInfo.ID )
+    for l in exportLog:
+        print( "   %s %s: %s" % (l.Time, l.Message, l.Detail) )
 
 
 def resolve_blpath(config, baselight_linked_sequence):
@@ -640,62 +792,36 @@ def build_kitsu_shot_data(config, baselight_shot):
         data[kitsu_key] = value
     return data
 
-def check_or_add_kitsu_metadata_definition(config, blpath):
+def check_or_add_kitsu_metadata_definition(config, blpath, session=None):
     log = config.get('log')
     print ('---')
     print('--- Checking KITSU metadata in: %s' % blpath)
 
-    flapi = import_flapi(config)
-    flapi_host = resolve_flapi_host(config, blpath)
-    conn = fl_connect(config, flapi, flapi_host)
-    if not conn:
-        return None
-        
-    scene_path = fl_get_scene_path(config, flapi, conn, blpath)
-    if not scene_path:
-        return None
-
-    try:
-        log.verbose('Opening scene: %s' % scene_path.Host + ':' + scene_path.Job + ':' + scene_path.Scene)
-        scene = conn.Scene.open_scene( scene_path, { flapi.OPENFLAG_READ_ONLY } )
-    except flapi.FLAPIException as ex:
-        log.error( "Error opening scene: %s" % ex )
-        return None
-
-    md_names = {}
-    mddefns = scene.get_metadata_definitions()
-
-    for mdfn in mddefns:
-        md_names[mdfn.Name] = mdfn
-
-    if 'kitsu-uid' in md_names.keys():
-        log.verbose('kistu-uid metadata columnn already exists in scene: "%s"' % scene.get_scene_pathname())
-        scene.close_scene()
-        scene.release()    
-        fl_disconnect(config, flapi, flapi_host, conn)
-        return md_names['kitsu-uid']
-
-    # the scene has no kitsu-id metadata defined
-    # try to re-open the scene in rw mode and add this definition
-    scene.close_scene()
-    scene.release()
+    own_session = session is None
+    if own_session:
+        session = SceneSession(config, blpath)
+        if not session.open():
+            return None
 
     try:
-        log.verbose('Trying to open scene: %s in read-write mode' % scene_path.Host + ':' + scene_path.Job + ':' + scene_path.Scene)
-        scene = conn.Scene.open_scene( scene_path )
-    except flapi.FLAPIException as ex:
-        log.error( "Error opening scene: %s" % ex )
+        md_names = {}
+        for mdfn in session.get_metadata_definitions():
+            md_names[mdfn.Name] = mdfn
+
+        if 'kitsu-uid' in md_names.keys():
+            log.verbose('kistu-uid metadata columnn already exists in scene: "%s"' % session.scene_name())
+            return md_names['kitsu-uid']
+
+        # the scene has no kitsu-id metadata defined
+        # re-open the scene in rw mode and add this definition
+        log.verbose('Adding kitsu-uid metadata columnn to scene: "%s"' % session.scene_name())
+        return session.add_metadata_definition('kitsu-uid', 'String', 'Add kitsu-id metadata column')
+    except session.flapi.FLAPIException as ex:
+        log.error( "Error checking kitsu-uid metadata in %s: %s" % (blpath, ex) )
         return None
-
-    log.verbose('Adding kitsu-uid metadata columnn to scene: "%s"' % scene.get_scene_pathname())
-    scene.start_delta('Add kitsu-id metadata column')
-    metadata_obj = scene.add_metadata_defn('kitsu-uid', 'String')
-    scene.end_delta()
-    scene.save_scene()
-    scene.close_scene()
-    scene.release()
-    fl_disconnect(config, flapi, flapi_host, conn)
-    return metadata_obj
+    finally:
+        if own_session:
+            session.close()
 
 
 def resolve_flapi_host(config, blpath):
@@ -708,97 +834,273 @@ def resolve_flapi_host(config, blpath):
     return flapi_host
 
 
-def get_baselight_scene_shots(config, blpath):
-    log = config.get('log')
-    print ('---')
-    print('--- Collecting metadata of Baselight shots in: %s' % blpath)
+def get_sequence_signature(config, gazu, baselight_linked_sequence, session=None):
+    blpath = baselight_linked_sequence.get('blpath')
+    signature = get_baselight_scene_signature(config, blpath, session)
+    if signature is None:
+        return None
+    kitsu_shots = get_kitsu_cache(config).all_shots_for_sequence(gazu, baselight_linked_sequence)
+    signature['kitsu'] = digest(
+        sorted('%s %s' % (x.get('id'), x.get('updated_at')) for x in kitsu_shots)
+    )
+    return signature
 
-    flapi = import_flapi(config)
-    flapi_host = resolve_flapi_host(config, blpath)
-        
-    conn = fl_connect(config, flapi, flapi_host)
-    if not conn:
-        return []
+def get_baselight_scene_signature(config, blpath, session=None):
+    log = config.get('log')
+    scene_changes = config.get('scene_changes')
+    check_shot_ids = scene_changes is None or scene_changes.settings()['check_shot_ids']
 
-    scene_path = fl_get_scene_path(config, flapi, conn, blpath)
-    if not scene_path:
-        return []
+    own_session = session is None
+    if own_session:
+        session = SceneSession(config, blpath)
+        if not session.open():
+            return None
+    scene_path = session.scene_path
 
+    signature = {
+        'scene': session.scene_name(),
+        'modified': None,
+        'shots': None
+    }
     try:
-        log.verbose('loading scene: %s' % scene_path.Host + ':' + scene_path.Job + ':' + scene_path.Scene)
-        scene = conn.Scene.open_scene( scene_path, { flapi.OPENFLAG_READ_ONLY } )
-    except flapi.FLAPIException as ex:
-        log.error( "Error loading scene: %s" % ex )
-        return []
+        scene_info = session.conn.JobManager.get_scene_info(scene_path.Host, scene_path.Job, scene_path.Scene)
+        signature['modified'] = str(scene_info.ModifiedDate)
+
+        if check_shot_ids:
+            scene = session.get_scene()
+            nshots = scene.get_num_shots()
+            shots = []
+            if nshots > 0:
+                shots = scene.get_shot_ids(0, nshots)
+            signature['shots'] = digest(
+                '%s %s %s' % (x.ShotId, x.StartFrame, x.EndFrame) for x in shots
+            )
+    except session.flapi.FLAPIException as ex:
+        log.verbose('unable to check scene %s for changes: %s' % (session.scene_name(), ex))
+        signature = None
+    finally:
+        if own_session:
+            session.close()
 
-    baselight_shots = []
+    return signature
 
-    nshots = scene.get_num_shots()
-    log.verbose( "Found %d shot(s)" % nshots )
+def get_baselight_scene_shots(config, blpath, session=None):
+    log = config.get('log')
+    print ('---')
+    print('--- Collecting metadata of Baselight shots in: %s' % blpath)
 
-    md_keys = set()
-    mddefns = scene.get_metadata_definitions()
+    own_session = session is None
+    if own_session:
+        session = SceneSession(config, blpath)
+        if not session.open():
+            return []
+    flapi = session.flapi
+    conn = session.conn
 
-    for mdfn in mddefns:
-        md_keys.add(mdfn.Key)
+    baselight_shots = []
 
-    if nshots > 0:
-        shots = scene.get_shot_ids(0, nshots)
-        for shot_ix, shot_inf in enumerate(shots):
-            print( "\r Querying Baselight metadata for shot %d of %s" % (shot_ix + 1, nshots), end="" )
-            # log.verbose("Shot %d:" % shot_ix)
-            shot = scene.get_shot(shot_inf.ShotId)
-            shot_md = shot.get_metadata(md_keys)
-            for key in md_keys:
-                if type(shot_md[key]) is list:
-                    for list_ix, list_inf in enumerate(shot_md[key]):
-                        shot_md[key + '.' + str(list_ix)] = list_inf
-                    # print ('%15s: %s: %s:' % (key, type(shot_md[key]), shot_md[key]))
-            # shot_md = shot.get_metadata_strings(md_keys)
-            mark_ids = shot.get_mark_ids()
-            categories = shot.get_categories()
-
-            thumbnail_url = ''
-            # thumbnail_url = conn.ThumbnailManager.get_poster_uri(shot, 1, {'DCSpace': 'sRGB'})
-            # pprint (thumbnail_url)
-
-            baselight_shots.append(
-                {
-                    'shot_ix': shot_ix + 1,
-                    'shot_id': shot_inf.ShotId,
-                    'mddefns': mddefns,
-                    'shot_md': shot_md,
-                    'mark_ids': mark_ids,
-                    'categories': categories,
-                    'thumbnail_url': thumbnail_url
-                }
-            )
+    try:
+        scene = session.get_scene()
+        nshots = scene.get_num_shots()
+        log.verbose( "Found %d shot(s)" % nshots )
+
+        md_keys = set()
+        mddefns = session.get_metadata_definitions()
+
+        for mdfn in mddefns:
+            md_keys.add(mdfn.Key)
+
+        if nshots > 0:
+            shots = scene.get_shot_ids(0, nshots)
+
+            # query shots in pipelined batches so that each stage of a batch
+            # costs about one flapi round trip instead of one per shot
+            batch_size = config.get('robot', {}).get('flapi_batch_size', 256)
+            for batch_start in range(0, nshots, batch_size):
+                batch = shots[batch_start:batch_start + batch_size]
+                print( "\r Querying Baselight metadata for shot %d of %s" % (batch_start + len(batch), nshots), end="" )
+
+                with conn.pipeline():
+                    shot_futures = [scene.get_shot(shot_inf.ShotId) for shot_inf in batch]
+                batch_shots = conn.gather(shot_futures)
+
+                with conn.pipeline():
+                    md_futures = [shot.get_metadata(md_keys) for shot in batch_shots]
+                    mark_ids_futures = [shot.get_mark_ids() for shot in batch_shots]
+                    categories_futures = [shot.get_categories() for shot in batch_shots]
+                batch_md = conn.gather(md_futures)
+                batch_mark_ids = conn.gather(mark_ids_futures)
+                batch_categories = conn.gather(categories_futures)
+
+                with conn.release_scope(batch_size):
+                    for shot in batch_shots:
+                        shot.release()
+
+                for batch_ix, shot_inf in enumerate(batch):
+                    shot_md = batch_md[batch_ix]
+                    for key in md_keys:
+                        if type(shot_md[key]) is list:
+                            for list_ix, list_inf in enumerate(shot_md[key]):
+                                shot_md[key + '.' + str(list_ix)] = list_inf
+                            # print ('%15s: %s: %s:' % (key, type(shot_md[key]), shot_md[key]))
+
+                    thumbnail_url = ''
+                    # thumbnail_url = conn.ThumbnailManager.get_poster_uri(shot, 1, {'DCSpace': 'sRGB'})
+                    # pprint (thumbnail_url)
+
+                    baselight_shots.append(
+                        {
+                            'shot_ix': batch_start + batch_ix + 1,
+                            'shot_id': shot_inf.ShotId,
+                            'mddefns': mddefns,
+                            'shot_md': shot_md,
+                            'mark_ids': batch_mark_ids[batch_ix],
+                            'categories': batch_categories[batch_ix],
+                            'thumbnail_url': thumbnail_url
+                        }
+                    )
+            print ('')
 
-            shot.release()
-        print ('')
+        '''
+        test_tc = conn.Utilities.timecode_from_string('01:00:00:00')
+        pprint (test_tc)
+        pprint (str(test_tc))
+        pprint (dir(test_tc))
+        '''
 
-    '''
-    test_tc = conn.Utilities.timecode_from_string('01:00:00:00')
-    pprint (test_tc)
-    pprint (str(test_tc))
-    pprint (dir(test_tc))
-    '''
+        '''
+        # show avaliable keys and their types
+        mddefns = scene.get_metadata_definitions()
+        for mdfn in mddefns:
+            print ('%15s: %s, %s' % (mdfn.Key, mdfn.Name, mdfn.Type))
+        cat_keys = scene.get_strip_categories()
+        pprint (cat_keys)
+        '''
+    except flapi.FLAPIException as ex:
+        log.error( "Error reading scene %s: %s" % (blpath, ex) )
+        baselight_shots = []
+    finally:
+        if own_session:
+            session.close()
 
-    '''
-    # show avaliable keys and their types
-    mddefns = scene.get_metadata_definitions()
-    for mdfn in mddefns:
-        print ('%15s: %s, %s' % (mdfn.Key, mdfn.Name, mdfn.Type))
-    cat_keys = scene.get_strip_categories()
-    pprint (cat_keys)
-    '''
+    return baselight_shots
 
-    scene.close_scene()
-    scene.release()
-    
-    fl_disconnect(config, flapi, flapi_host, conn)
+# One flapi connection and one open scene shared by all sync stages of a
+# sequence, instead of a connection and a scene open per stage.
+#
+# The scene is opened read-only on first use of get_scene() and reopened
+# writable by get_writable_scene() only when a stage has something to
+# write. Objects obtained from the read-only scene are not valid after
+# that. Metadata definitions are read once.
+#
+#   session = SceneSession(config, blpath)
+#   if session.open():
+#       try:
+#           baselight_shots = get_baselight_scene_shots(config, blpath, session)
+#           ...
+#       finally:
+#           session.close()
+
+class SceneSession(object):
+    def __init__(self, config, blpath):
+        self.config = config
+        self.log = config.get('log')
+        self.blpath = blpath
+        self.flapi = None
+        self.flapi_host = None
+        self.conn = None
+        self.scene_path = None
+        self.scene = None
+        self.writable = False
+        self.mddefns = None
+        self.opens = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+        return False
+
+    def open(self):
+        self.flapi = import_flapi(self.config)
+        self.flapi_host = resolve_flapi_host(self.config, self.blpath)
+        self.conn = fl_connect(self.config, self.flapi, self.flapi_host)
+        if not self.conn:
+            self.conn = None
+            return False
+        self.scene_path = fl_get_scene_path(self.config, self.flapi, self.conn, self.blpath)
+        if not self.scene_path:
+            self.close()
+            return False
+        return True
+
+    def scene_name(self):
+        return self.scene_path.Host + ':' + self.scene_path.Job + ':' + self.scene_path.Scene
+
+    def open_scene(self, flags):
+        try:
+            return self.conn.Scene.open_scene( self.scene_path, flags )
+        except self.flapi.FLAPIException:
+            # a scene found from a pattern may have been renamed or deleted
+            if '*' in self.blpath.split(':')[-1]:
+                get_scene_finder(self.config).forget_scene(
+                    self.scene_path.Host,
+                    self.scene_path.Job,
+                    self.scene_path.Scene
+                )
+            raise
+
+    def get_scene(self):
+        if self.scene is None:
+            self.log.verbose('Opening scene: %s' % self.scene_name())
+            self.scene = self.open_scene({ self.flapi.OPENFLAG_READ_ONLY })
+            self.writable = False
+            self.opens += 1
+        return self.scene
+
+    def get_writable_scene(self):
+        if self.scene is not None and self.writable:
+            return self.scene
+        self.close_scene()
+        self.log.verbose('Trying to open scene: %s in read-write mode' % self.scene_name())
+        self.scene = self.open_scene({ self.flapi.OPENFLAG_DISCARD })
+        self.writable = True
+        self.opens += 1
+        return self.scene
+
+    def get_metadata_definitions(self):
+        if self.mddefns is None:
+            self.mddefns = self.get_scene().get_metadata_definitions()
+        return self.mddefns
+
+    def add_metadata_definition(self, name, md_type, delta_name):
+        scene = self.get_writable_scene()
+        scene.start_delta(delta_name)
+        metadata_obj = scene.add_metadata_defn(name, md_type)
+        scene.end_delta()
+        scene.save_scene()
+        self.mddefns = None
+        return metadata_obj
 
-    return baselight_shots
+    def close_scene(self):
+        if self.scene is None:
+            return
+        scene = self.scene
+        self.scene = None
+        self.writable = False
+        try:
+            scene.close_scene()
+            scene.release()
+        except self.flapi.FLAPIException as ex:
+            self.log.error('Error closing scene %s: %s' % (self.scene_name(), ex))
+
+    def close(self):
+        if self.conn is None:
+            return
+        self.close_scene()
+        fl_disconnect(self.config, self.flapi, self.flapi_host, self.conn)
+        self.conn = None
 
 def fl_get_scene_path(config, flapi, conn, blpath):
     log = config.get('log')
@@ -813,24 +1115,20 @@ def fl_get_scene_path(config, flapi, conn, blpath):
 
         if '*' in bl_scene_name:
             # find the most recent scene
-            import re
             log.verbose('finding most recent baselight scene for pattern: %s' % blpath)
-            existing_scenes = conn.JobManager.get_scenes(bl_hostname, bl_jobname, bl_scenes_folder)
-            matched_scenes = []
-            for scene_name in existing_scenes:
-                if re.findall(bl_scene_name, scene_name):
-                    matched_scenes.append(scene_name)
+            scene_name = get_scene_finder(config).find_scene(
+                conn,
+                bl_hostname,
+                bl_jobname,
+                bl_scenes_folder,
+                bl_scene_name
+            )
 
-            if not matched_scenes:
+            if not scene_name:
                 log.verbose('no matching scenes found for: %s' % blpath)
                 return None
             else:
-                # TODO
-                # this to be changed to actually checking the most recently modified scene
-                # instead of just plain alphabetical sorting and taking the last one
-
-                scene_name = sorted(matched_scenes)[-1]
-                log.verbose('Alphabetically recent scene: %s' % scene_name)
+                log.verbose('Most recently modified scene: %s' % scene_name)
                 bl_scene_path = bl_scenes_folder + ':' + scene_name
                 blpath = bl_hostname + ':' + bl_jobname + ':' + bl_scene_path
 
@@ -850,6 +1148,8 @@ def fl_get_scene_path(config, flapi, conn, blpath):
             scene_path = conn.Scene.parse_path(blpath)
         except flapi.FLAPIException as ex:
             log.verbose('Can not parse scene: %s' % blpath)
+            if '*' in bl_scene_name:
+                get_scene_finder(config).forget(bl_hostname, bl_jobname, bl_scenes_folder)
             return None
 
         return scene_path
@@ -872,14 +1172,23 @@ def fl_connect(config, flapi, flapi_host):
     log.debug('flapi user: %s' % flapi_user)
     log.debug('flapi token: %s' % flapi_token)
 
+    flapi_health = config.get('flapi_health')
+    if flapi_health and not flapi_health.available(flapi_hostname):
+        return None
+
     log.verbose('opening flapi connection to %s' % flapi_hostname)
+    flapi_pool = config.get('flapi_pool')
     try:
-        conn = flapi.Connection(
-            flapi_hostname,
-            username=flapi_user,
-            token=flapi_token
-        )
-        conn.connect()
+        if flapi_pool:
+            conn = flapi_pool.acquire(flapi, flapi_host)
+        else:
+            conn = flapi.Connection(
+                flapi_hostname,
+                username=flapi_user,
+                token=flapi_token,
+                **flapi_connection_options(config, flapi_host)
+            )
+            conn.connect()
     except flapi.FLAPIException as e:
         log.error('Unable to open flapi connection to %s' % flapi_hostname)
         log.error(e)
@@ -888,6 +1197,17 @@ def fl_connect(config, flapi, flapi_host):
         log.error('Unable to open flapi connection to %s' % flapi_hostname)
         log.error(e)
         conn = None
+
+    if flapi_health:
+        if conn is None:
+            flapi_health.failure(flapi_hostname, 'unable to connect')
+        else:
+            flapi_health.success(flapi_hostname)
+
+    flapi_stats = config.get('flapi_stats')
+    if flapi_stats:
+        flapi_stats.attach(flapi, conn)
+
     log.verbose('connected to %s' % flapi_hostname)
     return conn
 
@@ -897,9 +1217,18 @@ def fl_disconnect(config, flapi, flapi_host, conn):
     flapi_user = flapi_host.get('flapi_user')
     flapi_token = flapi_host.get('flapi_token')
 
+    # calls that timed out or a lost connection put the host in backoff
+    flapi_health = config.get('flapi_health')
+    if flapi_health and (conn.timeouts or conn.session_lost):
+        flapi_health.failure(flapi_hostname, '%s call(s) timed out, %s reconnect(s)' % (conn.timeouts, conn.reconnects))
+
     log.verbose('closing flapi connection to %s' % flapi_hostname)
+    flapi_pool = config.get('flapi_pool')
     try:
-        conn.close()
+        if flapi_pool:
+            flapi_pool.release(conn, flapi_host)
+        else:
+            conn.close()
     except flapi.FLAPIException as e:
         log.error('Unable to close flapi connection to %s' % flapi_hostname)
         log.error(e)
@@ -917,6 +1246,10 @@ def import_flapi(config):
     try:
         if sys.path[0] != flapi_module_path:
             sys.path.insert(0, flapi_module_path)
+        # robot.json "flapi_lazy" loads flapi classes and enums on first use
+        # instead of at import, see flapi.LAZY. Only read before the first import.
+        if config.get('robot', {}).get('flapi_lazy', False):
+            os.environ.setdefault('FLAPI_LAZY', '1')
         import flapi
         return flapi
     except Exception as e:
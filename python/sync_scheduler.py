@@ -0,0 +1,145 @@
+import time
+import threading
+
+from pprint import pformat
+
+
+# Syncs independent sequences concurrently.
+#
+# A pool of robot.json "sync_workers" threads (default 4, 1 syncs one
+# sequence at a time as before) takes sequences in turn from each project,
+# so that one large project does not hold up the others. A sequence is
+# only started if its Baselight host and the Kitsu server have a free slot:
+#
+#   flapi_hosts.json  "flapi_max_concurrency"  sequences synced at once
+#                                              against one host (default 2)
+#   gazu.json         "max_concurrency"        sequences synced at once
+#                                              against Kitsu (default 4)
+#
+# Sequences of a busy host wait while others go ahead, so a cycle takes
+# about as long as its slowest host rather than the sum of all scenes.
+
+def fair_order(jobs):
+    by_project = {}
+    projects = []
+    for job in jobs:
+        project_id = job[0]
+        if project_id not in by_project:
+            by_project[project_id] = []
+            projects.append(project_id)
+        by_project[project_id].append(job)
+
+    ordered = []
+    while len(ordered) < len(jobs):
+        for project_id in projects:
+            if by_project[project_id]:
+                ordered.append(by_project[project_id].pop(0))
+    return ordered
+
+
+class SequenceScheduler(object):
+    def __init__(self, config):
+        self.config = config
+        self.log = config.get('log')
+        self.cond = threading.Condition()
+        self.active_hosts = {}
+        self.active_kitsu = 0
+        self.stats = {
+            'cycles': 0,
+            'sequences': 0,
+            'failed': 0,
+            'max_parallel': 0,
+            'last_cycle': 0
+        }
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        config_gazu = self.config.get('gazu', {})
+        return {
+            'workers': max(int(robot_config.get('sync_workers', 4)), 1),
+            'kitsu_max_concurrency': max(int(config_gazu.get('max_concurrency', 4)), 1)
+        }
+
+    def host_limit(self, hostname):
+        for flapi_host in self.config.get('flapi_hosts') or []:
+            if flapi_host.get('flapi_hostname') == hostname:
+                return max(int(flapi_host.get('flapi_max_concurrency', 2)), 1)
+        return 1
+
+    # jobs: [(project_id, flapi_hostname, sequence)], sync_fn(sequence)
+    def run(self, jobs, sync_fn):
+        settings = self.settings()
+        pending = fair_order(jobs)
+        start = time.time()
+
+        workers = min(settings['workers'], len(pending))
+        if workers <= 1:
+            for project_id, hostname, sequence in pending:
+                self.sync_one(sync_fn, sequence)
+        else:
+            threads = []
+            for ix in range(workers):
+                thread = threading.Thread(
+                    target=self.worker,
+                    args=(pending, sync_fn, settings['kitsu_max_concurrency']),
+                    name='sequence sync %d' % (ix + 1)
+                )
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
+            for thread in threads:
+                thread.join()
+
+        with self.cond:
+            self.stats['cycles'] += 1
+            self.stats['last_cycle'] = round(time.time() - start, 3)
+
+    # called with the condition held
+    def next_job(self, pending, kitsu_max_concurrency):
+        if self.active_kitsu >= kitsu_max_concurrency:
+            return None
+        for ix, job in enumerate(pending):
+            hostname = job[1]
+            if self.active_hosts.get(hostname, 0) < self.host_limit(hostname):
+                return pending.pop(ix)
+        return None
+
+    def worker(self, pending, sync_fn, kitsu_max_concurrency):
+        while True:
+            with self.cond:
+                while True:
+                    if not pending:
+                        return
+                    job = self.next_job(pending, kitsu_max_concurrency)
+                    if job is not None:
+                        break
+                    self.cond.wait()
+                project_id, hostname, sequence = job
+                self.active_hosts[hostname] = self.active_hosts.get(hostname, 0) + 1
+                self.active_kitsu += 1
+                self.stats['max_parallel'] = max(self.stats['max_parallel'], self.active_kitsu)
+
+            try:
+                self.sync_one(sync_fn, sequence)
+            finally:
+                with self.cond:
+                    self.active_hosts[hostname] -= 1
+                    self.active_kitsu -= 1
+                    self.cond.notify_all()
+
+    # a failing or slow Baselight host only affects its own sequences
+    def sync_one(self, sync_fn, sequence):
+        try:
+            sync_fn(sequence)
+            with self.cond:
+                self.stats['sequences'] += 1
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            with self.cond:
+                self.stats['failed'] += 1
+            self.log.error('exception syncing sequence %s: %s' % (sequence.get('blpath'), pformat(e)))
+
+    def get_stats(self):
+        with self.cond:
+            return dict(self.stats)
@@ -0,0 +1,201 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+
+# Local state of the Kitsu / Baselight reconciliation, kept in a SQLite
+# database so that it survives restarts of the robot.
+#
+# Per linked sequence (keyed by the Kitsu sequence id) it keeps the
+# signature of the last sync, see scene_changes.py. Per shot (keyed by the
+# Kitsu shot id) it keeps what the sync stages last saw and pushed:
+#
+#   metadata_hash     digest of the Kitsu shot data built from Baselight
+#   kitsu_updated_at  updated_at of the Kitsu shot
+#   marks_hash        digest of the Kitsu locator and the Baselight mark ids
+#   thumbnail_hash    digest of the last thumbnail uploaded to Kitsu; only
+#                     recorded for now, no stage compares against it yet
+#   robot_marks       Baselight marks added from the Kitsu locator, see marks.py
+#
+# The stages compare against it and only query and push shots that moved.
+#
+# robot.json settings:
+#
+#   sync_state        false keeps no state between cycles (default true)
+#   sync_state_db     path of the database, relative to the robot folder
+#                     (default state/sync_state.db)
+
+SHOT_FIELDS = ('bl_shot_id', 'metadata_hash', 'kitsu_updated_at', 'marks_hash', 'thumbnail_hash', 'robot_marks')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS sequences (
+    sequence_id TEXT PRIMARY KEY,
+    signature TEXT,
+    synced REAL
+);
+CREATE TABLE IF NOT EXISTS shots (
+    sequence_id TEXT,
+    shot_id TEXT,
+    bl_shot_id INTEGER,
+    metadata_hash TEXT,
+    kitsu_updated_at TEXT,
+    marks_hash TEXT,
+    thumbnail_hash TEXT,
+    robot_marks TEXT,
+    updated REAL,
+    PRIMARY KEY (sequence_id, shot_id)
+);
+'''
+
+class SyncStateStore(object):
+    def __init__(self, config):
+        self.config = config
+        self.log = config.get('log')
+        self.lock = threading.Lock()
+        self.db = None
+        self.failed = False
+        self.stats = {
+            'reads': 0,
+            'writes': 0,
+            'errors': 0
+        }
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        path = robot_config.get('sync_state_db', os.path.join('state', 'sync_state.db'))
+        if not os.path.isabs(path):
+            path = os.path.join(self.config.get('app_location', ''), path)
+        return {
+            'enabled': robot_config.get('sync_state', True),
+            'path': path
+        }
+
+    def enabled(self):
+        return self.settings()['enabled'] and not self.failed
+
+    # called with the lock held
+    def connect(self):
+        if self.db is not None:
+            return self.db
+        path = self.settings()['path']
+        folder = os.path.dirname(path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+        self.log.verbose('opening sync state database %s' % path)
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.executescript(SCHEMA)
+        # databases made by older versions lack the newer shot fields
+        columns = [row[1] for row in db.execute('PRAGMA table_info(shots)')]
+        for field in SHOT_FIELDS:
+            if field not in columns:
+                db.execute('ALTER TABLE shots ADD COLUMN %s TEXT' % field)
+        db.commit()
+        self.db = db
+        return db
+
+    # runs fn(db) in a transaction; a database that can not be opened turns
+    # the store off, so that the robot falls back to syncing everything
+    def run(self, fn, write=False):
+        if not self.enabled():
+            return None
+        with self.lock:
+            try:
+                db = self.connect()
+            except (sqlite3.Error, OSError) as e:
+                self.log.error('unable to open sync state database: %s' % e)
+                self.failed = True
+                return None
+            try:
+                with db:
+                    result = fn(db)
+                self.stats['writes' if write else 'reads'] += 1
+                return result
+            except sqlite3.Error as e:
+                self.stats['errors'] += 1
+                self.log.error('sync state database error: %s' % e)
+                return None
+
+    def get_sequence(self, sequence_id):
+        def fn(db):
+            return db.execute(
+                'SELECT signature, synced FROM sequences WHERE sequence_id = ?', (sequence_id, )
+            ).fetchone()
+        row = self.run(fn)
+        if not row:
+            return None
+        try:
+            signature = json.loads(row[0]) if row[0] else None
+        except ValueError:
+            signature = None
+        return {'signature': signature, 'synced': row[1]}
+
+    def set_sequence(self, sequence_id, signature, synced=None):
+        if synced is None:
+            synced = time.time()
+        def fn(db):
+            db.execute(
+                'INSERT OR REPLACE INTO sequences (sequence_id, signature, synced) VALUES (?, ?, ?)',
+                (sequence_id, json.dumps(signature, sort_keys=True), synced)
+            )
+        self.run(fn, write=True)
+
+    def forget_sequence(self, sequence_id, shots=False):
+        def fn(db):
+            db.execute('DELETE FROM sequences WHERE sequence_id = ?', (sequence_id, ))
+            if shots:
+                db.execute('DELETE FROM shots WHERE sequence_id = ?', (sequence_id, ))
+        self.run(fn, write=True)
+
+    def get_shots(self, sequence_id):
+        def fn(db):
+            return db.execute(
+                'SELECT shot_id, %s FROM shots WHERE sequence_id = ?' % ', '.join(SHOT_FIELDS),
+                (sequence_id, )
+            ).fetchall()
+        rows = self.run(fn) or []
+        return {row[0]: dict(zip(SHOT_FIELDS, row[1:])) for row in rows}
+
+    # updates: {shot_id: {field: value}}, fields not given are kept
+    def update_shots(self, sequence_id, updates):
+        if not updates:
+            return
+        now = time.time()
+        def fn(db):
+            for shot_id, fields in updates.items():
+                fields = {k: v for k, v in fields.items() if k in SHOT_FIELDS}
+                db.execute(
+                    'INSERT OR IGNORE INTO shots (sequence_id, shot_id, updated) VALUES (?, ?, ?)',
+                    (sequence_id, shot_id, now)
+                )
+                if not fields:
+                    continue
+                db.execute(
+                    'UPDATE shots SET %s, updated = ? WHERE sequence_id = ? AND shot_id = ?' % (
+                        ', '.join('%s = ?' % k for k in fields.keys())
+                    ),
+                    list(fields.values()) + [now, sequence_id, shot_id]
+                )
+        self.run(fn, write=True)
+
+    def close(self):
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
+
+    def get_stats(self):
+        def fn(db):
+            return (
+                db.execute('SELECT COUNT(*) FROM sequences').fetchone()[0],
+                db.execute('SELECT COUNT(*) FROM shots').fetchone()[0]
+            )
+        counts = self.run(fn)
+        with self.lock:
+            stats = dict(self.stats)
+        if counts:
+            stats['sequences'], stats['shots'] = counts
+        return stats
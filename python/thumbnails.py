@@ -0,0 +1,184 @@
+import io
+import time
+import threading
+import http.client
+from urllib.parse import urlsplit, urljoin
+from concurrent.futures import ThreadPoolExecutor
+
+from pprint import pformat
+
+from .kitsu_cache import get_kitsu_cache
+
+
+# Downloads shot thumbnails from the Baselight web server.
+#
+# ThumbnailManager.get_poster_uri() gives a URI for a graded poster frame
+# of a shot. ThumbnailFetcher downloads them from robot.json
+# "thumbnail_fetch_workers" threads (default 8), each keeping its HTTP
+# connections open between requests and sync cycles, and returns the
+# image bytes, so no stills are exported, copied or written to disk.
+#
+#   thumbnail_source         "uri" (default), or "export" for the still
+#                            export of export_shot_thumbnails()
+#   thumbnail_options        get_poster_uri() options
+#                            (default {"DCSpace": "sRGB"})
+#   thumbnail_fetch_timeout  seconds per request (default 30)
+#   thumbnail_fetch_retries  attempts after a failed request (default 2)
+
+class ThumbnailFetcher(object):
+    def __init__(self, config):
+        self.config = config
+        self.log = config.get('log')
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.executor = None
+        self.stats = {
+            'fetched': 0,
+            'failed': 0,
+            'retried': 0,
+            'bytes': 0,
+            'seconds': 0
+        }
+
+    def settings(self):
+        robot_config = self.config.get('robot', {})
+        return {
+            'source': robot_config.get('thumbnail_source', 'uri'),
+            'options': robot_config.get('thumbnail_options', {'DCSpace': 'sRGB'}),
+            'workers': max(int(robot_config.get('thumbnail_fetch_workers', 8)), 1),
+            'timeout': robot_config.get('thumbnail_fetch_timeout', 30),
+            'retries': max(int(robot_config.get('thumbnail_fetch_retries', 2)), 0)
+        }
+
+    def get_executor(self):
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.settings()['workers'],
+                    thread_name_prefix='thumbnail fetch'
+                )
+            return self.executor
+
+    # one keep-alive connection per worker thread and server
+    def connection(self, scheme, netloc, timeout):
+        connections = getattr(self.local, 'connections', None)
+        if connections is None:
+            connections = self.local.connections = {}
+        conn = connections.get((scheme, netloc))
+        if conn is None:
+            if scheme == 'https':
+                conn = http.client.HTTPSConnection(netloc, timeout=timeout)
+            else:
+                conn = http.client.HTTPConnection(netloc, timeout=timeout)
+            connections[(scheme, netloc)] = conn
+        return conn
+
+    def drop_connection(self, scheme, netloc):
+        conn = self.local.connections.pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def get(self, url):
+        settings = self.settings()
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path = path + '?' + parts.query
+
+        attempt = 0
+        while True:
+            conn = self.connection(parts.scheme, parts.netloc, settings['timeout'])
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+                data = response.read()
+                if response.status != 200:
+                    raise IOError('HTTP %s fetching %s' % (response.status, url))
+                return data
+            except (http.client.HTTPException, IOError, OSError) as e:
+                self.drop_connection(parts.scheme, parts.netloc)
+                if attempt >= settings['retries']:
+                    raise
+                attempt += 1
+                with self.lock:
+                    self.stats['retried'] += 1
+                time.sleep(0.1 * attempt)
+
+    def fetch_one(self, url):
+        try:
+            data = self.get(url)
+        except Exception as e:
+            with self.lock:
+                self.stats['failed'] += 1
+            self.log.error('unable to fetch thumbnail %s: %s' % (url, pformat(e)))
+            return None
+        with self.lock:
+            self.stats['fetched'] += 1
+            self.stats['bytes'] += len(data)
+        return data
+
+    # uris: {key: uri}, returns {key: bytes} for the ones that were fetched
+    def fetch(self, uris):
+        if not uris:
+            return {}
+        start = time.time()
+        executor = self.get_executor()
+        futures = {key: executor.submit(self.fetch_one, uri) for key, uri in uris.items()}
+        thumbnails = {}
+        for key, future in futures.items():
+            data = future.result()
+            if data:
+                thumbnails[key] = data
+        with self.lock:
+            self.stats['seconds'] += time.time() - start
+        return thumbnails
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+        stats['seconds'] = round(stats['seconds'], 3)
+        return stats
+
+
+def get_thumbnail_fetcher(config):
+    thumbnail_fetcher = config.get('thumbnail_fetcher')
+    if thumbnail_fetcher is None:
+        thumbnail_fetcher = config.setdefault('thumbnail_fetcher', ThumbnailFetcher(config))
+    return thumbnail_fetcher
+
+
+# Thumbnail URIs may be relative to the flapi server
+def resolve_thumbnail_uri(conn, uri):
+    if not uri:
+        return None
+    return urljoin('http://%s:%d/' % (conn.hostname, conn.port), uri)
+
+
+# Adds a thumbnail to the first shot task in Kitsu and makes it the main
+# preview, uploading the image bytes directly.
+def upload_shot_thumbnail(config, gazu, new_shot, file_name, data):
+    log = config.get('log')
+    kitsu_cache = get_kitsu_cache(config)
+
+    task_types = kitsu_cache.all_task_types(gazu)
+    shot_task_types = [t for t in task_types if t['for_entity'] == 'Shot']
+    shot_task_types = sorted(shot_task_types, key=lambda d: d['priority'])
+    task = gazu.task.new_task(new_shot, shot_task_types[0])
+    todo = kitsu_cache.get_task_status_by_short_name(gazu, "todo")
+    comment = gazu.task.add_comment(task, todo, "Add thumbnail")
+
+    log.verbose('Adding preview on task "%s"' % shot_task_types[0].get('name'))
+    preview_file = gazu.task.create_preview(task, comment)
+
+    # gazu.task.upload_preview_file() only takes a file path
+    path = 'pictures/preview-files/%s' % preview_file['id']
+    response = gazu.client.default_client.session.post(
+        gazu.client.get_full_url(path),
+        headers=gazu.client.make_auth_header(),
+        files={'file': (file_name, io.BytesIO(data), 'image/jpeg')}
+    )
+    gazu.client.check_status(response, path)
+
+    log.verbose('Uploading thumbnail for shot: "%s"' % new_shot.get('name'))
+    gazu.task.set_main_preview(preview_file)
+    return preview_file
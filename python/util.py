@@ -129,30 +129,19 @@ def create_uid():
     uid = ((str(uuid.uuid1()).replace('-', '')).upper())
     return uid[:3]
 
-def remote_listdir(path, user, host):
-    cmd_ls_remote = [
-            'ssh',
-            user + '@' + host,
-            'ls', '-1',
-            path
-            ]
+# These go through the shared ssh connection of remote_files.py, see
+# RemoteFiles for batched operations.
 
-    cmd_ls_remote_result = subprocess.run(cmd_ls_remote, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    cmd_ls_remote_result = cmd_ls_remote_result.stdout.decode()
-    return cmd_ls_remote_result.split('\n')[:-1]
+def remote_listdir(path, user, host):
+    from .remote_files import get_ssh_backend
+    return get_ssh_backend(user, host).listdir(path)
 
 def remote_rm(path, user, host):
-    cmd_rm_remote = [
-            'ssh',
-            user + '@' + host,
-            'rm', '-rf',
-            path
-            ]
-    cmd_ls_remote_result = subprocess.run(cmd_rm_remote, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    cmd_ls_remote_result = cmd_ls_remote_result.stdout.decode()
-    return cmd_ls_remote_result
+    from .remote_files import get_ssh_backend, quote_args
+    return get_ssh_backend(user, host).run('rm -rf -- %s' % quote_args([path]), check=False).decode()
 
 def rsync(user, host, remote_path, local_path, verbose = False):
+    from .remote_files import get_ssh_backend
 
     src_path = user + '@' + host + ':' + remote_path
     dest_path = local_path
@@ -165,9 +154,10 @@ def rsync(user, host, remote_path, local_path, verbose = False):
                 pprint (e)
 
     rsync_path = '/usr/bin/rsync'
+    ssh_command = ' '.join(['ssh'] + get_ssh_backend(user, host).options)
     if verbose:
-        cmd_rsync = rsync_path + ' -rLptvh ' + src_path + ' ' + dest_path
+        cmd_rsync = [rsync_path, '-rLptvh', '-e', ssh_command, src_path, dest_path]
     else:
-        cmd_rsync = rsync_path + ' -rLpt ' + src_path + ' ' + dest_path
-    os.system(cmd_rsync)
+        cmd_rsync = [rsync_path, '-rLpt', '-e', ssh_command, src_path, dest_path]
+    subprocess.run(cmd_rsync)
     return dest_path
\ No newline at end of file
@@ -19,6 +19,17 @@ from python.metadata_fields import set_metadata_fields
 from python.sequence import sequence_sync
 from python.util import RobotLog
 from python.baselight import baselight_process
+from python.flapi_pool import FlapiConnectionPool
+from python.flapi_stats import FlapiStats
+from python.flapi_hosts import FlapiHostHealth
+from python.scene_changes import SceneChangeDetector
+from python.sync_state import SyncStateStore
+from python.sync_scheduler import SequenceScheduler
+from python.kitsu_cache import KitsuCache
+from python.kitsu_updates import KitsuRequestPool
+from python.thumbnails import ThumbnailFetcher
+from python.remote_files import RemoteFiles
+from python.scene_discovery import SceneFinder
 
 APP_NAME = 'KitsuRobot'
 VERBOSE=True
@@ -90,6 +101,17 @@ if __name__ == "__main__":
     for key in app_data['config'].keys():
         config[key] = app_data['config'][key]
     config['log'] = log
+    config['flapi_pool'] = FlapiConnectionPool(config)
+    config['flapi_stats'] = FlapiStats(config)
+    config['flapi_health'] = FlapiHostHealth(config)
+    config['sync_state'] = SyncStateStore(config)
+    config['scene_changes'] = SceneChangeDetector(config)
+    config['sync_scheduler'] = SequenceScheduler(config)
+    config['kitsu_cache'] = KitsuCache(config)
+    config['kitsu_request_pool'] = KitsuRequestPool(config)
+    config['thumbnail_fetcher'] = ThumbnailFetcher(config)
+    config['remote_files'] = RemoteFiles(config)
+    config['scene_finder'] = SceneFinder(config)
 
     metadata_thread = threading.Thread(target=set_metadata_fields, args=(config, ))
     metadata_thread.daemon = True